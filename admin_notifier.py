@@ -0,0 +1,80 @@
+"""
+관리자 알림 묶음 전송 모듈
+한산할 때는 알림을 바로 한 건씩 보내고, 짧은 시간에 알림이 몰리면 모아서 요약 메시지 하나로 전송
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+class AdminNotificationAggregator:
+    """관리자 채널 알림 집계기 (직전 전송 후 window초 안에 들어온 알림은 요약으로 묶음)"""
+
+    def __init__(self,
+                 send_single: Callable[[Dict], Awaitable[bool]],
+                 send_digest: Callable[[List[Dict]], Awaitable[bool]],
+                 window: float = 3.0,
+                 max_batch: int = 20):
+        self.send_single = send_single
+        self.send_digest = send_digest
+        self.window = window
+        # 요약 메시지 하나에 담을 최대 알림 수 (임베드 길이 제한 대비)
+        self.max_batch = max_batch
+
+        self._pending: List[Dict] = []
+        self._last_sent = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.events = 0
+        self.messages = 0
+        self.digests = 0
+        self.failed = 0
+
+    def notify(self, event: Dict):
+        """알림 등록 (즉시 반환)"""
+        self.events += 1
+        self._pending.append(event)
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._pending:
+                # 한산하면 바로 전송, 직전 전송 직후라면 남은 시간 동안 모아서 전송
+                delay = self._last_sent + self.window - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                batch = self._pending[:self.max_batch]
+                del self._pending[:len(batch)]
+                self._last_sent = time.monotonic()
+                try:
+                    if len(batch) == 1:
+                        sent = await self.send_single(batch[0])
+                    else:
+                        sent = await self.send_digest(batch)
+                        self.digests += 1
+                except Exception as e:
+                    print(f"❌ 관리자 알림 전송 오류: {e}")
+                    sent = False
+
+                if sent:
+                    self.messages += 1
+                else:
+                    self.failed += 1
+
+    @property
+    def messages_per_event(self) -> float:
+        return self.messages / self.events if self.events else 0.0
+
+    def stats_text(self) -> str:
+        return (f"알림 {self.events}건 → 메시지 {self.messages}개 "
+                f"(요약 {self.digests}개, 실패 {self.failed}개, 알림당 {self.messages_per_event:.2f}개)")
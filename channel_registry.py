@@ -0,0 +1,77 @@
+"""
+채널 레지스트리 모듈
+설정된 채널 객체를 준비 완료 시 한 번만 조회해 보관하고, 채널 변경/삭제 이벤트로만 갱신
+"""
+
+from typing import Dict, Optional
+
+class ChannelRegistry:
+    """이름으로 조회하는 설정 채널 객체 캐시 (변경될 때마다 version 증가)"""
+
+    def __init__(self, channel_ids: Dict[str, Optional[int]]):
+        self.channel_ids = {name: channel_id for name, channel_id in channel_ids.items() if channel_id}
+        # 같은 채널을 여러 용도로 설정할 수 있으므로 ID별 이름 목록 유지
+        self._names_by_id: Dict[int, list] = {}
+        for name, channel_id in self.channel_ids.items():
+            self._names_by_id.setdefault(channel_id, []).append(name)
+
+        self._channels: Dict[str, object] = {}
+        self._client = None
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def resolve_all(self, client) -> int:
+        """모든 설정 채널을 클라이언트 캐시에서 조회 (on_ready에서 호출). 찾은 채널 수 반환"""
+        self._client = client
+        self._channels.clear()
+        for name, channel_id in self.channel_ids.items():
+            channel = client.get_channel(channel_id)
+            if channel is not None:
+                self._channels[name] = channel
+        self.version += 1
+        return len(self._channels)
+
+    def get(self, name: str):
+        """설정 채널 객체 (준비 전이거나 삭제된 채널이면 None)"""
+        channel = self._channels.get(name)
+        if channel is not None:
+            self.hits += 1
+            return channel
+
+        self.misses += 1
+        channel_id = self.channel_ids.get(name)
+        if channel_id is None or self._client is None:
+            return None
+        # 준비 이후 새로 보이게 된 채널은 한 번 더 조회해서 보관
+        channel = self._client.get_channel(channel_id)
+        if channel is not None:
+            self._channels[name] = channel
+            self.version += 1
+        return channel
+
+    def is_tracked(self, channel_id: int) -> bool:
+        return channel_id in self._names_by_id
+
+    def on_channel_update(self, channel) -> bool:
+        """채널 변경 이벤트 반영. 설정 채널이면 True"""
+        names = self._names_by_id.get(channel.id)
+        if not names:
+            return False
+        for name in names:
+            self._channels[name] = channel
+        self.version += 1
+        return True
+
+    def on_channel_delete(self, channel) -> bool:
+        """채널 삭제 이벤트 반영. 설정 채널이면 True"""
+        names = self._names_by_id.get(channel.id)
+        if not names:
+            return False
+        for name in names:
+            self._channels.pop(name, None)
+        self.version += 1
+        return True
+
+    def stats_text(self) -> str:
+        return f"{len(self._channels)}/{len(self.channel_ids)}개 연결 (조회 적중 {self.hits}회 / 미스 {self.misses}회)"
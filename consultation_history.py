@@ -0,0 +1,133 @@
+"""
+상담 기록 모듈
+번호표의 발급/시작/완료/노쇼 이벤트를 JSONL 파일에 누적 기록하고
+스트리밍 분위수 추정기로 통계를 점진적으로 유지
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+from consultation_stats import P2Quantile
+
+EVENT_ISSUED = "issued"
+EVENT_STARTED = "started"
+EVENT_COMPLETED = "completed"
+EVENT_NO_SHOW = "no_show"
+
+EVENT_TYPES = (EVENT_ISSUED, EVENT_STARTED, EVENT_COMPLETED, EVENT_NO_SHOW)
+
+class DurationStats:
+    """소요 시간 통계 (평균 + 중앙값/90분위수 스케치)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.p50 = P2Quantile(0.5)
+        self.p90 = P2Quantile(0.9)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.p50.add(seconds)
+        self.p90.add(seconds)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+class ConsultationAnalytics:
+    """이벤트 하나당 O(1)로 갱신되는 상담 통계 집계"""
+
+    def __init__(self):
+        self.event_counts = {event: 0 for event in EVENT_TYPES}
+        self.wait_by_type: Dict[str, DurationStats] = {}
+        self.service_by_type: Dict[str, DurationStats] = {}
+        self.daily_counts: Dict[str, Dict[str, int]] = {}
+        self.completed_by_hour = [0] * 24
+        # 상담이 완료된 (날짜, 시) 구간 수 - 운영 시간당 처리량 계산용
+        self.active_hours = set()
+
+    def add(self, record: Dict):
+        """이벤트 기록 하나 반영"""
+        event = record.get("event")
+        if event not in self.event_counts:
+            return
+
+        self.event_counts[event] += 1
+        consultation_type = record.get("type", "other")
+
+        day = self.daily_counts.setdefault(record.get("date", ""), {key: 0 for key in EVENT_TYPES})
+        day[event] += 1
+
+        if event == EVENT_STARTED and record.get("wait_seconds") is not None:
+            self.wait_by_type.setdefault(consultation_type, DurationStats()).add(record["wait_seconds"])
+
+        if event == EVENT_COMPLETED:
+            if record.get("service_seconds") is not None:
+                self.service_by_type.setdefault(consultation_type, DurationStats()).add(record["service_seconds"])
+            try:
+                timestamp = datetime.fromisoformat(record["timestamp"])
+                self.completed_by_hour[timestamp.hour] += 1
+                self.active_hours.add((timestamp.date().isoformat(), timestamp.hour))
+            except (KeyError, ValueError):
+                pass
+
+    def sessions_per_hour(self) -> float:
+        """운영 시간(상담이 완료된 시간대)당 평균 완료 상담 수"""
+        if not self.active_hours:
+            return 0.0
+        return self.event_counts[EVENT_COMPLETED] / len(self.active_hours)
+
+class ConsultationHistory:
+    """상담 이벤트 기록 저장소 (추가 전용 JSONL)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.analytics = ConsultationAnalytics()
+
+    def load(self):
+        """기존 기록을 한 번 읽어 통계 복원"""
+        self.analytics = ConsultationAnalytics()
+        if not os.path.exists(self.path):
+            return 0
+
+        loaded = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self.analytics.add(json.loads(line))
+                        loaded += 1
+                    except json.JSONDecodeError:
+                        continue
+        except Exception as e:
+            print(f"❌ 상담 기록 로드 실패: {e}")
+        return loaded
+
+    def record(self, event: str, ticket: Dict, **extra):
+        """번호표 이벤트 기록 추가"""
+        now = datetime.now()
+        record = {
+            "event": event,
+            "ticket_number": ticket.get("number"),
+            "user_id": ticket.get("user_id"),
+            "username": ticket.get("username"),
+            "type": ticket.get("type"),
+            "timestamp": now.isoformat(),
+            "date": now.date().isoformat()
+        }
+        record.update(extra)
+
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"❌ 상담 기록 저장 실패: {e}")
+
+        self.analytics.add(record)
+        return record
@@ -0,0 +1,222 @@
+"""
+상담 시간 통계 모듈
+상담 종류별 소요 시간을 점진적으로 학습해 예상 대기 시간을 계산
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+# 기록이 없을 때 사용할 기본 상담 시간 (초)
+DEFAULT_SERVICE_SECONDS = 15 * 60
+
+class P2Quantile:
+    """P² 알고리즘 기반 스트리밍 분위수 추정기 (관측값 저장 없이 O(1) 갱신)"""
+
+    def __init__(self, quantile: float):
+        self.p = quantile
+        self.count = 0
+        # 초기 5개 관측값 / 마커 높이
+        self.heights = []
+        # 마커 위치, 목표 위치, 목표 위치 증분
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float):
+        """관측값 추가"""
+        self.count += 1
+
+        if self.count <= 5:
+            self.heights.append(value)
+            self.heights.sort()
+            return
+
+        q = self.heights
+        n = self.positions
+
+        # 관측값이 속한 구간 찾기
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while k < 3 and value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # 중간 마커 높이 보정
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = self._linear(i, step)
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i, step):
+        q = self.heights
+        n = self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i, step):
+        q = self.heights
+        n = self.positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def value(self) -> Optional[float]:
+        """현재 분위수 추정값"""
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            index = min(len(self.heights) - 1, max(0, math.ceil(self.p * len(self.heights)) - 1))
+            return self.heights[index]
+        return self.heights[2]
+
+    def to_dict(self) -> Dict:
+        return {
+            "p": self.p,
+            "count": self.count,
+            "heights": list(self.heights),
+            "positions": list(self.positions),
+            "desired": list(self.desired)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "P2Quantile":
+        estimator = cls(data["p"])
+        estimator.count = data.get("count", 0)
+        estimator.heights = list(data.get("heights", []))
+        estimator.positions = list(data.get("positions", estimator.positions))
+        estimator.desired = list(data.get("desired", estimator.desired))
+        return estimator
+
+class ServiceTimeModel:
+    """상담 종류 하나의 소요 시간 모델 (EWMA + 중앙값/90분위수)"""
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.count = 0
+        self.ewma: Optional[float] = None
+        self.p50 = P2Quantile(0.5)
+        self.p90 = P2Quantile(0.9)
+
+    def observe(self, seconds: float):
+        """상담 소요 시간 관측값 반영"""
+        self.count += 1
+        if self.ewma is None:
+            self.ewma = seconds
+        else:
+            self.ewma = self.alpha * seconds + (1 - self.alpha) * self.ewma
+        self.p50.add(seconds)
+        self.p90.add(seconds)
+
+    def to_dict(self) -> Dict:
+        return {
+            "alpha": self.alpha,
+            "count": self.count,
+            "ewma": self.ewma,
+            "p50": self.p50.to_dict(),
+            "p90": self.p90.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ServiceTimeModel":
+        model = cls(data.get("alpha", 0.3))
+        model.count = data.get("count", 0)
+        model.ewma = data.get("ewma")
+        if "p50" in data:
+            model.p50 = P2Quantile.from_dict(data["p50"])
+        if "p90" in data:
+            model.p90 = P2Quantile.from_dict(data["p90"])
+        return model
+
+class WaitTimeEstimator:
+    """상담 종류별 소요 시간 모델을 관리하고 예상 대기 시간을 계산"""
+
+    def __init__(self, alpha: float = 0.3, default_seconds: float = DEFAULT_SERVICE_SECONDS):
+        self.alpha = alpha
+        self.default_seconds = default_seconds
+        self.models: Dict[str, ServiceTimeModel] = {}
+        # 종류 구분 없는 전체 모델 (기록이 없는 종류의 대체값)
+        self.overall = ServiceTimeModel(alpha)
+        # 모델이 바뀔 때마다 증가 (예상 대기 시간 표시 캐시 무효화용, 저장하지 않음)
+        self.updates = 0
+
+    def observe(self, consultation_type: str, seconds: float):
+        """완료된 상담의 소요 시간 반영 (O(1))"""
+        if seconds <= 0:
+            return
+        if consultation_type not in self.models:
+            self.models[consultation_type] = ServiceTimeModel(self.alpha)
+        self.models[consultation_type].observe(seconds)
+        self.overall.observe(seconds)
+        self.updates += 1
+
+    def expected_service(self, consultation_type: str) -> float:
+        """상담 종류의 예상 소요 시간 (초)"""
+        model = self.models.get(consultation_type)
+        if model and model.ewma is not None:
+            return model.ewma
+        if self.overall.ewma is not None:
+            return self.overall.ewma
+        return self.default_seconds
+
+    def estimate_wait(self, types_ahead: Iterable[str], current_type: Optional[str] = None,
+                      current_elapsed: float = 0) -> float:
+        """앞선 대기자들과 진행 중인 상담을 기준으로 예상 대기 시간 계산 (초)"""
+        total = sum(self.expected_service(consultation_type) for consultation_type in types_ahead)
+        if current_type is not None:
+            total += max(0.0, self.expected_service(current_type) - current_elapsed)
+        return total
+
+    def summary(self, consultation_type: str) -> Dict:
+        """상담 종류의 모델 요약 (표시용)"""
+        model = self.models.get(consultation_type)
+        if not model:
+            return {"count": 0, "ewma": None, "p50": None, "p90": None}
+        return {
+            "count": model.count,
+            "ewma": model.ewma,
+            "p50": model.p50.value(),
+            "p90": model.p90.value()
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "alpha": self.alpha,
+            "default_seconds": self.default_seconds,
+            "models": {key: model.to_dict() for key, model in self.models.items()},
+            "overall": self.overall.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WaitTimeEstimator":
+        estimator = cls(data.get("alpha", 0.3), data.get("default_seconds", DEFAULT_SERVICE_SECONDS))
+        estimator.models = {
+            key: ServiceTimeModel.from_dict(model)
+            for key, model in data.get("models", {}).items()
+        }
+        if "overall" in data:
+            estimator.overall = ServiceTimeModel.from_dict(data["overall"])
+        return estimator
+
+def format_wait_time(seconds: float) -> str:
+    """예상 대기 시간을 표시용 문자열로 변환"""
+    minutes = int(round(seconds / 60))
+    if minutes <= 0:
+        return "곧 차례"
+    if minutes < 60:
+        return f"약 {minutes}분"
+    return f"약 {minutes // 60}시간 {minutes % 60}분"
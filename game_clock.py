@@ -0,0 +1,156 @@
+"""
+게임 시계 모듈
+진행 중인 모든 게임을 하나의 태스크와 힙(다음 낙하 시각 기준)으로 진행시키고
+한 틱에 바뀐 게임들의 화면 갱신 요청을 묶어서 한 번에 전달 (실제 메시지 수정은 게임별 화면 전송기가 처리)
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+class ClockEntry:
+    """시계에 등록된 게임 하나"""
+
+    __slots__ = ("key", "step", "render", "deadline", "cancelled")
+
+    def __init__(self, key: Hashable,
+                 step: Callable[[float], Tuple[Optional[float], bool]],
+                 render: Callable[[], Awaitable],
+                 deadline: float):
+        self.key = key
+        self.step = step
+        self.render = render
+        self.deadline = deadline
+        self.cancelled = False
+
+class GameClock:
+    """단일 asyncio 태스크로 모든 게임의 틱을 처리하는 공유 시계
+
+    step(now)은 (다음 틱까지 남은 초 또는 None, 화면 변경 여부)를 반환하는 동기 함수.
+    None이면 시계에서 빠지고, 화면이 바뀐 게임은 render()를 틱 단위로 묶어 실행.
+    render()는 실제 메시지 수정을 기다리지 않고 게임별 화면 전송기에 요청만 넘기는 것을 전제로 함
+    """
+
+    def __init__(self, name: str = "게임"):
+        self.name = name
+        self._heap: List[tuple] = []
+        self._entries: Dict[Hashable, ClockEntry] = {}
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.ticks = 0
+        self.steps = 0
+        self.frames_requested = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+        self.cpu_total = 0.0
+        self.cpu_max = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key: Hashable, step, render, delay: float):
+        """게임 등록 (이미 있으면 다음 틱 시각만 다시 예약)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.cancelled = True
+        entry = ClockEntry(key, step, render, time.monotonic() + delay)
+        self._entries[key] = entry
+        self._push(entry)
+
+    def remove(self, key: Hashable):
+        """게임 종료 시 시계에서 제거"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.cancelled = True
+
+    def _push(self, entry: ClockEntry):
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (entry.deadline, next(self._seq), entry))
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if earliest is None or entry.deadline < earliest:
+            self._wakeup.set()
+
+    async def _run(self):
+        while self._heap:
+            deadline, _, entry = self._heap[0]
+            if entry.cancelled:
+                heapq.heappop(self._heap)
+                continue
+
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._tick()
+
+    def _tick(self):
+        """마감된 게임을 모두 진행시키고 화면 갱신 요청을 한 묶음으로 전달"""
+        now = time.monotonic()
+        started = time.process_time()
+        lag = now - self._heap[0][0]
+
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, entry = heapq.heappop(self._heap)
+            if not entry.cancelled:
+                due.append(entry)
+
+        batch = []
+        for entry in due:
+            self.steps += 1
+            try:
+                next_delay, changed = entry.step(now)
+            except Exception as e:
+                print(f"❌ {self.name} 시계 틱 오류: {e}")
+                next_delay, changed = None, False
+
+            if next_delay is None:
+                if self._entries.get(entry.key) is entry:
+                    del self._entries[entry.key]
+            else:
+                entry.deadline = now + next_delay
+                heapq.heappush(self._heap, (entry.deadline, next(self._seq), entry))
+
+            if changed:
+                batch.append(entry)
+
+        if batch:
+            self.frames_requested += len(batch)
+            asyncio.create_task(self._dispatch(batch))
+
+        cpu = time.process_time() - started
+        self.ticks += 1
+        self.lag_total += lag
+        self.lag_max = max(self.lag_max, lag)
+        self.cpu_total += cpu
+        self.cpu_max = max(self.cpu_max, cpu)
+
+    async def _dispatch(self, batch: List[ClockEntry]):
+        await asyncio.gather(*(self._render(entry) for entry in batch))
+
+    async def _render(self, entry: ClockEntry):
+        try:
+            await entry.render()
+        except Exception as e:
+            print(f"❌ {self.name} 화면 갱신 오류: {e}")
+
+    def stats_text(self) -> str:
+        ticks = max(self.ticks, 1)
+        return (
+            f"진행 중 {len(self._entries)}게임, 틱 {self.ticks}회 (게임 진행 {self.steps}회), "
+            f"지연 평균 {self.lag_total / ticks * 1000:.1f}ms / 최대 {self.lag_max * 1000:.1f}ms, "
+            f"틱당 CPU 평균 {self.cpu_total / ticks * 1000:.2f}ms / 최대 {self.cpu_max * 1000:.2f}ms, "
+            f"화면 갱신 요청 {self.frames_requested}회"
+        )
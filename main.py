@@ -6,7 +6,21 @@ import os
 import json
 from dotenv import load_dotenv
 from datetime import datetime, date
-import asyncio
+import math
+import re
+import time
+from consultation_stats import WaitTimeEstimator, format_wait_time
+from queue_scheduler import ConsultationScheduler, POLICIES, parse_head_start
+from consultation_history import ConsultationHistory, EVENT_ISSUED, EVENT_STARTED, EVENT_COMPLETED, EVENT_NO_SHOW
+from timer_scheduler import TimerScheduler
+from precall_notifier import PreCallNotifier
+from admin_notifier import AdminNotificationAggregator
+from channel_registry import ChannelRegistry
+from member_index import SCORE_SUBSTRING, MemberIndexRegistry, is_ambiguous
+from member_resolver import MemberResolver
+from voice_presence import VoicePresenceTracker
+from voice_bulk import BulkVoiceRunner
+from render_utils import CoalescingRefresher, render_differ
 
 # 환경 변수 로드
 load_dotenv()
@@ -38,6 +52,36 @@ ticket_number = 1
 waiting_queue = []
 consultation_in_progress = False
 
+# 대기열 스케줄링 정책 (fifo, round_robin, aging)
+QUEUE_POLICY = os.getenv('QUEUE_POLICY', 'fifo')
+queue_scheduler = ConsultationScheduler(
+    QUEUE_POLICY,
+    aging_head_start=parse_head_start(os.getenv('QUEUE_AGING_HEAD_START'))
+)
+
+# 대기열 변경마다 증가하는 버전 (페이지 렌더링 캐시 무효화용)
+queue_version = 0
+
+def sync_queue_order():
+    """스케줄러 처리 순서에 맞춰 대기열 정렬 (진행 중인 상담은 맨 앞 유지)"""
+    current = waiting_queue[0] if consultation_in_progress and waiting_queue else None
+    waiting_queue[:] = ([current] if current else []) + queue_scheduler.ordered()
+
+def get_waiting_tickets():
+    """진행 중인 상담을 제외한 대기 번호표 목록 (처리 순서대로)"""
+    return waiting_queue[1:] if consultation_in_progress else list(waiting_queue)
+
+def invalidate_queue_render():
+    """대기열 표시 내용이 바뀌었을 때 호출: 페이지 캐시 무효화 및 관리자 패널 갱신 요청"""
+    global queue_version
+    queue_version += 1
+    admin_panel_refresher.request()
+
+def on_queue_changed():
+    """대기열 변경 후 호출: 대기열 버전 증가, 사전 호출 알림 대상 및 관리자 패널 갱신 요청 (즉시 반환)"""
+    invalidate_queue_render()
+    precall_notifier.update(get_waiting_tickets())
+
 # 관리자 설정
 NOTIFICATION_CHANNEL_ID= int(os.getenv('NOTIFICATION_CHANNEL_ID'))
 ADMIN_CHANNEL_ID = int(os.getenv('ADMIN_CHANNEL_ID'))
@@ -47,6 +91,13 @@ CONSULTATION_VOICE_CHANNEL_IDS = {
     "project": int(os.getenv('PROJECT_VOICE_CHANNEL_ID'))
 }
 
+# 설정 채널 객체 캐시 (on_ready에서 한 번 조회, 채널 변경/삭제 이벤트로 갱신)
+channel_registry = ChannelRegistry({
+    "admin": ADMIN_CHANNEL_ID,
+    "notification": NOTIFICATION_CHANNEL_ID,
+    **CONSULTATION_VOICE_CHANNEL_IDS
+})
+
 # 환경변수 확인
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 if not DISCORD_TOKEN:
@@ -369,6 +420,195 @@ def add_survey_record(user_id, username, consultation_type, ticket_number, surve
         print(f"❌ 설문 기록 추가 실패: {e}")
         return False
 
+# ========================================
+# 상담 시간 통계 및 예상 대기 시간
+# ========================================
+
+SERVICE_TIME_MODEL_FILE = "service_time_model.json"
+
+def load_wait_time_estimator():
+    """상담 시간 모델을 파일에서 로드"""
+    try:
+        if os.path.exists(SERVICE_TIME_MODEL_FILE):
+            with open(SERVICE_TIME_MODEL_FILE, 'r', encoding='utf-8') as f:
+                return WaitTimeEstimator.from_dict(json.load(f))
+    except Exception as e:
+        print(f"❌ 상담 시간 모델 로드 실패: {e}")
+    return WaitTimeEstimator()
+
+def save_wait_time_estimator():
+    """상담 시간 모델을 파일에 저장"""
+    try:
+        with open(SERVICE_TIME_MODEL_FILE, 'w', encoding='utf-8') as f:
+            json.dump(wait_time_estimator.to_dict(), f, ensure_ascii=False, indent=2)
+        return True
+    except Exception as e:
+        print(f"❌ 상담 시간 모델 저장 실패: {e}")
+        return False
+
+wait_time_estimator = load_wait_time_estimator()
+
+# 상담 이벤트 기록 (발급/시작/완료/노쇼)
+CONSULTATION_HISTORY_FILE = "consultation_history.jsonl"
+consultation_history = ConsultationHistory(CONSULTATION_HISTORY_FILE)
+print(f"✅ 상담 기록 로드 완료: {consultation_history.load()}개 이벤트")
+
+def mark_consultation_issued(ticket):
+    """번호표 발급 기록"""
+    consultation_history.record(EVENT_ISSUED, ticket)
+
+# 직전 상담 완료 시각 (대기자가 남아 있을 때만) - 상담 사이 공백 측정용
+last_session_completed_at = None
+
+def mark_consultation_started(ticket):
+    """상담 시작 시각 기록"""
+    global last_session_completed_at
+    ticket['started_at'] = datetime.now()
+    if last_session_completed_at:
+        gap_seconds = (ticket['started_at'] - last_session_completed_at).total_seconds()
+        precall_notifier.record_gap(gap_seconds, precall_notifier.was_notified(ticket))
+        last_session_completed_at = None
+    wait_seconds = (ticket['started_at'] - ticket['timestamp']).total_seconds()
+    consultation_history.record(EVENT_STARTED, ticket, wait_seconds=wait_seconds)
+
+def mark_consultation_completed(ticket):
+    """상담 완료 시각 기록 및 상담 시간 모델 갱신"""
+    global last_session_completed_at
+    ticket['completed_at'] = datetime.now()
+    cancel_no_show_timer(ticket['number'])
+    cancel_pending_move(ticket['user_id'])
+    started_at = ticket.get('started_at')
+    if not started_at:
+        consultation_history.record(EVENT_COMPLETED, ticket, service_seconds=None)
+        return
+    
+    last_session_completed_at = ticket['completed_at'] if get_waiting_tickets() else None
+
+    service_seconds = (ticket['completed_at'] - started_at).total_seconds()
+    consultation_history.record(EVENT_COMPLETED, ticket, service_seconds=service_seconds)
+    wait_time_estimator.observe(ticket['type'], service_seconds)
+    save_wait_time_estimator()
+    print(f"⏱️ 상담 시간 기록: {ticket['number']}번 {ticket['type']} - {int(service_seconds)}초")
+
+def estimate_wait_seconds(index):
+    """대기열 index 위치 번호표의 예상 대기 시간 (초)"""
+    if consultation_in_progress and waiting_queue:
+        current = waiting_queue[0]
+        started_at = current.get('started_at')
+        elapsed = (datetime.now() - started_at).total_seconds() if started_at else 0
+        types_ahead = (ticket['type'] for ticket in waiting_queue[1:index])
+        return wait_time_estimator.estimate_wait(types_ahead, current['type'], elapsed)
+
+    types_ahead = (ticket['type'] for ticket in waiting_queue[:index])
+    return wait_time_estimator.estimate_wait(types_ahead)
+
+def estimate_wait_for_range(start, end):
+    """대기열 [start, end) 구간 번호표들의 예상 대기 시간 (앞 번호표 시간을 누적해 계산)"""
+    estimates = {}
+    running = None
+    for i in range(start, min(end, len(waiting_queue))):
+        if i == 0 and consultation_in_progress:
+            continue
+        if running is None:
+            running = estimate_wait_seconds(i)
+        else:
+            running += wait_time_estimator.expected_service(waiting_queue[i - 1]['type'])
+        estimates[i] = running
+    return estimates
+
+# ========================================
+# 멤버 이름 검색
+# ========================================
+
+# 서버별 멤버 이름 인덱스 (on_ready에서 생성, 멤버 이벤트로 갱신)
+member_indexes = MemberIndexRegistry()
+
+# 사용자 ID → 멤버/사용자 조회 (홈 서버 LRU + TTL 캐시, 최후에만 API 호출)
+member_resolver = MemberResolver(bot)
+
+# 사용자별 음성 채널 접속 현황 (on_ready에서 초기화, 음성 상태 이벤트로 갱신)
+voice_presence = VoicePresenceTracker()
+
+def get_voice_marker(ticket):
+    """번호표 보유자의 음성 채널 접속 표시"""
+    return "🎤" if voice_presence.is_in_voice(ticket['user_id']) else "🔇"
+
+def get_consultation_guild():
+    """상담 채널이 있는 서버 (멤버 조회 시 우선 확인)"""
+    for consultation_type in CONSULTATION_VOICE_CHANNEL_IDS:
+        consultation_channel = channel_registry.get(consultation_type)
+        if consultation_channel:
+            return consultation_channel.guild
+    return None
+
+# 이름이 모호할 때 관리자에게 보여줄 후보 수
+MEMBER_PICK_LIMIT = 5
+
+def search_members_by_name(guild, query, limit=MEMBER_PICK_LIMIT):
+    """이름 유사 검색 (정확 일치 > 접두사 > 부분 일치 > 오타 허용 순). [(멤버, 점수)]"""
+    if guild is None:
+        return []
+    return member_indexes.search(guild, query, limit)
+
+def find_member_by_name(guild, query):
+    """이름 유사 검색 1위 멤버 (자동완성으로 선택한 사용자 ID도 허용)"""
+    if guild is not None and query.isdigit():
+        member = guild.get_member(int(query))
+        if member is not None:
+            return member
+    
+    results = search_members_by_name(guild, query, limit=1)
+    if not results:
+        return None
+    member, score = results[0]
+    print(f"🔍 이름 검색 매치: {member.display_name} (@{member.name}, 점수 {score:.2f})")
+    return member
+
+# ========================================
+# 슬래시 명령어 자동완성 (메모리 인덱스만 사용, API 호출 없음)
+# ========================================
+
+# 디스코드 자동완성 최대 선택지 수
+AUTOCOMPLETE_LIMIT = 25
+
+def get_ticket_label(ticket):
+    return f"{ticket['number']}번 · {ticket['username']} · {get_counseling_type_label(ticket['type'])}"
+
+async def ticket_number_autocomplete(interaction: discord.Interaction, current: str):
+    """번호표 번호 자동완성: 입력한 번호로 시작하거나 이름이 포함된 번호표"""
+    key = current.strip().casefold()
+    choices = []
+    for ticket in waiting_queue:
+        if not key or str(ticket['number']).startswith(key) or key in ticket['username'].casefold():
+            choices.append(app_commands.Choice(name=get_ticket_label(ticket)[:100], value=ticket['number']))
+            if len(choices) >= AUTOCOMPLETE_LIMIT:
+                break
+    return choices
+
+async def member_name_autocomplete(interaction: discord.Interaction, current: str):
+    """사용자명 자동완성: 대기열 번호표 보유자 먼저, 이후 서버 멤버 이름 인덱스 검색 결과"""
+    key = current.strip().casefold()
+    choices = []
+    seen = set()
+    
+    for ticket in waiting_queue:
+        if ticket['user_id'] in seen:
+            continue
+        if not key or key in ticket['username'].casefold():
+            seen.add(ticket['user_id'])
+            choices.append(app_commands.Choice(
+                name=f"{ticket['username']} · {ticket['number']}번 번호표"[:100],
+                value=str(ticket['user_id'])
+            ))
+    
+    if key and interaction.guild is not None:
+        for member, _ in search_members_by_name(interaction.guild, key, limit=AUTOCOMPLETE_LIMIT):
+            if member.id not in seen:
+                seen.add(member.id)
+                choices.append(app_commands.Choice(name=f"{member.display_name} (@{member.name})"[:100], value=str(member.id)))
+    
+    return choices[:AUTOCOMPLETE_LIMIT]
+
 # ========================================
 # 음성 채널 관리 함수들
 # ========================================
@@ -381,27 +621,7 @@ async def disconnect_user_from_voice(user_id: int, interaction: discord.Interact
         
         print(f"🔇 음성 연결 끊기 시도: {user_id}")
         
-        member = None
-        
-        if interaction and interaction.guild:
-            member = interaction.guild.get_member(user_id)
-            print(f"🔍 Interaction guild에서 검색: {member is not None}")
-        
-        if not member and CONSULTATION_VOICE_CHANNEL_IDS:
-            for consultation_type, channel_id in CONSULTATION_VOICE_CHANNEL_IDS.items():
-                consultation_channel = bot.get_channel(channel_id)
-                if consultation_channel and consultation_channel.guild:
-                    member = consultation_channel.guild.get_member(user_id)
-                    if member:
-                        print(f"🔍 상담 채널 guild에서 검색: {member is not None}")
-                        break
-        
-        if not member:
-            for guild in bot.guilds:
-                member = guild.get_member(user_id)
-                if member:
-                    print(f"🔍 {guild.name}에서 사용자 발견")
-                    break
+        member = member_resolver.get_member(user_id, interaction.guild if interaction else None, get_consultation_guild())
         
         if not member:
             print(f"⚠️ 연결 끊기: 사용자를 찾을 수 없음 {user_id}")
@@ -448,11 +668,13 @@ async def move_user_to_consultation_channel(user_id: int, consultation_type: str
         
         # consultation_type이 정확히 일치하는 키를 찾아 해당 채널 ID로 이동
         print(consultation_type)
+        channel_name = consultation_type
         channel_id = CONSULTATION_VOICE_CHANNEL_IDS.get(consultation_type)
         
         if not channel_id:
             # "other" 타입의 경우 기본적으로 career 채널 사용
             if consultation_type == "other":
+                channel_name = "career"
                 channel_id = CONSULTATION_VOICE_CHANNEL_IDS.get("career")
             
             if not channel_id:
@@ -462,7 +684,7 @@ async def move_user_to_consultation_channel(user_id: int, consultation_type: str
                     await interaction.followup.send(error_msg, ephemeral=True)
                 return False
         
-        consultation_channel = bot.get_channel(channel_id)
+        consultation_channel = channel_registry.get(channel_name)
         print(consultation_channel)
         if not consultation_channel:
             error_msg = f"❌ 상담용 음성 채널을 찾을 수 없습니다: {channel_id}"
@@ -471,25 +693,10 @@ async def move_user_to_consultation_channel(user_id: int, consultation_type: str
                 await interaction.followup.send(error_msg, ephemeral=True)
             return False
         
-        member = None
-        
-        if interaction and interaction.guild:
-            member = interaction.guild.get_member(user_id)
-            print(f"🔍 Interaction guild에서 검색: {member is not None}")
-        
-        if not member and consultation_channel.guild:
-            member = consultation_channel.guild.get_member(user_id)
-            print(f"🔍 상담 채널 guild에서 검색: {member is not None}")
-        
-        if not member:
-            for guild in bot.guilds:
-                member = guild.get_member(user_id)
-                if member:
-                    print(f"🔍 {guild.name}에서 사용자 발견")
-                    break
+        member = member_resolver.get_member(user_id, interaction.guild if interaction else None, consultation_channel.guild)
         
         if not member:
-            guilds_info = [f"{guild.name}({len(guild.members)}명)" for guild in bot.guilds]
+            guilds_info = [f"{guild.name}({guild.member_count}명)" for guild in bot.guilds]
             error_msg = f"❌ 사용자를 찾을 수 없습니다: {user_id}\n서버 목록: {', '.join(guilds_info)}"
             print(error_msg)
             if interaction:
@@ -542,137 +749,661 @@ async def move_user_to_consultation_channel(user_id: int, consultation_type: str
             await interaction.followup.send(error_msg, ephemeral=True)
         return False
 
+# ========================================
+# 음성 채널 일괄 작업
+# ========================================
+
+# 일괄 연결 끊기/이동 동시 실행 수 (429 재시도 대기는 discord.py가 처리)
+VOICE_BULK_CONCURRENCY = int(os.getenv('VOICE_BULK_CONCURRENCY', '5'))
+voice_bulk_runner = BulkVoiceRunner(VOICE_BULK_CONCURRENCY)
+
+# 결과 임베드에 표시할 최대 사용자 수
+BULK_REPORT_LINES = 20
+
+MENTION_PATTERN = re.compile(r"<@!?(\d+)>")
+# 쉼표 없이 공백으로만 이어 붙인 멘션 목록
+MENTION_LIST_PATTERN = re.compile(r"(?:<@!?\d+>\s*)+")
+
+def describe_voice_error(error):
+    """음성 작업 오류를 관리자용 문구로 변환"""
+    if isinstance(error, discord.Forbidden):
+        return "권한 없음"
+    if isinstance(error, discord.NotFound):
+        return "사용자 또는 채널 없음"
+    if isinstance(error, discord.HTTPException):
+        return f"HTTP 오류 ({error.status})"
+    return str(error)
+
+def get_consultation_voice_members():
+    """상담 음성 채널에 접속 중인 멤버 목록 (캐시 조회)"""
+    members = {}
+    for consultation_type in CONSULTATION_VOICE_CHANNEL_IDS:
+        consultation_channel = channel_registry.get(consultation_type)
+        if consultation_channel:
+            for member in consultation_channel.members:
+                members.setdefault(member.id, member)
+    return list(members.values())
+
+async def bulk_disconnect_members(members):
+    """여러 멤버의 음성 연결을 병렬로 끊기"""
+    async def disconnect(member):
+        if not member.voice or not member.voice.channel:
+            return "음성 채널 미접속"
+        await member.move_to(None)
+    
+    report = await voice_bulk_runner.run([(member.id, member.display_name, member) for member in members], disconnect, describe_voice_error)
+    print(f"🔇 일괄 연결 끊기: 성공 {report.succeeded}명 / 실패 {report.failed}명 ({report.wall_seconds:.2f}초)")
+    return report
+
+async def bulk_move_members(entries):
+    """여러 멤버를 각자의 상담 종류 음성 채널로 병렬 이동. entries: [(멤버, 상담 종류)]"""
+    async def move(entry):
+        member, consultation_type = entry
+        consultation_channel = channel_registry.get(consultation_type) or channel_registry.get("career")
+        if consultation_channel is None:
+            raise LookupError("상담 채널 없음")
+        if not member.voice or not member.voice.channel:
+            raise LookupError("음성 채널 미접속")
+        if member.voice.channel.id == consultation_channel.id:
+            return "이미 상담 채널"
+        await member.move_to(consultation_channel)
+        return f"{consultation_channel.name}(으)로 이동"
+    
+    report = await voice_bulk_runner.run([(member.id, member.display_name, (member, consultation_type)) for member, consultation_type in entries], move, describe_voice_error)
+    print(f"🔊 일괄 이동: 성공 {report.succeeded}명 / 실패 {report.failed}명 ({report.wall_seconds:.2f}초)")
+    return report
+
+def build_bulk_report_embed(title, report):
+    """일괄 작업 결과 임베드 (사용자별 결과 + 소요 시간)"""
+    lines = [f"{'✅' if outcome.ok else '❌'} {outcome.label} - {outcome.detail}" for outcome in report.outcomes[:BULK_REPORT_LINES]]
+    if len(report.outcomes) > BULK_REPORT_LINES:
+        lines.append(f"... 외 {len(report.outcomes) - BULK_REPORT_LINES}명")
+    
+    embed = discord.Embed(
+        title=title,
+        description="\n".join(lines) if lines else "대상 사용자가 없습니다.",
+        color=0x00ff00 if report.failed == 0 else 0xffaa00
+    )
+    embed.add_field(name="결과", value=f"성공 {report.succeeded}명 / 실패 {report.failed}명", inline=True)
+    embed.add_field(name="소요 시간", value=f"{report.wall_seconds:.2f}초 (동시 {voice_bulk_runner.concurrency}개)", inline=True)
+    embed.timestamp = datetime.now()
+    return embed
+
+def split_bulk_targets(text):
+    """일괄 이동 입력을 쉼표로 나눔 (공백이 있는 이름 유지, 공백으로 이어진 멘션은 각각 분리)"""
+    tokens = []
+    for token in (part.strip() for part in text.split(",")):
+        if not token:
+            continue
+        if MENTION_LIST_PATTERN.fullmatch(token):
+            tokens.extend(match.group(0) for match in MENTION_PATTERN.finditer(token))
+        else:
+            tokens.append(token)
+    return tokens
+
+def resolve_bulk_target(guild, token):
+    """일괄 이동 입력 하나(멘션, 사용자 ID, 번호표 번호, 이름)를 ((멤버, 상담 종류), None) 또는 (None, 실패 사유)로 변환
+    
+    이름은 오타 허용 검색 결과나 비슷한 후보가 여럿인 경우를 받지 않음 (엉뚱한 사람 이동 방지)"""
+    match = MENTION_PATTERN.fullmatch(token)
+    ticket = None
+    member = None
+    
+    if match:
+        member = member_resolver.get_member(int(match.group(1)), guild)
+    elif token.isdigit():
+        ticket = next((ticket for ticket in waiting_queue if ticket['number'] == int(token)), None)
+        member = member_resolver.get_member(ticket['user_id'] if ticket else int(token), guild)
+    else:
+        candidates = search_members_by_name(guild, token)
+        if candidates and candidates[0][1] < SCORE_SUBSTRING:
+            return None, "정확히 일치하는 이름 없음"
+        if is_ambiguous(candidates):
+            return None, "비슷한 이름이 여러 명"
+        member = candidates[0][0] if candidates else None
+    
+    if member is None:
+        return None, "사용자 없음"
+    if ticket is None:
+        ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == member.id), None)
+    if ticket is None:
+        return None, "번호표 없음"
+    return (member, ticket['type']), None
+
 # ========================================
 # 상담 시스템 관련 함수들
 # ========================================
 
-async def send_admin_channel_notification(ticket_info):
-    """관리자 채널에 새로운 번호표 알림 전송"""
-    if not ADMIN_CHANNEL_ID: 
-        return
+# 관리자 알림 묶음 전송 간격 (초). 이 시간 안에 몰린 알림은 요약 메시지 하나로 전송
+ADMIN_NOTIFY_WINDOW = float(os.getenv('ADMIN_NOTIFY_WINDOW', '3.0'))
+
+ADMIN_EVENT_ISSUED = 'issued'
+ADMIN_EVENT_SURVEY = 'survey'
+ADMIN_EVENT_NO_SHOW = 'no_show'
+
+def build_admin_event_embed(event):
+    """관리자 알림 한 건의 임베드"""
+    kind = event['kind']
+    
+    if kind == ADMIN_EVENT_ISSUED:
+        ticket = event['ticket']
+        embed = discord.Embed(title="🆕 새로운 상담 신청", color=0x00ff88)
+        embed.add_field(name="번호", value=f"**{ticket['number']}번**", inline=True)
+        embed.add_field(name="상담 종류", value=get_counseling_type_label(ticket['type']), inline=True)
+        embed.add_field(name="신청자", value=ticket['username'], inline=True)
+        embed.add_field(name="신청 시간", value=f"<t:{int(ticket['timestamp'].timestamp())}:T>", inline=True)
+        embed.add_field(name="현재 대기", value=f"{event['queue_length']}명", inline=True)
+    
+    elif kind == ADMIN_EVENT_SURVEY:
+        if event['dm_success']:
+            embed = discord.Embed(
+                title="📝 설문 전송 완료",
+                description=f"**{event['ticket_number']}번** {event['username']}님에게 설문 링크를 전송했습니다.",
+                color=0x00ff88
+            )
+        else:
+            embed = discord.Embed(
+                title="⚠️ 설문 전송 실패",
+                description=f"**{event['ticket_number']}번** {event['username']}님에게 DM 전송에 실패했습니다.",
+                color=0xffaa00
+            )
+        embed.add_field(name="상담 정보", value=f"종류: {get_counseling_type_label(event['type'])}", inline=True)
+        if not event['dm_success']:
+            embed.add_field(name="원인", value="DM 차단 또는 권한 부족", inline=True)
+    
+    else:
+        ticket = event['ticket']
+        embed = discord.Embed(
+            title="🚫 노쇼 처리",
+            description=(
+                f"**{ticket['number']}번** {ticket['username']}님이 {NO_SHOW_GRACE_SECONDS}초 안에 음성 채널에 접속하지 않았습니다.\n"
+                f"{'대기열 맨 뒤로 이동했습니다.' if event['requeued'] else '대기열에서 제외했습니다.'}"
+            ),
+            color=0xffaa00
+        )
+        embed.add_field(name="상담 종류", value=get_counseling_type_label(ticket['type']), inline=True)
+        embed.add_field(name="남은 대기", value=f"{event['queue_length']}명", inline=True)
     
+    embed.timestamp = event['time']
+    return embed
+
+def describe_admin_event(event):
+    """요약 메시지에 들어갈 알림 한 줄"""
+    kind = event['kind']
+    time_text = f"<t:{int(event['time'].timestamp())}:T>"
+    
+    if kind == ADMIN_EVENT_ISSUED:
+        ticket = event['ticket']
+        return f"🆕 {time_text} **{ticket['number']}번** {ticket['username']} - {get_counseling_type_label(ticket['type'])} 신청"
+    if kind == ADMIN_EVENT_SURVEY:
+        result = "📝 설문 전송" if event['dm_success'] else "⚠️ 설문 DM 실패"
+        return f"{result} {time_text} **{event['ticket_number']}번** {event['username']}"
+    ticket = event['ticket']
+    action = "대기열 뒤로 이동" if event['requeued'] else "대기열에서 제외"
+    return f"🚫 {time_text} **{ticket['number']}번** {ticket['username']} 노쇼 - {action}"
+
+async def send_admin_event(event):
+    """관리자 알림 한 건 전송"""
+    admin_channel = channel_registry.get('admin')
+    if not admin_channel:
+        return False
+    await admin_channel.send(embed=build_admin_event_embed(event))
+    return True
+
+async def send_admin_event_digest(events):
+    """몰린 관리자 알림을 요약 메시지 하나로 전송"""
+    admin_channel = channel_registry.get('admin')
+    if not admin_channel:
+        return False
+    
+    embed = discord.Embed(
+        title=f"📬 관리자 알림 요약 ({len(events)}건)",
+        description="\n".join(describe_admin_event(event) for event in events),
+        color=0x00ff88
+    )
+    issued = sum(1 for event in events if event['kind'] == ADMIN_EVENT_ISSUED)
+    if issued:
+        embed.add_field(name="신규 신청", value=f"{issued}건", inline=True)
+    embed.add_field(name="현재 대기", value=f"{len(get_waiting_tickets())}명", inline=True)
+    embed.timestamp = datetime.now()
+    
+    await admin_channel.send(embed=embed)
+    return True
+
+admin_notifier = AdminNotificationAggregator(send_admin_event, send_admin_event_digest, window=ADMIN_NOTIFY_WINDOW)
+
+def notify_admin(kind, **data):
+    """관리자 채널 알림 등록 (몰리면 요약으로 묶어서 전송)"""
+    if not ADMIN_CHANNEL_ID:
+        return
+    admin_notifier.notify({'kind': kind, 'time': datetime.now(), **data})
+
+# 관리자 패널 메시지 위치 (재시작 후에도 같은 메시지를 수정)
+ADMIN_PANEL_STATE_FILE = "admin_panel_state.json"
+
+def load_admin_panel_message_id():
+    """저장된 관리자 패널 메시지 ID 로드"""
     try:
+        if os.path.exists(ADMIN_PANEL_STATE_FILE):
+            with open(ADMIN_PANEL_STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+                if state.get("channel_id") == ADMIN_CHANNEL_ID:
+                    return state.get("message_id")
+    except Exception as e:
+        print(f"❌ 관리자 패널 상태 로드 실패: {e}")
+    return None
+
+def save_admin_panel_message_id(message_id):
+    """관리자 패널 메시지 ID 저장"""
+    global admin_panel_message_id
+    admin_panel_message_id = message_id
+    try:
+        with open(ADMIN_PANEL_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"channel_id": ADMIN_CHANNEL_ID, "message_id": message_id}, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"❌ 관리자 패널 상태 저장 실패: {e}")
+
+admin_panel_message_id = load_admin_panel_message_id()
+
+# ========================================
+# 대기열 페이지 렌더링
+# ========================================
+
+QUEUE_PAGE_SIZE = 10
+
+# 현재 대기열/채널 버전의 페이지 임베드 캐시 {(종류, 페이지): 임베드}
+queue_page_cache = {}
+queue_page_cache_version = -1
+
+# 예상 대기 시간은 진행 중인 상담의 경과 시간에 따라 바뀌므로 이 간격(초)마다 페이지를 다시 생성
+QUEUE_PAGE_ESTIMATE_BUCKET = 30
+
+# 관리자 패널에 현재 표시 중인 페이지
+admin_panel_page = 0
+
+def get_queue_page_count():
+    """대기열 페이지 수"""
+    return max(1, math.ceil(len(waiting_queue) / QUEUE_PAGE_SIZE))
+
+def clamp_queue_page(page):
+    return min(max(page, 0), get_queue_page_count() - 1)
+
+def get_cached_queue_page(kind, page, builder):
+    """현재 대기열 버전에서 페이지 임베드를 한 번만 렌더링 (예상 대기 시간 모델 변경/시간 경과도 반영)"""
+    global queue_page_cache_version
+    version = (
+        queue_version,
+        channel_registry.version,
+        wait_time_estimator.updates,
+        int(time.monotonic() // QUEUE_PAGE_ESTIMATE_BUCKET)
+    )
+    if queue_page_cache_version != version:
+        queue_page_cache.clear()
+        queue_page_cache_version = version
+    
+    key = (kind, page)
+    if key not in queue_page_cache:
+        queue_page_cache[key] = builder(page)
+    return queue_page_cache[key]
+
+# 관리자 패널 음성 채널 구간 (채널 레지스트리 버전이 바뀔 때만 다시 생성)
+voice_section_cache = (-1, "")
+
+def get_voice_channel_section():
+    """관리자 패널의 상담 음성 채널 목록 문구"""
+    global voice_section_cache
+    if voice_section_cache[0] != channel_registry.version:
+        voice_info_parts = []
+        for consultation_type in CONSULTATION_VOICE_CHANNEL_IDS:
+            consultation_channel = channel_registry.get(consultation_type)
+            if consultation_channel:
+                type_label = get_counseling_type_label(consultation_type)
+                voice_info_parts.append(f"{type_label}: {consultation_channel.mention}")
+        voice_section_cache = (channel_registry.version, "\n".join(voice_info_parts))
+    return voice_section_cache[1]
+
+def get_page_footer(page, text):
+    """페이지 정보가 포함된 푸터 문구"""
+    if get_queue_page_count() > 1:
+        return f"페이지 {page + 1}/{get_queue_page_count()} · {text}"
+    return text
+
+PAGE_FOOTER_PATTERN = re.compile(r"페이지 (\d+)/\d+")
+
+def get_message_page(message):
+    """메시지 임베드 푸터에서 현재 페이지 읽기 (재시작 후에도 메시지 기준으로 동작)"""
+    if message is None or not message.embeds:
+        return 0
+    footer = message.embeds[0].footer.text or ""
+    match = PAGE_FOOTER_PATTERN.search(footer)
+    return int(match.group(1)) - 1 if match else 0
+
+def build_admin_panel_embed(page=0):
+    """관리자 패널 임베드 생성 (현재 페이지 구간만 렌더링)"""
+    if waiting_queue:
+        start = page * QUEUE_PAGE_SIZE
+        end = start + QUEUE_PAGE_SIZE
+        estimates = estimate_wait_for_range(start, end)
+        queue_text = []
+        for i, ticket in enumerate(waiting_queue[start:end], start):
+            if i == 0 and consultation_in_progress:
+                status = "🔴 상담 중"
+            elif i == 0:
+                status = "🟢 다음 순서"
+            else:
+                status = "🟡 대기 중"
+            
+            line = (
+                f"{status} **{ticket['number']}번** | "
+                f"{get_counseling_type_label(ticket['type'])} | "
+                f"{get_voice_marker(ticket)} {ticket['username']}"
+            )
+            if i in estimates:
+                line += f" | ⏳ {format_wait_time(estimates[i])}"
+            queue_text.append(line)
+        
         embed = discord.Embed(
-            title="🆕 새로운 상담 신청",
-            color=0x00ff88
+            title="🎛️ 관리자 패널",
+            description="\n".join(queue_text),
+            color=0x5865f2
+        )
+
+        if waiting_queue:
+            if consultation_in_progress:
+                if len(waiting_queue) > 1:
+                    next_number = f"{waiting_queue[1]['number']}번"
+                else:
+                    next_number = "없음"
+            else:
+                next_number = f"{waiting_queue[0]['number']}번"
+            status_text = f"총 대기: **{len(waiting_queue) - 1 if consultation_in_progress else len(waiting_queue)}명**\n다음 번호: **{next_number}**"
+        else:
+            status_text = f"총 대기: **0명**\n다음 번호: **없음**"
+        if consultation_in_progress and waiting_queue:
+            status_text += f"\n🔴 현재 **{waiting_queue[0]['number']}번** 상담 진행 중"
+        status_text += f"\n⏳ 신규 신청 예상 대기: **{format_wait_time(estimate_wait_seconds(len(waiting_queue)))}**"
+        status_text += f"\n📐 대기열 정책: **{POLICIES[queue_scheduler.policy]}**"
+        waiting = get_waiting_tickets()
+        in_voice = sum(1 for ticket in waiting if voice_presence.is_in_voice(ticket['user_id']))
+        status_text += f"\n🎤 음성 채널 접속 대기자: **{in_voice}/{len(waiting)}명**"
+        
+        embed.add_field(
+            name="📊 현황",
+            value=status_text,
+            inline=False
         )
-        embed.add_field(name="번호", value=f"**{ticket_info['number']}번**", inline=True)
-        embed.add_field(name="상담 종류", value=get_counseling_type_label(ticket_info['type']), inline=True)
-        embed.add_field(name="신청자", value=ticket_info['username'], inline=True)
-        embed.add_field(name="신청 시간", value=f"<t:{int(ticket_info['timestamp'].timestamp())}:T>", inline=False)
         
-        admin_channel = bot.get_channel(ADMIN_CHANNEL_ID)
-        if admin_channel:
-            await admin_channel.send(embed=embed)
+        # 상담 채널 정보 표시
+        voice_section = get_voice_channel_section()
+        if voice_section:
+            embed.add_field(name="🔊 음성 채널", value=voice_section, inline=False)
+
+        embed.timestamp = datetime.now()
+        embed.set_footer(text=get_page_footer(page, "버튼을 클릭하여 대기열을 관리하세요"))
+    else:
+        embed = discord.Embed(
+            title="🎛️ 관리자 패널",
+            description="현재 대기 중인 상담이 없습니다.",
+            color=0x95a5a6
+        )
+        embed.add_field(
+            name="📊 현황",
+            value=f"총 대기: **0명**",
+            inline=False
+        )
+        
+        # 상담 채널 정보 표시
+        voice_section = get_voice_channel_section()
+        if voice_section:
+            embed.add_field(name="🔊 음성 채널", value=voice_section, inline=False)
+        
+        embed.timestamp = datetime.now()
     
-    except Exception as e:
-        print(f"❌ 관리자 채널 알림 전송 실패: {e}")
+    return embed
 
-async def update_admin_panel():
-    """관리자 패널 업데이트"""
+async def update_admin_panel(recreate=False):
+    """관리자 패널 업데이트 (기존 메시지 수정, 없으면 새로 생성)"""
     if not ADMIN_CHANNEL_ID: 
         return
     
     try:
-        admin_channel = bot.get_channel(int(ADMIN_CHANNEL_ID))
+        admin_channel = channel_registry.get('admin')
         if not admin_channel:
             return
         
-        # 기존 관리자 패널 메시지 찾기
-        async for message in admin_channel.history(limit=50):
-            if (message.author == bot.user and 
-                message.embeds and 
-                "관리자 패널" in message.embeds[0].title):
-                await message.delete()
-                break
+        global admin_panel_page
+        admin_panel_page = clamp_queue_page(admin_panel_page)
+        embed = get_cached_queue_page('admin', admin_panel_page, build_admin_panel_embed)
+        view = AdminPanelView(consultation_in_progress)
         
-        # 새로운 관리자 패널 생성
-        if waiting_queue:
-            queue_text = []
-            for i, ticket in enumerate(waiting_queue[:10]):
-                if i == 0 and consultation_in_progress:
-                    status = "🔴 상담 중"
-                elif i == 0:
-                    status = "🟢 다음 순서"
-                else:
-                    status = "🟡 대기 중"
-                
-                queue_text.append(
-                    f"{status} **{ticket['number']}번** | "
-                    f"{get_counseling_type_label(ticket['type'])} | "
-                    f"{ticket['username']}"
-                )
-            
-            embed = discord.Embed(
-                title="🎛️ 관리자 패널",
-                description="\n".join(queue_text),
-                color=0x5865f2
-            )
-
-            if waiting_queue:
-                if consultation_in_progress:
-                    if len(waiting_queue) > 1:
-                        next_number = f"{waiting_queue[1]['number']}번"
-                    else:
-                        next_number = "없음"
+        if admin_panel_message_id:
+            render_key = ('admin_panel', admin_panel_message_id)
+            panel_message = admin_channel.get_partial_message(admin_panel_message_id)
+            try:
+                if recreate:
+                    render_differ.forget(render_key)
+                    await panel_message.delete()
                 else:
-                    next_number = f"{waiting_queue[0]['number']}번"
-                status_text = f"총 대기: **{len(waiting_queue) - 1 if consultation_in_progress else len(waiting_queue)}명**\n다음 번호: **{next_number}**"
-            else:
-                status_text = f"총 대기: **0명**\n다음 번호: **없음**"
-            if consultation_in_progress and waiting_queue:
-                status_text += f"\n🔴 현재 **{waiting_queue[0]['number']}번** 상담 진행 중"
-            
-            embed.add_field(
-                name="📊 현황",
-                value=status_text,
-                inline=False
-            )
-            
-            # 상담 채널 정보 표시
-            voice_info_parts = []
-            for consultation_type, channel_id in CONSULTATION_VOICE_CHANNEL_IDS.items():
-                consultation_channel = bot.get_channel(channel_id)
-                if consultation_channel:
-                    type_label = get_counseling_type_label(consultation_type)
-                    voice_info_parts.append(f"{type_label}: {consultation_channel.mention}")
-            
-            if voice_info_parts:
-                embed.add_field(name="🔊 음성 채널", value="\n".join(voice_info_parts), inline=False)
-
-            embed.timestamp = datetime.now()
-            embed.set_footer(text="버튼을 클릭하여 대기열을 관리하세요")
-        else:
-            embed = discord.Embed(
-                title="🎛️ 관리자 패널",
-                description="현재 대기 중인 상담이 없습니다.",
-                color=0x95a5a6
-            )
-            embed.add_field(
-                name="📊 현황",
-                value=f"총 대기: **0명**",
-                inline=False
-            )
-            
-            # 상담 채널 정보 표시
-            voice_info_parts = []
-            for consultation_type, channel_id in CONSULTATION_VOICE_CHANNEL_IDS.items():
-                consultation_channel = bot.get_channel(channel_id)
-                if consultation_channel:
-                    type_label = get_counseling_type_label(consultation_type)
-                    voice_info_parts.append(f"{type_label}: {consultation_channel.mention}")
-            
-            if voice_info_parts:
-                embed.add_field(name="🔊 음성 채널", value="\n".join(voice_info_parts), inline=False)
-            
-            embed.timestamp = datetime.now()
-        
-        view = AdminPanelView(consultation_in_progress)
-        await admin_channel.send(embed=embed, view=view)
+                    # 표시 내용이 바뀌지 않았으면 수정 생략
+                    if render_differ.changed(render_key, embed, view):
+                        await panel_message.edit(embed=embed, view=view)
+                    return
+            except discord.NotFound:
+                render_differ.forget(render_key)
+                print("ℹ️ 기존 관리자 패널 메시지가 없어 새로 생성합니다.")
+        
+        message = await admin_channel.send(embed=embed, view=view)
+        save_admin_panel_message_id(message.id)
+        render_differ.changed(('admin_panel', message.id), embed, view)
         
     except Exception as e:
+        if admin_panel_message_id:
+            render_differ.forget(('admin_panel', admin_panel_message_id))
         print(f"❌ 관리자 패널 업데이트 실패: {e}")
 
+# 관리자 패널 갱신 요청을 모아서 최소 간격마다 한 번만 렌더링
+ADMIN_PANEL_REFRESH_INTERVAL = float(os.getenv('ADMIN_PANEL_REFRESH_INTERVAL', '2.0'))
+admin_panel_refresher = CoalescingRefresher(update_admin_panel, ADMIN_PANEL_REFRESH_INTERVAL, name="관리자 패널")
+
+# ========================================
+# 상담 호출 및 노쇼 처리
+# ========================================
+
+# 호출된 사용자가 음성 채널에 접속하지 않았을 때의 대기 시간과 처리 방식
+NO_SHOW_GRACE_SECONDS = int(os.getenv('NO_SHOW_GRACE_SECONDS', '120'))
+NO_SHOW_POLICY = os.getenv('NO_SHOW_POLICY', 'requeue')  # requeue: 대기열 맨 뒤로, drop: 대기열에서 제거
+NO_SHOW_MAX_REQUEUE = int(os.getenv('NO_SHOW_MAX_REQUEUE', '1'))
+# 뒤로 보낸 번호표가 바로 다음 차례일 때(다른 대기자가 없을 때) 다시 호출하기 전 대기 시간(초)
+NO_SHOW_RECALL_DELAY = int(os.getenv('NO_SHOW_RECALL_DELAY', '60'))
+
+# 모든 대기열 타이머는 하나의 스케줄러에서 처리
+queue_timers = TimerScheduler("대기열")
+no_show_timers = {}
+no_show_recall_timer = None
+
+def is_user_in_voice(user_id):
+    """사용자가 상담 서버의 음성 채널에 접속해 있는지 확인 (접속 현황 테이블 조회, API 호출 없음)"""
+    guild = get_consultation_guild()
+    return voice_presence.is_in_voice(user_id, guild.id if guild else None)
+
+def cancel_no_show_timer(ticket_number):
+    """번호표의 노쇼 타이머 취소"""
+    handle = no_show_timers.pop(ticket_number, None)
+    if handle:
+        handle.cancel()
+
+# 호출된 사용자가 음성 채널에 들어오면 상담 채널로 자동 이동 (사용자 ID → (번호표, 만료 타이머))
+AUTO_MOVE_TIMEOUT = int(os.getenv('AUTO_MOVE_TIMEOUT', str(NO_SHOW_GRACE_SECONDS)))
+pending_moves = {}
+
+def arm_pending_move(ticket):
+    """호출된 번호표의 자동 이동 예약 (만료 시각은 대기열 타이머에서 처리)"""
+    cancel_pending_move(ticket['user_id'])
+    handle = queue_timers.call_later(AUTO_MOVE_TIMEOUT, expire_pending_move, ticket['user_id'], ticket['number'])
+    pending_moves[ticket['user_id']] = (ticket, handle)
+
+def cancel_pending_move(user_id):
+    """자동 이동 예약 취소"""
+    entry = pending_moves.pop(user_id, None)
+    if entry:
+        entry[1].cancel()
+
+def expire_pending_move(user_id, number):
+    entry = pending_moves.get(user_id)
+    if entry and entry[0]['number'] == number:
+        del pending_moves[user_id]
+        print(f"⌛ {number}번 자동 이동 예약 만료")
+
+async def run_pending_move(member):
+    """음성 채널에 들어온 사용자의 자동 이동 예약 실행"""
+    # 다른 서버의 음성 채널 접속은 이동할 수 없으므로 예약 유지
+    guild = get_consultation_guild()
+    if guild is not None and member.guild.id != guild.id:
+        return
+    
+    entry = pending_moves.pop(member.id, None)
+    if not entry:
+        return
+    ticket, handle = entry
+    handle.cancel()
+    
+    # 그사이 상담이 끝났거나 다른 번호로 넘어간 경우 무시
+    if not (consultation_in_progress and waiting_queue and waiting_queue[0] is ticket):
+        return
+    
+    print(f"🚶 {ticket['number']}번 {ticket['username']}님 음성 채널 접속 - 상담 채널로 자동 이동")
+    if await move_user_to_consultation_channel(member.id, ticket['type']):
+        cancel_no_show_timer(ticket['number'])
+    else:
+        # 이동 실패 시 노쇼 타이머를 그대로 두어 상담이 멈추지 않도록 처리
+        print(f"⚠️ {ticket['number']}번 자동 이동 실패 - 노쇼 타이머 유지")
+
+def get_no_show_policy_text(ticket):
+    """노쇼 시 적용될 처리 방식 설명"""
+    if NO_SHOW_POLICY == 'requeue' and ticket.get('no_show_count', 0) < NO_SHOW_MAX_REQUEUE:
+        return "대기열 맨 뒤로 이동 후 다음 번호를 호출합니다"
+    return "대기열에서 제외 후 다음 번호를 호출합니다"
+
+async def start_next_consultation(interaction: discord.Interaction = None):
+    """다음 번호표 상담 시작 (음성 채널 미접속 시 노쇼 타이머 설정)"""
+    global consultation_in_progress
+    
+    next_ticket = queue_scheduler.pop()
+    if not next_ticket:
+        return None
+    
+    # 관리자가 먼저 상담을 시작하면 예약된 노쇼 재호출은 취소
+    cancel_no_show_recall()
+    
+    sync_queue_order()
+    waiting_queue.insert(0, next_ticket)
+    consultation_in_progress = True
+    mark_consultation_started(next_ticket)
+    
+    in_voice = is_user_in_voice(next_ticket['user_id'])
+    
+    embed = discord.Embed(
+        title="▶️ 상담 시작",
+        description=f"**{next_ticket['number']}번** 상담을 시작합니다.",
+        color=0x00ff00
+    )
+    embed.add_field(name="상담 종류", value=get_counseling_type_label(next_ticket['type']), inline=True)
+    embed.add_field(name="상담자", value=next_ticket['username'], inline=True)
+    if not in_voice:
+        deadline = int(datetime.now().timestamp()) + NO_SHOW_GRACE_SECONDS
+        embed.add_field(
+            name="⏳ 음성 채널 미접속",
+            value=(
+                f"음성 채널에 접속하면 상담 채널로 자동 이동합니다.\n"
+                f"<t:{deadline}:R>까지 접속하지 않으면 {get_no_show_policy_text(next_ticket)}."
+            ),
+            inline=False
+        )
+    embed.timestamp = datetime.now()
+    
+    if interaction:
+        await interaction.response.send_message(embed=embed)
+    else:
+        admin_channel = channel_registry.get('admin')
+        if admin_channel:
+            await admin_channel.send(embed=embed)
+    
+    if in_voice:
+        await move_user_to_consultation_channel(next_ticket['user_id'], next_ticket['type'], interaction)
+    else:
+        arm_pending_move(next_ticket)
+        no_show_timers[next_ticket['number']] = queue_timers.call_later(
+            NO_SHOW_GRACE_SECONDS, handle_no_show, next_ticket['number']
+        )
+        print(f"⏳ {next_ticket['number']}번 음성 채널 미접속 - {NO_SHOW_GRACE_SECONDS}초 노쇼 타이머 설정")
+    
+    return next_ticket
+
+async def handle_no_show(ticket_number):
+    """노쇼 타이머 만료 처리: 대기열 뒤로 보내거나 제외하고 다음 번호 호출"""
+    global consultation_in_progress
+    
+    no_show_timers.pop(ticket_number, None)
+    if not (consultation_in_progress and waiting_queue and waiting_queue[0]['number'] == ticket_number):
+        return
+    
+    ticket = waiting_queue[0]
+    cancel_pending_move(ticket['user_id'])
+    
+    # 마감 직전에 접속한 경우 그대로 상담 진행 (이동에 실패하면 노쇼 처리)
+    if is_user_in_voice(ticket['user_id']):
+        if await move_user_to_consultation_channel(ticket['user_id'], ticket['type']):
+            return
+        # 이동을 기다리는 사이 상담이 완료/변경되었으면 중단
+        if not (consultation_in_progress and waiting_queue and waiting_queue[0] is ticket):
+            return
+    
+    requeue = NO_SHOW_POLICY == 'requeue' and ticket.get('no_show_count', 0) < NO_SHOW_MAX_REQUEUE
+    
+    waiting_queue.pop(0)
+    consultation_in_progress = False
+    ticket.pop('started_at', None)
+    ticket['no_show_count'] = ticket.get('no_show_count', 0) + 1
+    consultation_history.record(EVENT_NO_SHOW, ticket, requeued=requeue, no_show_count=ticket['no_show_count'])
+    
+    if requeue:
+        queue_scheduler.push_back(ticket)
+    sync_queue_order()
+    
+    print(f"🚫 {ticket_number}번 노쇼 처리 ({'대기열 뒤로 이동' if requeue else '대기열에서 제외'})")
+    
+    notify_admin(ADMIN_EVENT_NO_SHOW, ticket=ticket, requeued=requeue, queue_length=len(waiting_queue))
+    
+    if waiting_queue:
+        if requeue and len(queue_scheduler) == 1:
+            # 방금 뒤로 보낸 번호표만 남았으면 바로 다시 부르지 않고 잠시 뒤 호출
+            schedule_no_show_recall(ticket_number)
+        else:
+            await start_next_consultation()
+    
+    on_queue_changed()
+
+def schedule_no_show_recall(ticket_number):
+    """노쇼로 뒤로 보낸 번호표를 NO_SHOW_RECALL_DELAY초 뒤 다시 호출하도록 예약"""
+    global no_show_recall_timer
+    cancel_no_show_recall()
+    no_show_recall_timer = queue_timers.call_later(NO_SHOW_RECALL_DELAY, recall_after_no_show)
+    print(f"⏳ {ticket_number}번 외 대기자가 없어 {NO_SHOW_RECALL_DELAY}초 뒤 다시 호출합니다")
+
+def cancel_no_show_recall():
+    global no_show_recall_timer
+    if no_show_recall_timer:
+        no_show_recall_timer.cancel()
+        no_show_recall_timer = None
+
+async def recall_after_no_show():
+    """예약된 재호출 실행 (그사이 관리자가 상담을 시작했으면 무시)"""
+    global no_show_recall_timer
+    no_show_recall_timer = None
+    if not consultation_in_progress and waiting_queue:
+        await start_next_consultation()
+        on_queue_changed()
+
 def get_counseling_type_label(type_value):
     """상담 종류 값에 해당하는 라벨 반환"""
     type_info = next((ct for ct in counseling_types if ct["value"] == type_value), None)
@@ -692,9 +1423,7 @@ async def check_admin_permission(interaction: discord.Interaction):
 async def send_survey_dm(user_id: int, username: str, consultation_type: str, ticket_number: int):
     """상담 완료 후 설문 링크를 DM으로 전송"""
     try:
-        user = bot.get_user(user_id)
-        if not user:
-            user = await bot.fetch_user(user_id)
+        user = await member_resolver.fetch_user(user_id, get_consultation_guild())
         
         if not user:
             print(f"❌ 사용자를 찾을 수 없음: {user_id}")
@@ -765,71 +1494,175 @@ async def send_survey_dm(user_id: int, username: str, consultation_type: str, ti
         print(f"❌ 설문 DM 전송 중 오류: {e}")
         return False
 
-async def send_survey_notification_to_admin(username: str, consultation_type: str, ticket_number: int, dm_success: bool):
+def send_survey_notification_to_admin(username: str, consultation_type: str, ticket_number: int, dm_success: bool):
     """관리자 채널에 설문 전송 결과 알림"""
-    if not ADMIN_CHANNEL_ID:
-        return
+    notify_admin(
+        ADMIN_EVENT_SURVEY,
+        username=username,
+        type=consultation_type,
+        ticket_number=ticket_number,
+        dm_success=dm_success
+    )
+
+completion_followup_tasks = set()
+
+async def finish_completed_consultation(completed_ticket, interaction: discord.Interaction = None):
+    """상담 완료 후속 처리: 음성 연결 끊기, 설문 DM 전송, 관리자 알림"""
+    await disconnect_user_from_voice(completed_ticket['user_id'], interaction)
     
+    dm_success = await send_survey_dm(
+        completed_ticket['user_id'], 
+        completed_ticket['username'], 
+        completed_ticket['type'], 
+        completed_ticket['number']
+    )
+    
+    send_survey_notification_to_admin(
+        completed_ticket['username'],
+        completed_ticket['type'],
+        completed_ticket['number'],
+        dm_success
+    )
+
+def schedule_completion_followup(completed_ticket, interaction: discord.Interaction = None):
+    """완료한 관리자의 응답을 막지 않도록 후속 처리를 백그라운드에서 실행"""
+    task = bot.loop.create_task(finish_completed_consultation(completed_ticket, interaction))
+    completion_followup_tasks.add(task)
+    task.add_done_callback(completion_followup_tasks.discard)
+
+# ========================================
+# 사전 호출 알림 ("곧 차례입니다")
+# ========================================
+
+# 앞에서 몇 번째 대기자까지 미리 알릴지 (0이면 비활성화)
+PRECALL_LEAD = int(os.getenv('PRECALL_LEAD', '2'))
+
+async def send_precall_dm(ticket, position):
+    """대기 순서가 가까워진 사용자에게 DM 알림"""
     try:
-        admin_channel = bot.get_channel(ADMIN_CHANNEL_ID)
-        if not admin_channel:
-            return
-        
-        if dm_success:
-            embed = discord.Embed(
-                title="📝 설문 전송 완료",
-                description=f"**{ticket_number}번** {username}님에게 설문 링크를 전송했습니다.",
-                color=0x00ff88
-            )
-        else:
-            embed = discord.Embed(
-                title="⚠️ 설문 전송 실패",
-                description=f"**{ticket_number}번** {username}님에게 DM 전송에 실패했습니다.",
-                color=0xffaa00
-            )
-        
-        embed.add_field(
-            name="상담 정보",
-            value=f"종류: {get_counseling_type_label(consultation_type)}",
-            inline=True
-        )
-        
-        if not dm_success:
-            embed.add_field(
-                name="원인",
-                value="DM 차단 또는 권한 부족",
-                inline=True
-            )
+        user = await member_resolver.fetch_user(ticket['user_id'], get_consultation_guild())
         
+        embed = discord.Embed(
+            title="🔔 곧 상담 차례입니다",
+            description=(
+                f"**{ticket['number']}번** 번호표의 상담 순서가 가까워졌습니다.\n"
+                f"현재 **{position}번째** 순서입니다. 음성 채널에 접속해 대기해주세요!"
+            ),
+            color=0xffcc00
+        )
+        embed.add_field(name="상담 종류", value=get_counseling_type_label(ticket['type']), inline=True)
+        try:
+            embed.add_field(name="예상 대기", value=format_wait_time(estimate_wait_seconds(waiting_queue.index(ticket))), inline=True)
+        except ValueError:
+            pass
         embed.timestamp = datetime.now()
         
-        await admin_channel.send(embed=embed)
-        
-    except Exception as e:
-        print(f"❌ 관리자 설문 알림 전송 실패: {e}")
+        await user.send(embed=embed)
+        print(f"🔔 사전 호출 DM 전송: {ticket['number']}번 {ticket['username']}")
+        return True
+    except (discord.Forbidden, discord.NotFound):
+        return False
+    except discord.HTTPException as e:
+        print(f"❌ 사전 호출 DM 전송 실패: {ticket['username']} - {e}")
+        return False
+
+async def send_precall_channel_batch(entries):
+    """DM을 받지 못한 대기자들을 알림 채널 메시지 하나로 멘션"""
+    notification_channel = channel_registry.get('notification')
+    if not notification_channel:
+        return False
+    
+    lines = [f"<@{ticket['user_id']}> **{ticket['number']}번** - {position}번째 순서" for ticket, position in entries]
+    try:
+        await notification_channel.send("🔔 **곧 상담 차례입니다!** 음성 채널에 접속해 대기해주세요.\n" + "\n".join(lines))
+        return True
+    except discord.HTTPException as e:
+        print(f"❌ 사전 호출 채널 알림 실패: {e}")
+        return False
+
+precall_notifier = PreCallNotifier(send_precall_dm, send_precall_channel_batch, lead=PRECALL_LEAD)
 
 # ========================================
 # Discord UI 클래스들
 # ========================================
 
 class AdminPanelView(discord.ui.View):
-    def __init__(self, consultation_in_progress=False):
+    """관리자 패널 버튼 (고정 custom_id로 재시작 후에도 동작)
+    
+    persistent=True면 상태와 관계없이 모든 버튼을 포함 - 시작 시 bot.add_view 등록용
+    """
+    
+    def __init__(self, consultation_in_progress=False, persistent=False):
         super().__init__(timeout=None)
         
-        if not consultation_in_progress and waiting_queue:
+        if persistent or (not consultation_in_progress and waiting_queue):
             self.add_item(StartConsultationButton())
         
-        if consultation_in_progress and waiting_queue:
+        if persistent or (consultation_in_progress and waiting_queue):
             self.add_item(CompleteConsultationButton())
 
         self.add_item(RefreshQueueButton())
         self.add_item(CompleteSpecificButton())
         self.add_item(MoveUserButton())
         self.add_item(DisconnectUserButton())
+        
+        if persistent or get_queue_page_count() > 1:
+            page = clamp_queue_page(admin_panel_page)
+            self.add_item(QueuePageButton('admin', -1, '이전', '◀️', disabled=not persistent and page == 0))
+            self.add_item(QueuePageButton('admin', 1, '다음', '▶️', disabled=not persistent and page >= get_queue_page_count() - 1))
+
+# /대기열 응답별 페이지 뷰 유지 시간 (초). 만료 후 버튼은 시작 시 등록한 영구 뷰가 처리
+QUEUE_PAGE_VIEW_TIMEOUT = 600
+
+class QueuePageView(discord.ui.View):
+    """/대기열 페이지 이동 버튼 (고정 custom_id로 재시작 후에도 동작)
+    
+    persistent=True인 뷰 하나만 만료 없이 등록하고, 응답마다 만드는 뷰는 만료시켜 뷰 저장소가 계속 커지지 않도록 처리
+    """
+    
+    def __init__(self, page=0, persistent=False):
+        super().__init__(timeout=None if persistent else QUEUE_PAGE_VIEW_TIMEOUT)
+        page = clamp_queue_page(page)
+        self.add_item(QueuePageButton('queue', -1, '이전', '◀️', disabled=not persistent and page == 0))
+        self.add_item(QueuePageButton('queue', 1, '다음', '▶️', disabled=not persistent and page >= get_queue_page_count() - 1))
+
+class QueuePageButton(discord.ui.Button):
+    """대기열 페이지 이동 (캐시된 페이지로 메시지 수정만 수행)
+    
+    현재 페이지는 메시지 푸터에서 읽으므로 버튼 자체는 상태를 갖지 않음
+    """
+    
+    def __init__(self, kind, step, label, emoji, disabled=False):
+        direction = 'prev' if step < 0 else 'next'
+        super().__init__(label=label, style=discord.ButtonStyle.secondary, emoji=emoji, disabled=disabled, row=1,
+                         custom_id=f'kiboa:{kind}_page:{direction}')
+        self.kind = kind
+        self.step = step
+    
+    async def callback(self, interaction: discord.Interaction):
+        global admin_panel_page
+        
+        page = clamp_queue_page(get_message_page(interaction.message) + self.step)
+        
+        if self.kind == 'admin':
+            if not await check_admin_permission(interaction):
+                return
+            admin_panel_page = page
+            embed = get_cached_queue_page('admin', page, build_admin_panel_embed)
+            view = AdminPanelView(consultation_in_progress)
+        else:
+            embed = get_cached_queue_page('queue', page, build_queue_embed)
+            view = QueuePageView(page) if get_queue_page_count() > 1 else None
+        
+        await interaction.response.edit_message(embed=embed, view=view)
+        
+        # 수정에 성공한 뒤에만 지문 기록 (실패 시 다음 갱신이 생략되지 않도록)
+        if self.kind == 'admin':
+            render_differ.changed(('admin_panel', interaction.message.id), embed, view)
 
 class StartConsultationButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label='상담 시작', style=discord.ButtonStyle.success, emoji='▶️')
+        super().__init__(label='상담 시작', style=discord.ButtonStyle.success, emoji='▶️', custom_id='kiboa:admin:start')
     
     async def callback(self, interaction: discord.Interaction):
         global consultation_in_progress
@@ -837,31 +1670,19 @@ class StartConsultationButton(discord.ui.Button):
         if not await check_admin_permission(interaction):
             return
         
-        if not waiting_queue:
-            await interaction.response.send_message("❌ 대기 중인 상담이 없습니다.", ephemeral=True)
+        if consultation_in_progress:
+            await interaction.response.send_message("❌ 이미 진행 중인 상담이 있습니다.", ephemeral=True)
             return
         
-        consultation_in_progress = True
-        next_ticket = waiting_queue[0]
-        
-        embed = discord.Embed(
-            title="▶️ 상담 시작",
-            description=f"**{next_ticket['number']}번** 상담을 시작합니다.",
-            color=0x00ff00
-        )
-        embed.add_field(name="상담 종류", value=get_counseling_type_label(next_ticket['type']), inline=True)
-        embed.add_field(name="상담자", value=next_ticket['username'], inline=True)
-        embed.timestamp = datetime.now()
-        
-        await interaction.response.send_message(embed=embed)
-        
-        await move_user_to_consultation_channel(next_ticket['user_id'], next_ticket['type'], interaction)
+        if not await start_next_consultation(interaction):
+            await interaction.response.send_message("❌ 대기 중인 상담이 없습니다.", ephemeral=True)
+            return
         
-        await update_admin_panel()
+        on_queue_changed()
 
 class CompleteConsultationButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label='상담 완료', style=discord.ButtonStyle.danger, emoji='✅')
+        super().__init__(label='상담 완료', style=discord.ButtonStyle.danger, emoji='✅', custom_id='kiboa:admin:complete')
     
     async def callback(self, interaction: discord.Interaction):
         global consultation_in_progress
@@ -874,25 +1695,9 @@ class CompleteConsultationButton(discord.ui.Button):
             return
         
         completed_ticket = waiting_queue.pop(0)
+        queue_scheduler.remove(completed_ticket['number'])
         consultation_in_progress = False
-        
-        await disconnect_user_from_voice(completed_ticket['user_id'], interaction)
-        
-        # 설문 DM 전송
-        dm_success = await send_survey_dm(
-            completed_ticket['user_id'], 
-            completed_ticket['username'], 
-            completed_ticket['type'], 
-            completed_ticket['number']
-        )
-        
-        # 관리자에게 설문 전송 결과 알림
-        await send_survey_notification_to_admin(
-            completed_ticket['username'],
-            completed_ticket['type'],
-            completed_ticket['number'],
-            dm_success
-        )
+        mark_consultation_completed(completed_ticket)
         
         embed = discord.Embed(
             title="✅ 상담 완료",
@@ -902,26 +1707,27 @@ class CompleteConsultationButton(discord.ui.Button):
         embed.add_field(name="상담 종류", value=get_counseling_type_label(completed_ticket['type']), inline=True)
         embed.add_field(name="상담자", value=completed_ticket['username'], inline=True)
         embed.add_field(name="남은 대기", value=f"{len(waiting_queue)}명", inline=True)
-        embed.add_field(name="🔇 음성 연결", value="자동으로 연결 끊기 완료", inline=False)
+        embed.add_field(name="🔇 음성 연결", value="자동으로 연결 끊기 진행 중", inline=False)
         embed.timestamp = datetime.now()
         
         await interaction.response.send_message(embed=embed)
-        await update_admin_panel()
+        on_queue_changed()
+        schedule_completion_followup(completed_ticket, interaction)
 
 class RefreshQueueButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label='대기열 새로고침', style=discord.ButtonStyle.secondary, emoji='🔄')
+        super().__init__(label='대기열 새로고침', style=discord.ButtonStyle.secondary, emoji='🔄', custom_id='kiboa:admin:refresh')
     
     async def callback(self, interaction: discord.Interaction):
         if not await check_admin_permission(interaction):
             return
         
         await interaction.response.send_message("🔄 대기열을 새로고침했습니다.", ephemeral=True)
-        await update_admin_panel()
+        admin_panel_refresher.request()
 
 class CompleteSpecificButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label='특정 번호 완료', style=discord.ButtonStyle.secondary, emoji='🎯')
+        super().__init__(label='특정 번호 완료', style=discord.ButtonStyle.secondary, emoji='🎯', custom_id='kiboa:admin:complete_specific')
     
     async def callback(self, interaction: discord.Interaction):
         global consultation_in_progress
@@ -938,7 +1744,7 @@ class CompleteSpecificButton(discord.ui.Button):
 
 class MoveUserButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label='사용자 이동', style=discord.ButtonStyle.secondary, emoji='🔊')
+        super().__init__(label='사용자 이동', style=discord.ButtonStyle.secondary, emoji='🔊', custom_id='kiboa:admin:move_user')
     
     async def callback(self, interaction: discord.Interaction):
         if not await check_admin_permission(interaction):
@@ -949,7 +1755,7 @@ class MoveUserButton(discord.ui.Button):
 
 class DisconnectUserButton(discord.ui.Button):
     def __init__(self):
-        super().__init__(label='음성 연결 끊기', style=discord.ButtonStyle.secondary, emoji='🔇')
+        super().__init__(label='음성 연결 끊기', style=discord.ButtonStyle.secondary, emoji='🔇', custom_id='kiboa:admin:disconnect_user')
     
     async def callback(self, interaction: discord.Interaction):
         if not await check_admin_permission(interaction):
@@ -981,24 +1787,8 @@ class CompleteSpecificModal(discord.ui.Modal, title='특정 번호 완료'):
                 consultation_in_progress = False
             
             completed_ticket = waiting_queue.pop(ticket_index)
-            
-            await disconnect_user_from_voice(completed_ticket['user_id'], interaction)
-            
-            # 설문 DM 전송
-            dm_success = await send_survey_dm(
-                completed_ticket['user_id'], 
-                completed_ticket['username'], 
-                completed_ticket['type'], 
-                completed_ticket['number']
-            )
-            
-            # 관리자에게 설문 전송 결과 알림
-            await send_survey_notification_to_admin(
-                completed_ticket['username'],
-                completed_ticket['type'],
-                completed_ticket['number'],
-                dm_success
-            )
+            queue_scheduler.remove(completed_ticket['number'])
+            mark_consultation_completed(completed_ticket)
             
             embed = discord.Embed(
                 title="✅ 특정 번호 완료",
@@ -1007,15 +1797,62 @@ class CompleteSpecificModal(discord.ui.Modal, title='특정 번호 완료'):
             )
             embed.add_field(name="상담 종류", value=get_counseling_type_label(completed_ticket['type']), inline=True)
             embed.add_field(name="상담자", value=completed_ticket['username'], inline=True)
-            embed.add_field(name="🔇 음성 연결", value="자동으로 연결 끊기 완료", inline=False)
+            embed.add_field(name="🔇 음성 연결", value="자동으로 연결 끊기 진행 중", inline=False)
             embed.timestamp = datetime.now()
             
             await interaction.response.send_message(embed=embed)
-            await update_admin_panel()
+            on_queue_changed()
+            schedule_completion_followup(completed_ticket, interaction)
             
         except ValueError:
             await interaction.response.send_message("❌ 올바른 숫자를 입력해주세요.", ephemeral=True)
 
+class MemberPickSelect(discord.ui.Select):
+    """이름 검색 결과가 모호할 때 대상 멤버 선택"""
+    
+    def __init__(self, candidates, action):
+        self.members = {str(member.id): member for member, _ in candidates}
+        self.action = action
+        options = []
+        for member, score in candidates:
+            ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == member.id), None)
+            description = f"@{member.name}" + (f" · {ticket['number']}번 번호표" if ticket else "")
+            options.append(discord.SelectOption(label=member.display_name[:100], value=str(member.id), description=description[:100]))
+        super().__init__(placeholder="대상 사용자를 선택하세요...", options=options)
+    
+    async def callback(self, interaction: discord.Interaction):
+        if not await check_admin_permission(interaction):
+            return
+        member = self.members[self.values[0]]
+        self.view.stop()
+        await self.action(interaction, member)
+
+class MemberPickView(discord.ui.View):
+    def __init__(self, candidates, action):
+        super().__init__(timeout=60)
+        self.add_item(MemberPickSelect(candidates, action))
+
+async def run_with_member_pick(interaction: discord.Interaction, query, action, action_label):
+    """이름으로 멤버를 찾아 action 실행. 후보가 여러 명이고 점수가 비슷하면 선택 메뉴 표시"""
+    candidates = search_members_by_name(interaction.guild, query)
+    
+    if not candidates:
+        await interaction.response.send_message(f"❌ '{query}' 사용자를 찾을 수 없습니다.", ephemeral=True)
+        return
+    
+    if not is_ambiguous(candidates):
+        member, score = candidates[0]
+        print(f"🔍 이름 검색 매치: {member.display_name} (@{member.name}, 점수 {score:.2f})")
+        await action(interaction, member)
+        return
+    
+    print(f"🔍 '{query}' 검색 결과가 모호함: {[member.display_name for member, _ in candidates]}")
+    await interaction.response.send_message(
+        f"🔍 '{query}'와(과) 비슷한 사용자가 여러 명입니다. {action_label}할 사용자를 선택하세요.",
+        view=MemberPickView(candidates, action),
+        ephemeral=True
+    )
+
 class MoveUserModal(discord.ui.Modal, title='사용자 음성 채널 이동'):
     user_input = discord.ui.TextInput(
         label='이동할 사용자',
@@ -1026,108 +1863,81 @@ class MoveUserModal(discord.ui.Modal, title='사용자 음성 채널 이동'):
     
     async def on_submit(self, interaction: discord.Interaction):
         user_input = self.user_input.value.strip()
-        user_id = None
-        consultation_type = "career"  # 기본값
-        target_ticket = None
-        target_username = None
-        
-        try:
-            print(f"🔍 사용자명으로 검색: '{user_input}'")
-            
-            # 현재 서버에서 사용자명으로 멤버 찾기
-            member = None
-            
-            # 1. 정확한 표시 이름 매치
-            for guild_member in interaction.guild.members:
-                if guild_member.display_name.lower() == user_input.lower():
-                    member = guild_member
-                    print(f"🔍 정확한 표시명 매치: {member.display_name}")
-                    break
-            
-            # 2. 정확한 매치가 없으면 부분 매치 시도
-            if not member:
-                for guild_member in interaction.guild.members:
-                    if user_input.lower() in guild_member.display_name.lower():
-                        member = guild_member
-                        print(f"🔍 부분 표시명 매치: {member.display_name}")
-                        break
+        print(f"🔍 사용자명으로 검색: '{user_input}'")
+        await run_with_member_pick(interaction, user_input, move_member_to_consultation, "이동")
+
+async def move_member_to_consultation(interaction: discord.Interaction, member):
+    """찾은 멤버를 번호표 상담 종류에 맞는 음성 채널로 이동"""
+    user_id = None
+    consultation_type = "career"  # 기본값
+    target_ticket = None
+    target_username = None
+    
+    try:
+        user_id = member.id
+        target_username = member.display_name
+        print(f"🔍 사용자명에서 찾은 ID: {user_id}, 표시명: {target_username}")
+        
+        if user_id:
+            # 번호표가 아직 확인되지 않은 경우 (사용자 ID, 멘션, 또는 사용자명으로 입력한 경우)
+            if not target_ticket:
+                # 해당 사용자의 번호표가 있는지 확인
+                user_ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == user_id), None)
+                if user_ticket:
+                    consultation_type = user_ticket['type']
+                    target_ticket = user_ticket
+                    if not target_username:
+                        target_username = user_ticket['username']
+                    print(f"🔍 사용자 ID {user_id}의 번호표 발견, 상담 타입: {consultation_type}")
+                else:
+                    # 사용자명이 없으면 멤버 정보에서 가져오기
+                    if not target_username:
+                        member = interaction.guild.get_member(user_id)
+                        target_username = member.display_name if member else f"ID: {user_id}"
+                    print(f"🔍 사용자 ID {user_id}의 번호표 없음, 기본 타입 사용: {consultation_type}")
             
-            # 3. 사용자명으로도 찾기 시도
-            if not member:
-                for guild_member in interaction.guild.members:
-                    if guild_member.name.lower() == user_input.lower():
-                        member = guild_member
-                        print(f"🔍 사용자명 매치: {member.name}")
-                        break
+            print(f"🔍 최종 사용자 ID: {user_id}, 상담 타입: {consultation_type}, 사용자명: {target_username}")
             
-            if not member:
-                await interaction.response.send_message(f"❌ '{user_input}' 사용자를 찾을 수 없습니다.", ephemeral=True)
-                return
+            # 상담 타입에 대한 설명 추가
+            type_description = get_counseling_type_label(consultation_type)
+            await interaction.response.send_message(
+                f"🔊 {target_username}님을 {type_description} 음성 채널로 이동 중...", 
+                ephemeral=True
+            )
             
-            user_id = member.id
-            target_username = member.display_name
-            print(f"🔍 사용자명에서 찾은 ID: {user_id}, 표시명: {target_username}")
+            # 상담 타입에 맞는 채널로 이동
+            success = await move_user_to_consultation_channel(user_id, consultation_type, interaction)
             
-            if user_id:
-                # 번호표가 아직 확인되지 않은 경우 (사용자 ID, 멘션, 또는 사용자명으로 입력한 경우)
-                if not target_ticket:
-                    # 해당 사용자의 번호표가 있는지 확인
-                    user_ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == user_id), None)
-                    if user_ticket:
-                        consultation_type = user_ticket['type']
-                        target_ticket = user_ticket
-                        if not target_username:
-                            target_username = user_ticket['username']
-                        print(f"🔍 사용자 ID {user_id}의 번호표 발견, 상담 타입: {consultation_type}")
-                    else:
-                        # 사용자명이 없으면 멤버 정보에서 가져오기
-                        if not target_username:
-                            member = interaction.guild.get_member(user_id)
-                            target_username = member.display_name if member else f"ID: {user_id}"
-                        print(f"🔍 사용자 ID {user_id}의 번호표 없음, 기본 타입 사용: {consultation_type}")
-                
-                print(f"🔍 최종 사용자 ID: {user_id}, 상담 타입: {consultation_type}, 사용자명: {target_username}")
-                
-                # 상담 타입에 대한 설명 추가
-                type_description = get_counseling_type_label(consultation_type)
-                await interaction.response.send_message(
-                    f"🔊 {target_username}님을 {type_description} 음성 채널로 이동 중...", 
-                    ephemeral=True
-                )
-                
-                # 상담 타입에 맞는 채널로 이동
-                success = await move_user_to_consultation_channel(user_id, consultation_type, interaction)
+            if success:
+                if target_ticket:
+                    # 번호표가 있는 경우
+                    embed = discord.Embed(
+                        title="🔊 사용자 이동 완료",
+                        description=f"**{target_ticket['number']}번** {target_username}님을 {type_description} 음성 채널로 이동했습니다.",
+                        color=0x00ff00
+                    )
+                    embed.add_field(name="상담 종류", value=type_description, inline=True)
+                    embed.add_field(name="번호표", value=f"{target_ticket['number']}번", inline=True)
+                else:
+                    # 번호표가 없는 경우
+                    embed = discord.Embed(
+                        title="🔊 사용자 이동 완료",
+                        description=f"{target_username}님을 {type_description} 음성 채널로 이동했습니다.",
+                        color=0x00ff00
+                    )
+                    embed.add_field(name="상담 종류", value=type_description, inline=True)
+                    embed.add_field(name="번호표", value="없음 (기본 채널 사용)", inline=True)
                 
-                if success:
-                    if target_ticket:
-                        # 번호표가 있는 경우
-                        embed = discord.Embed(
-                            title="🔊 사용자 이동 완료",
-                            description=f"**{target_ticket['number']}번** {target_username}님을 {type_description} 음성 채널로 이동했습니다.",
-                            color=0x00ff00
-                        )
-                        embed.add_field(name="상담 종류", value=type_description, inline=True)
-                        embed.add_field(name="번호표", value=f"{target_ticket['number']}번", inline=True)
-                    else:
-                        # 번호표가 없는 경우
-                        embed = discord.Embed(
-                            title="🔊 사용자 이동 완료",
-                            description=f"{target_username}님을 {type_description} 음성 채널로 이동했습니다.",
-                            color=0x00ff00
-                        )
-                        embed.add_field(name="상담 종류", value=type_description, inline=True)
-                        embed.add_field(name="번호표", value="없음 (기본 채널 사용)", inline=True)
-                    
-                    embed.timestamp = datetime.now()
-                    await interaction.followup.send(embed=embed)
-            else:
-                await interaction.response.send_message("❌ 사용자를 찾을 수 없습니다.", ephemeral=True)
-        except ValueError as e:
-            print(f"❌ ValueError: {e}")
-            await interaction.response.send_message("❌ 올바른 형식으로 입력해주세요.", ephemeral=True)
-        except Exception as e:
-            print(f"❌ Exception: {e}")
-            await interaction.response.send_message(f"❌ 오류가 발생했습니다: {e}", ephemeral=True)
+                embed.timestamp = datetime.now()
+                await interaction.followup.send(embed=embed)
+        else:
+            await interaction.response.send_message("❌ 사용자를 찾을 수 없습니다.", ephemeral=True)
+    except ValueError as e:
+        print(f"❌ ValueError: {e}")
+        await interaction.response.send_message("❌ 올바른 형식으로 입력해주세요.", ephemeral=True)
+    except Exception as e:
+        print(f"❌ Exception: {e}")
+        await interaction.response.send_message(f"❌ 오류가 발생했습니다: {e}", ephemeral=True)
 
 class DisconnectUserModal(discord.ui.Modal, title='사용자 음성 연결 끊기'):
     user_input = discord.ui.TextInput(
@@ -1139,109 +1949,82 @@ class DisconnectUserModal(discord.ui.Modal, title='사용자 음성 연결 끊
     
     async def on_submit(self, interaction: discord.Interaction):
         user_input = self.user_input.value.strip()
-        user_id = None
-        target_ticket = None
-        target_username = None
-        
-        try:
-            print(f"🔇 음성 연결 끊기 요청: '{user_input}'")
-                
-            # 현재 서버에서 사용자명으로 멤버 찾기
-            member = None
-            
-            # 1. 정확한 표시 이름 매치
-            for guild_member in interaction.guild.members:
-                if guild_member.display_name.lower() == user_input.lower():
-                    member = guild_member
-                    print(f"🔍 정확한 표시명 매치: {member.display_name}")
-                    break
-            
-            # 2. 정확한 매치가 없으면 부분 매치 시도
-            if not member:
-                for guild_member in interaction.guild.members:
-                    if user_input.lower() in guild_member.display_name.lower():
-                        member = guild_member
-                        print(f"🔍 부분 표시명 매치: {member.display_name}")
-                        break
+        print(f"🔇 음성 연결 끊기 요청: '{user_input}'")
+        await run_with_member_pick(interaction, user_input, disconnect_member_from_voice, "연결 끊기")
+
+async def disconnect_member_from_voice(interaction: discord.Interaction, member):
+    """찾은 멤버의 음성 연결 끊기"""
+    user_id = None
+    target_ticket = None
+    target_username = None
+    
+    try:
+        user_id = member.id
+        target_username = member.display_name
+        print(f"🔍 사용자명에서 찾은 ID: {user_id}, 표시명: {target_username}")
+        
+        if user_id:
+            # 번호표가 아직 확인되지 않은 경우 (사용자 ID, 멘션, 또는 사용자명으로 입력한 경우)
+            if not target_ticket:
+                # 해당 사용자의 번호표가 있는지 확인
+                user_ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == user_id), None)
+                if user_ticket:
+                    target_ticket = user_ticket
+                    if not target_username:
+                        target_username = user_ticket['username']
+                    print(f"🔍 사용자 ID {user_id}의 번호표 발견")
+                else:
+                    # 사용자명이 없으면 멤버 정보에서 가져오기
+                    if not target_username:
+                        member = interaction.guild.get_member(user_id)
+                        target_username = member.display_name if member else f"ID: {user_id}"
+                    print(f"🔍 사용자 ID {user_id}의 번호표 없음")
             
-            # 3. 사용자명으로도 찾기 시도
-            if not member:
-                for guild_member in interaction.guild.members:
-                    if guild_member.name.lower() == user_input.lower():
-                        member = guild_member
-                        print(f"🔍 사용자명 매치: {member.name}")
-                        break
+            print(f"🔇 최종 연결 끊기 대상 ID: {user_id}, 사용자명: {target_username}")
             
-            if not member:
-                await interaction.response.send_message(f"❌ '{user_input}' 사용자를 찾을 수 없습니다.", ephemeral=True)
-                return
+            await interaction.response.send_message(
+                f"🔇 {target_username}님을 음성 채널에서 연결 끊는 중...", 
+                ephemeral=True
+            )
             
-            user_id = member.id
-            target_username = member.display_name
-            print(f"🔍 사용자명에서 찾은 ID: {user_id}, 표시명: {target_username}")
+            success = await disconnect_user_from_voice(user_id, interaction)
             
-            if user_id:
-                # 번호표가 아직 확인되지 않은 경우 (사용자 ID, 멘션, 또는 사용자명으로 입력한 경우)
-                if not target_ticket:
-                    # 해당 사용자의 번호표가 있는지 확인
-                    user_ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == user_id), None)
-                    if user_ticket:
-                        target_ticket = user_ticket
-                        if not target_username:
-                            target_username = user_ticket['username']
-                        print(f"🔍 사용자 ID {user_id}의 번호표 발견")
-                    else:
-                        # 사용자명이 없으면 멤버 정보에서 가져오기
-                        if not target_username:
-                            member = interaction.guild.get_member(user_id)
-                            target_username = member.display_name if member else f"ID: {user_id}"
-                        print(f"🔍 사용자 ID {user_id}의 번호표 없음")
-                
-                print(f"🔇 최종 연결 끊기 대상 ID: {user_id}, 사용자명: {target_username}")
-                
-                await interaction.response.send_message(
-                    f"🔇 {target_username}님을 음성 채널에서 연결 끊는 중...", 
-                    ephemeral=True
-                )
-                
-                success = await disconnect_user_from_voice(user_id, interaction)
-                
-                if success:
-                    if target_ticket:
-                        # 번호표가 있는 경우
-                        embed = discord.Embed(
-                            title="🔇 음성 연결 끊기 완료",
-                            description=f"**{target_ticket['number']}번** {target_username}님의 음성 연결을 끊었습니다.",
-                            color=0xff9900
-                        )
-                        embed.add_field(name="상담 종류", value=get_counseling_type_label(target_ticket['type']), inline=True)
-                        embed.add_field(name="번호표", value=f"{target_ticket['number']}번", inline=True)
-                    else:
-                        # 번호표가 없는 경우
-                        embed = discord.Embed(
-                            title="🔇 음성 연결 끊기 완료",
-                            description=f"{target_username}님의 음성 연결을 끊었습니다.",
-                            color=0xff9900
-                        )
-                        embed.add_field(name="번호표", value="없음", inline=True)
-                    
-                    embed.timestamp = datetime.now()
-                    await interaction.followup.send(embed=embed)
-            else:
-                await interaction.response.send_message("❌ 사용자를 찾을 수 없습니다.", ephemeral=True)
+            if success:
+                if target_ticket:
+                    # 번호표가 있는 경우
+                    embed = discord.Embed(
+                        title="🔇 음성 연결 끊기 완료",
+                        description=f"**{target_ticket['number']}번** {target_username}님의 음성 연결을 끊었습니다.",
+                        color=0xff9900
+                    )
+                    embed.add_field(name="상담 종류", value=get_counseling_type_label(target_ticket['type']), inline=True)
+                    embed.add_field(name="번호표", value=f"{target_ticket['number']}번", inline=True)
+                else:
+                    # 번호표가 없는 경우
+                    embed = discord.Embed(
+                        title="🔇 음성 연결 끊기 완료",
+                        description=f"{target_username}님의 음성 연결을 끊었습니다.",
+                        color=0xff9900
+                    )
+                    embed.add_field(name="번호표", value="없음", inline=True)
                 
-        except ValueError as e:
-            print(f"❌ ValueError: {e}")
-            await interaction.response.send_message("❌ 올바른 형식으로 입력해주세요.", ephemeral=True)
-        except Exception as e:
-            print(f"❌ Exception: {e}")
-            await interaction.response.send_message(f"❌ 오류가 발생했습니다: {e}", ephemeral=True)
+                embed.timestamp = datetime.now()
+                await interaction.followup.send(embed=embed)
+        else:
+            await interaction.response.send_message("❌ 사용자를 찾을 수 없습니다.", ephemeral=True)
+    
+    except ValueError as e:
+        print(f"❌ ValueError: {e}")
+        await interaction.response.send_message("❌ 올바른 형식으로 입력해주세요.", ephemeral=True)
+    except Exception as e:
+        print(f"❌ Exception: {e}")
+        await interaction.response.send_message(f"❌ 오류가 발생했습니다: {e}", ephemeral=True)
 
 class TicketView(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
     
-    @discord.ui.button(label='번호표 발급받기', style=discord.ButtonStyle.primary, emoji='🎫')
+    @discord.ui.button(label='번호표 발급받기', style=discord.ButtonStyle.primary, emoji='🎫', custom_id='kiboa:ticket:issue')
     async def issue_ticket(self, interaction: discord.Interaction, button: discord.ui.Button):
         existing_ticket = next((ticket for ticket in waiting_queue if ticket['user_id'] == interaction.user.id), None)
         if existing_ticket:
@@ -1285,9 +2068,12 @@ class CounselingTypeSelect(discord.ui.View):
         }
         
         waiting_queue.append(new_ticket)
+        queue_scheduler.push(new_ticket, new_ticket['timestamp'].timestamp())
+        sync_queue_order()
+        mark_consultation_issued(new_ticket)
         
-        asyncio.create_task(send_admin_channel_notification(new_ticket))
-        asyncio.create_task(update_admin_panel())
+        notify_admin(ADMIN_EVENT_ISSUED, ticket=new_ticket, queue_length=len(get_waiting_tickets()))
+        on_queue_changed()
         
         embed = discord.Embed(
             title="✅ 번호표 발급 완료!",
@@ -1296,27 +2082,16 @@ class CounselingTypeSelect(discord.ui.View):
         embed.add_field(name="🎫 번호", value=f"**{current_number}번**", inline=True)
         embed.add_field(name="📋 상담 종류", value=get_counseling_type_label(selected_type), inline=True)
         embed.add_field(name="👤 신청자", value=interaction.user.display_name, inline=True)
-        embed.add_field(name="⏰ 발급 시간", value=f"<t:{int(datetime.now().timestamp())}:T>", inline=False)
+        embed.add_field(name="⏰ 발급 시간", value=f"<t:{int(datetime.now().timestamp())}:T>", inline=True)
+        embed.add_field(name="⏳ 예상 대기", value=format_wait_time(estimate_wait_seconds(waiting_queue.index(new_ticket))), inline=True)
         embed.set_footer(text="대기열 확인은 /대기열 명령어를 사용하세요")
         
         await interaction.response.edit_message(embed=embed, view=None)
-        
-        public_embed = discord.Embed(
-            title="🔔 새로운 상담 신청",
-            description=f"**{current_number}번** 번호표가 발급되었습니다.",
-            color=0xffff00
-        )
-        public_embed.add_field(name="상담 종류", value=get_counseling_type_label(selected_type), inline=True)
-        public_embed.add_field(name="현재 대기", value=f"{len(waiting_queue)}명", inline=True)
-        
-        admin_channel = bot.get_channel(ADMIN_CHANNEL_ID)
-        if admin_channel:
-            await admin_channel.send(embed=public_embed)
 
 # ========================================
 # 게임 모듈 import (기록 시스템 초기화 후)
 # ========================================
-from tetris_game import start_tetris_game
+from tetris_game import start_tetris_game, tetris_clock, tetris_frame_stats
 from rock_paper_scissors_game import start_rps_game
 
 print("🎮 게임 모듈 import 완료!")
@@ -1325,6 +2100,14 @@ print("🎮 게임 모듈 import 완료!")
 # 이벤트 핸들러
 # ========================================
 
+@bot.event
+async def setup_hook():
+    """기존 패널 메시지의 버튼이 재시작 직후에도 동작하도록 영구 뷰 등록 (메시지 전송 없음)"""
+    bot.add_view(TicketView())
+    bot.add_view(AdminPanelView(persistent=True))
+    bot.add_view(QueuePageView(persistent=True))
+    print("🔁 영구 뷰 등록 완료 (번호표, 관리자 패널, 대기열 페이지)")
+
 @bot.event
 async def on_ready():
     print(f'✅ {bot.user} 봇이 준비되었습니다!')
@@ -1343,6 +2126,15 @@ async def on_ready():
     for consultation_type, channel_id in CONSULTATION_VOICE_CHANNEL_IDS.items():
         print(f"   • {consultation_type.upper()}_CHANNEL_ID: {'✅ 설정됨' if channel_id else '⚠️ 설정되지 않음'}")
     
+    resolved = channel_registry.resolve_all(bot)
+    print(f"   • 채널 조회: {resolved}/{len(channel_registry.channel_ids)}개 연결됨")
+    
+    for guild in bot.guilds:
+        member_indexes.build(guild)
+        voice_presence.seed(guild)
+    print(f"   • 멤버 이름 인덱스: {member_indexes.stats_text()}")
+    print(f"   • 음성 채널 접속 현황: {voice_presence.stats_text()}")
+    
     print(f'\n🔧 활성화된 인텐트:')
     print(f'   • members: {bot.intents.members}')
     print(f'   • guilds: {bot.intents.guilds}')
@@ -1388,6 +2180,57 @@ async def on_ready():
     except Exception as e:
         print(f"❌ 게임 기록 시스템 상태 확인 실패: {e}")
 
+@bot.event
+async def on_guild_channel_update(before, after):
+    """설정 채널 이름/위치 변경 시 캐시와 관리자 패널 갱신"""
+    if channel_registry.on_channel_update(after):
+        print(f"🔄 설정 채널 변경 감지: {after.name}")
+        admin_panel_refresher.request()
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    """설정 채널 삭제 시 캐시에서 제거"""
+    if channel_registry.on_channel_delete(channel):
+        print(f"⚠️ 설정 채널이 삭제되었습니다: {channel.name} ({channel.id})")
+        admin_panel_refresher.request()
+
+@bot.event
+async def on_voice_state_update(member, before, after):
+    """음성 채널 입장/이동/퇴장 반영. 번호표 보유자면 대기열 표시 갱신"""
+    if not voice_presence.on_voice_state_update(member, before, after):
+        return
+    if after.channel and member.id in pending_moves:
+        await run_pending_move(member)
+    if any(ticket['user_id'] == member.id for ticket in waiting_queue):
+        invalidate_queue_render()
+
+@bot.event
+async def on_member_join(member):
+    member_indexes.on_member_join(member)
+
+@bot.event
+async def on_member_update(before, after):
+    member_indexes.on_member_update(before, after)
+
+@bot.event
+async def on_member_remove(member):
+    member_indexes.on_member_remove(member)
+    member_resolver.forget(member.id, member.guild.id)
+
+@bot.event
+async def on_user_update(before, after):
+    member_indexes.on_user_update(before, after)
+
+@bot.event
+async def on_guild_join(guild):
+    member_indexes.build(guild)
+    voice_presence.seed(guild)
+
+@bot.event
+async def on_guild_remove(guild):
+    member_indexes.drop(guild.id)
+    voice_presence.forget_guild(guild.id)
+
 @bot.event
 async def on_command_error(ctx, error):
     """명령어 에러 핸들링"""
@@ -1429,8 +2272,8 @@ async def ticket_command(interaction: discord.Interaction):
     view = TicketView()
     await interaction.response.send_message(embed=embed, view=view)
 
-@bot.tree.command(name="대기열", description="현재 대기 중인 상담 목록을 확인합니다")
-async def queue_command(interaction: discord.Interaction):
+def build_queue_embed(page=0):
+    """/대기열 임베드 생성 (현재 페이지 구간만 렌더링)"""
     if not waiting_queue:
         embed = discord.Embed(
             title="📋 대기열 현황",
@@ -1438,14 +2281,20 @@ async def queue_command(interaction: discord.Interaction):
             color=0x808080
         )
         embed.timestamp = datetime.now()
-        await interaction.response.send_message(embed=embed)
-        return
+        return embed
     
+    start = page * QUEUE_PAGE_SIZE
+    end = start + QUEUE_PAGE_SIZE
+    estimates = estimate_wait_for_range(start, end)
     queue_description = []
-    for ticket in waiting_queue:
+    for i, ticket in enumerate(waiting_queue[start:end], start):
         type_label = get_counseling_type_label(ticket['type'])
         time_ago = f"<t:{int(ticket['timestamp'].timestamp())}:R>"
-        queue_description.append(f"**{ticket['number']}번** | {type_label} | {ticket['username']} {time_ago}")
+        if i == 0 and consultation_in_progress:
+            wait_text = "🔴 상담 중"
+        else:
+            wait_text = f"⏳ {format_wait_time(estimates[i])}"
+        queue_description.append(f"**{ticket['number']}번** | {type_label} | {get_voice_marker(ticket)} {ticket['username']} {time_ago} | {wait_text}")
     
     embed = discord.Embed(
         title="📋 진로상담 대기열 현황",
@@ -1454,13 +2303,25 @@ async def queue_command(interaction: discord.Interaction):
     )
     embed.add_field(
         name="📊 통계",
-        value=f"• 총 대기: **{len(waiting_queue)}명**\n• 다음 순서: **{waiting_queue[0]['number']}번**",
+        value=(
+            f"• 총 대기: **{len(waiting_queue)}명**\n"
+            f"• 다음 순서: **{waiting_queue[0]['number']}번**\n"
+            f"• 신규 신청 예상 대기: **{format_wait_time(estimate_wait_seconds(len(waiting_queue)))}**"
+        ),
         inline=False
     )
     embed.timestamp = datetime.now()
-    embed.set_footer(text="상담 완료 시 /완료 명령어를 사용하세요")
+    embed.set_footer(text=get_page_footer(page, "상담 완료 시 /완료 명령어를 사용하세요"))
+    return embed
+
+@bot.tree.command(name="대기열", description="현재 대기 중인 상담 목록을 확인합니다")
+async def queue_command(interaction: discord.Interaction):
+    embed = get_cached_queue_page('queue', 0, build_queue_embed)
     
-    await interaction.response.send_message(embed=embed)
+    if get_queue_page_count() > 1:
+        await interaction.response.send_message(embed=embed, view=QueuePageView(0))
+    else:
+        await interaction.response.send_message(embed=embed)
 
 # ========================================
 # 설문 관리 슬래시 커맨드들
@@ -1557,6 +2418,100 @@ async def survey_statistics_command(interaction: discord.Interaction):
         print(f"❌ 설문 통계 조회 실패: {e}")
         await interaction.response.send_message("❌ 설문 통계를 불러오는 중 오류가 발생했습니다.", ephemeral=True)
 
+@bot.tree.command(name="상담통계", description="상담 처리량 및 대기/상담 시간 통계를 확인합니다 (관리자 전용)")
+async def consultation_statistics_command(interaction: discord.Interaction):
+    if not interaction.user.guild_permissions.administrator:
+        await interaction.response.send_message("❌ 관리자만 사용할 수 있는 명령어입니다.", ephemeral=True)
+        return
+    
+    try:
+        analytics = consultation_history.analytics
+        counts = analytics.event_counts
+        
+        if not any(counts.values()):
+            embed = discord.Embed(
+                title="📊 상담 통계",
+                description="아직 기록된 상담이 없습니다.",
+                color=0x808080
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title="📊 상담 처리 통계",
+            color=0x5865f2
+        )
+        
+        embed.add_field(
+            name="📈 전체 통계",
+            value=(
+                f"발급: **{counts[EVENT_ISSUED]}건** | 시작: **{counts[EVENT_STARTED]}건**\n"
+                f"완료: **{counts[EVENT_COMPLETED]}건** | 노쇼: **{counts[EVENT_NO_SHOW]}건**\n"
+                f"운영 시간당 처리: **{analytics.sessions_per_hour():.1f}건**"
+            ),
+            inline=False
+        )
+        
+        def format_duration_stats(stats_by_type):
+            lines = []
+            for consultation_type, stats in stats_by_type.items():
+                lines.append(
+                    f"{get_counseling_type_label(consultation_type)}: "
+                    f"평균 {stats.mean / 60:.1f}분 | 중앙값 {stats.p50.value() / 60:.1f}분 | "
+                    f"p90 {stats.p90.value() / 60:.1f}분 ({stats.count}건)"
+                )
+            return "\n".join(lines) if lines else "기록 없음"
+        
+        embed.add_field(name="⏳ 대기 시간 (종류별)", value=format_duration_stats(analytics.wait_by_type), inline=False)
+        embed.add_field(name="⏱️ 상담 시간 (종류별)", value=format_duration_stats(analytics.service_by_type), inline=False)
+        
+        # 사전 호출 알림 효과 (상담 사이 공백)
+        precall_stats = precall_notifier.stats
+        gap_notified = precall_notifier.gap_notified.mean
+        gap_not_notified = precall_notifier.gap_not_notified.mean
+        gap_lines = [
+            f"DM: **{precall_stats['dm_sent']}건** | 채널 멘션: **{precall_stats['channel_mentions']}건** (앞 {PRECALL_LEAD}명)",
+            f"상담 사이 공백 (알림 받음): {f'{gap_notified / 60:.1f}분' if gap_notified is not None else '기록 없음'} ({precall_notifier.gap_notified.count}건)",
+            f"상담 사이 공백 (알림 없음): {f'{gap_not_notified / 60:.1f}분' if gap_not_notified is not None else '기록 없음'} ({precall_notifier.gap_not_notified.count}건)"
+        ]
+        if gap_notified is not None and gap_not_notified is not None:
+            gap_lines.append(f"공백 단축: **{(gap_not_notified - gap_notified) / 60:.1f}분**")
+        embed.add_field(name="🔔 사전 호출 알림", value="\n".join(gap_lines), inline=False)
+        
+        # 시간대별 완료 건수 (상위 5개)
+        busiest_hours = sorted(
+            ((hour, count) for hour, count in enumerate(analytics.completed_by_hour) if count),
+            key=lambda x: x[1],
+            reverse=True
+        )[:5]
+        if busiest_hours:
+            embed.add_field(
+                name="🕒 시간대별 완료 (상위 5개)",
+                value="\n".join(f"{hour:02d}시: **{count}건**" for hour, count in busiest_hours),
+                inline=True
+            )
+        
+        # 최근 7일 일별 통계
+        recent_days = sorted(analytics.daily_counts.items(), reverse=True)[:7]
+        if recent_days:
+            embed.add_field(
+                name="📅 최근 7일",
+                value="\n".join(
+                    f"{day}: 발급 {day_counts[EVENT_ISSUED]} / 완료 {day_counts[EVENT_COMPLETED]} / 노쇼 {day_counts[EVENT_NO_SHOW]}"
+                    for day, day_counts in recent_days
+                ),
+                inline=True
+            )
+        
+        embed.timestamp = datetime.now()
+        embed.set_footer(text=f"기록 파일: {CONSULTATION_HISTORY_FILE}")
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+    except Exception as e:
+        print(f"❌ 상담 통계 조회 실패: {e}")
+        await interaction.response.send_message("❌ 상담 통계를 불러오는 중 오류가 발생했습니다.", ephemeral=True)
+
 @bot.tree.command(name="설문설정", description="설문 링크 설정 상태를 확인합니다 (관리자 전용)")
 async def survey_settings_command(interaction: discord.Interaction):
     if not interaction.user.guild_permissions.administrator:
@@ -1602,6 +2557,7 @@ async def survey_settings_command(interaction: discord.Interaction):
 
 @bot.tree.command(name="완료", description="상담을 완료처리 합니다")
 @app_commands.describe(번호="완료할 번호표 번호")
+@app_commands.autocomplete(번호=ticket_number_autocomplete)
 async def complete_command(interaction: discord.Interaction, 번호: int):
     global consultation_in_progress
     
@@ -1615,24 +2571,8 @@ async def complete_command(interaction: discord.Interaction, 번호: int):
         consultation_in_progress = False
     
     completed_ticket = waiting_queue.pop(ticket_index)
-    
-    await disconnect_user_from_voice(completed_ticket['user_id'], interaction)
-    
-    # 설문 DM 전송
-    dm_success = await send_survey_dm(
-        completed_ticket['user_id'], 
-        completed_ticket['username'], 
-        completed_ticket['type'], 
-        completed_ticket['number']
-    )
-    
-    # 관리자에게 설문 전송 결과 알림
-    await send_survey_notification_to_admin(
-        completed_ticket['username'],
-        completed_ticket['type'],
-        completed_ticket['number'],
-        dm_success
-    )
+    queue_scheduler.remove(completed_ticket['number'])
+    mark_consultation_completed(completed_ticket)
     
     embed = discord.Embed(
         title="✅ 상담 완료",
@@ -1641,23 +2581,33 @@ async def complete_command(interaction: discord.Interaction, 번호: int):
     embed.add_field(name="번호표", value=f"{completed_ticket['number']}번", inline=True)
     embed.add_field(name="상담 종류", value=get_counseling_type_label(completed_ticket['type']), inline=True)
     embed.add_field(name="상담자", value=completed_ticket['username'], inline=True)
-    embed.add_field(name="🔇 음성 연결", value="자동으로 연결 끊기 완료", inline=False)
+    embed.add_field(name="🔇 음성 연결", value="자동으로 연결 끊기 진행 중", inline=False)
     embed.timestamp = datetime.now()
     
     await interaction.response.send_message(embed=embed)
-    await update_admin_panel()
+    on_queue_changed()
+    schedule_completion_followup(completed_ticket, interaction)
 
 @bot.tree.command(name="초기화", description="대기열을 초기화합니다 (관리자 전용)")
-async def reset_command(interaction: discord.Interaction):
+@app_commands.describe(음성연결끊기="상담 음성 채널 접속자의 연결도 모두 끊기 (기본값: 아니오)")
+async def reset_command(interaction: discord.Interaction, 음성연결끊기: bool = False):
     if not interaction.user.guild_permissions.administrator:
         await interaction.response.send_message("❌ 관리자만 대기열을 초기화할 수 있습니다.", ephemeral=True)
         return
     
-    global ticket_number, consultation_in_progress
+    global ticket_number, consultation_in_progress, last_session_completed_at
     previous_count = len(waiting_queue)
     waiting_queue.clear()
+    queue_scheduler.clear()
+    for handle in no_show_timers.values():
+        handle.cancel()
+    no_show_timers.clear()
+    cancel_no_show_recall()
+    for user_id in list(pending_moves):
+        cancel_pending_move(user_id)
     ticket_number = 1
     consultation_in_progress = False
+    last_session_completed_at = None
     
     embed = discord.Embed(
         title="🔄 대기열 초기화",
@@ -1667,7 +2617,44 @@ async def reset_command(interaction: discord.Interaction):
     embed.timestamp = datetime.now()
     
     await interaction.response.send_message(embed=embed)
-    await update_admin_panel()
+    on_queue_changed()
+    
+    if 음성연결끊기:
+        report = await bulk_disconnect_members(get_consultation_voice_members())
+        await interaction.followup.send(embed=build_bulk_report_embed("🔇 상담 채널 일괄 연결 끊기", report))
+
+@bot.tree.command(name="일괄연결끊기", description="상담 음성 채널 접속자의 연결을 모두 끊습니다 (관리자 전용)")
+async def bulk_disconnect_command(interaction: discord.Interaction):
+    if not interaction.user.guild_permissions.administrator:
+        await interaction.response.send_message("❌ 관리자만 사용할 수 있는 명령어입니다.", ephemeral=True)
+        return
+    
+    await interaction.response.defer(thinking=True)
+    report = await bulk_disconnect_members(get_consultation_voice_members())
+    await interaction.followup.send(embed=build_bulk_report_embed("🔇 상담 채널 일괄 연결 끊기", report))
+
+@bot.tree.command(name="일괄이동", description="여러 사용자를 각자의 상담 음성 채널로 이동합니다 (관리자 전용)")
+@app_commands.describe(대상="쉼표로 구분한 멘션, 사용자 ID, 번호표 번호, 이름 (예: @홍길동, 5, 7)")
+async def bulk_move_command(interaction: discord.Interaction, 대상: str):
+    if not interaction.user.guild_permissions.administrator:
+        await interaction.response.send_message("❌ 관리자만 사용할 수 있는 명령어입니다.", ephemeral=True)
+        return
+    
+    entries = {}
+    unresolved = []
+    for token in split_bulk_targets(대상):
+        resolved, reason = resolve_bulk_target(interaction.guild, token)
+        if resolved is None:
+            unresolved.append(f"{token} ({reason})")
+        else:
+            entries.setdefault(resolved[0].id, resolved)
+    
+    await interaction.response.defer(thinking=True)
+    report = await bulk_move_members(list(entries.values()))
+    embed = build_bulk_report_embed("🔊 일괄 이동", report)
+    if unresolved:
+        embed.add_field(name="찾지 못한 입력", value="\n".join(unresolved)[:1024], inline=False)
+    await interaction.followup.send(embed=embed)
 
 @bot.tree.command(name="관리자패널", description="관리자 패널을 생성합니다 (관리자 전용)")
 async def admin_panel_command(interaction: discord.Interaction):
@@ -1676,13 +2663,43 @@ async def admin_panel_command(interaction: discord.Interaction):
         return
     
     await interaction.response.send_message("🎛️ 관리자 패널을 생성했습니다.", ephemeral=True)
-    await update_admin_panel()
+    admin_panel_refresher.request(recreate=True)
+
+@bot.tree.command(name="우선순위", description="특정 번호표를 다음 순서로 올립니다 (관리자 전용)")
+@app_commands.describe(번호="우선 처리할 번호표 번호")
+@app_commands.autocomplete(번호=ticket_number_autocomplete)
+async def priority_command(interaction: discord.Interaction, 번호: int):
+    if not interaction.user.guild_permissions.administrator:
+        await interaction.response.send_message("❌ 관리자만 사용할 수 있는 명령어입니다.", ephemeral=True)
+        return
+    
+    if consultation_in_progress and waiting_queue and waiting_queue[0]['number'] == 번호:
+        await interaction.response.send_message(f"❌ {번호}번은 이미 상담 중입니다.", ephemeral=True)
+        return
+    
+    if not queue_scheduler.bump(번호):
+        await interaction.response.send_message(f"❌ {번호}번 번호표를 찾을 수 없거나 이미 우선 처리 대상입니다.", ephemeral=True)
+        return
+    
+    sync_queue_order()
+    
+    embed = discord.Embed(
+        title="⏫ 우선순위 변경",
+        description=f"**{번호}번** 번호표를 우선 처리 대상으로 지정했습니다.",
+        color=0x5865f2
+    )
+    embed.add_field(name="대기열 정책", value=POLICIES[queue_scheduler.policy], inline=True)
+    embed.timestamp = datetime.now()
+    
+    await interaction.response.send_message(embed=embed)
+    on_queue_changed()
 
 @bot.tree.command(name="이동", description="특정 사용자를 상담용 음성 채널로 이동시킵니다 (관리자 전용)")
 @app_commands.describe(
     사용자명="이동시킬 사용자명 (디스코드 표시 이름)",
     번호="번호표 번호 (선택사항)"
 )
+@app_commands.autocomplete(사용자명=member_name_autocomplete, 번호=ticket_number_autocomplete)
 async def move_user_command(interaction: discord.Interaction, 사용자명: str = None, 번호: int = None):
     if not interaction.user.guild_permissions.administrator:
         await interaction.response.send_message("❌ 관리자만 사용할 수 있는 명령어입니다.", ephemeral=True)
@@ -1705,27 +2722,7 @@ async def move_user_command(interaction: discord.Interaction, 사용자명: str
     # 사용자명으로 검색하는 경우
     elif 사용자명:
         # 현재 서버에서 사용자명으로 멤버 찾기
-        member = None
-        
-        # 정확한 표시 이름 매치
-        for guild_member in interaction.guild.members:
-            if guild_member.display_name.lower() == 사용자명.lower():
-                member = guild_member
-                break
-        
-        # 정확한 매치가 없으면 부분 매치 시도
-        if not member:
-            for guild_member in interaction.guild.members:
-                if 사용자명.lower() in guild_member.display_name.lower():
-                    member = guild_member
-                    break
-        
-        # 사용자명으로도 찾기 시도
-        if not member:
-            for guild_member in interaction.guild.members:
-                if guild_member.name.lower() == 사용자명.lower():
-                    member = guild_member
-                    break
+        member = find_member_by_name(interaction.guild, 사용자명)
         
         if not member:
             await interaction.response.send_message(f"❌ '{사용자명}' 사용자를 찾을 수 없습니다.", ephemeral=True)
@@ -1785,6 +2782,7 @@ async def move_user_command(interaction: discord.Interaction, 사용자명: str
     사용자="연결을 끊을 사용자",
     번호="번호표 번호 (선택사항)"
 )
+@app_commands.autocomplete(번호=ticket_number_autocomplete)
 async def disconnect_user_command(interaction: discord.Interaction, 사용자: discord.Member = None, 번호: int = None):
     if not interaction.user.guild_permissions.administrator:
         await interaction.response.send_message("❌ 관리자만 사용할 수 있는 명령어입니다.", ephemeral=True)
@@ -1827,7 +2825,7 @@ async def announcement_command(interaction: discord.Interaction, 메시지: str)
         return
     
     try:
-        notification = bot.get_channel(NOTIFICATION_CHANNEL_ID)
+        notification = channel_registry.get('notification')
         # \n을 실제 개행으로 변환
         formatted_message = 메시지.replace('\\n', '\n')
         embed = discord.Embed(
@@ -1860,37 +2858,33 @@ async def debug_command(interaction: discord.Interaction):
     debug_info.append(f"**🔍 디버그 정보**")
     debug_info.append(f"총 대기: {len(waiting_queue)}명")
     debug_info.append(f"봇이 참여한 서버: {len(bot.guilds)}개")
+    debug_info.append(f"관리자 패널 갱신: {admin_panel_refresher.stats_text()}")
+    debug_info.append(f"화면 수정: {render_differ.stats_text()}")
+    debug_info.append(f"관리자 알림: {admin_notifier.stats_text()}")
+    debug_info.append(f"채널 캐시: {channel_registry.stats_text()}")
+    debug_info.append(f"멤버 이름 인덱스: {member_indexes.stats_text()}")
+    debug_info.append(f"멤버 조회 캐시: {member_resolver.stats_text()}")
+    debug_info.append(f"음성 채널 접속 현황: {voice_presence.stats_text()} / 자동 이동 대기 {len(pending_moves)}명")
+    debug_info.append(f"테트리스 시계: {tetris_clock.stats_text()}")
+    debug_info.append(f"테트리스 화면: {tetris_frame_stats.stats_text()}")
     debug_info.append("")
     
     for i, ticket in enumerate(waiting_queue[:5], 1):
         user_id = ticket['user_id']
         username = ticket['username']
         
-        member = None
-        found_guild = None
-        
-        member = interaction.guild.get_member(user_id)
-        if member:
-            found_guild = interaction.guild.name
-        else:
-            for guild in bot.guilds:
-                member = guild.get_member(user_id)
-                if member:
-                    found_guild = guild.name
-                    break
+        member = member_resolver.get_member(user_id, interaction.guild)
+        found_guild = member.guild.name if member else None
         
         status = "✅ 발견됨" if member else "❌ 없음"
-        voice_status = "🎤 음성채널 접속" if member and member.voice else "🔇 음성채널 미접속"
+        voice_status = "🎤 음성채널 접속" if voice_presence.is_in_voice(user_id) else "🔇 음성채널 미접속"
         
         debug_info.append(f"**{ticket['number']}번** {username}")
         debug_info.append(f"├ ID: `{user_id}`")
         debug_info.append(f"├ 상태: {status}")
         if found_guild:
             debug_info.append(f"├ 서버: {found_guild}")
-        if member:
-            debug_info.append(f"└ 음성: {voice_status}")
-        else:
-            debug_info.append(f"└ 음성: 확인 불가")
+        debug_info.append(f"└ 음성: {voice_status}")
         debug_info.append("")
     
     embed = discord.Embed(
@@ -0,0 +1,344 @@
+"""
+멤버 이름 인덱스 모듈
+서버별로 표시 이름/사용자명을 casefold 해서 정확 일치 맵과 정렬된 접두사/접미사 목록, 트라이그램 역색인으로 보관하고
+멤버 입장/변경/퇴장 이벤트로 점진적으로 갱신 (전체 멤버 순회 없이 O(1) ~ O(log n) 조회, 순위가 매겨진 유사 검색)
+python member_index.py 로 기존 선형 탐색과의 성능 비교를 확인할 수 있음
+"""
+
+import bisect
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+MATCH_DISPLAY = "display"
+MATCH_PARTIAL = "partial"
+MATCH_NAME = "name"
+
+# 정렬 목록에서 접두사 범위의 끝을 찾기 위한 최댓값 문자
+_MAX_CHAR = "\U0010ffff"
+
+# 유사 검색 점수: 정확 일치 > 접두사 일치 > 부분 일치 > 트라이그램 유사도
+SCORE_EXACT = 3.0
+SCORE_PREFIX = 2.0
+SCORE_SUBSTRING = 1.0
+# 사용자명 일치는 같은 종류의 표시 이름 일치보다 약간 낮게
+NAME_PENALTY = 0.05
+# 이 값 미만의 트라이그램 유사도(Dice 계수)는 후보에서 제외
+MIN_SIMILARITY = 0.3
+# 부분 일치 후보와 트라이그램 공유 개수 상위 후보를 각각 몇 명까지 점수 계산할지
+FUZZY_CANDIDATES = 20
+# 1위와 2위 점수 차이가 이보다 작으면 모호한 결과로 판단
+AMBIGUITY_MARGIN = 0.25
+
+def normalize_name(name: Optional[str]) -> str:
+    return (name or "").casefold()
+
+def trigrams(key: str) -> FrozenSet[str]:
+    """앞뒤를 공백으로 채운 트라이그램 집합 (짧은 한글 이름도 접두사 트라이그램이 생기도록)"""
+    padded = f"  {key} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def _field_score(key: str, query_grams: FrozenSet[str], target: str, target_grams: FrozenSet[str]) -> float:
+    if not target:
+        return 0.0
+    if target == key:
+        return SCORE_EXACT
+    if target.startswith(key):
+        return SCORE_PREFIX + len(key) / len(target)
+    if key in target:
+        return SCORE_SUBSTRING + len(key) / len(target)
+    similarity = 2 * len(query_grams & target_grams) / (len(query_grams) + len(target_grams))
+    return similarity if similarity >= MIN_SIMILARITY else 0.0
+
+def is_ambiguous(results: List[Tuple[object, float]]) -> bool:
+    """검색 결과 1위를 바로 선택하기 어려운지 (후보가 여러 명이고 점수 차이가 작음)"""
+    if len(results) < 2:
+        return False
+    return results[1][1] >= results[0][1] - AMBIGUITY_MARGIN
+
+class MemberNameIndex:
+    """서버 하나의 멤버 이름 인덱스"""
+
+    def __init__(self, members=()):
+        self._members: Dict[int, object] = {}
+        self._keys: Dict[int, Tuple[str, str]] = {}
+        self._display_exact: Dict[str, List[int]] = {}
+        self._name_exact: Dict[str, List[int]] = {}
+        # (접미사, 멤버 ID) 정렬 목록. 접미사 목록에서의 접두사 검색 = 부분 문자열 검색
+        self._suffixes: List[Tuple[str, int]] = []
+        # 트라이그램 → 멤버 ID 역색인과 멤버별 (표시 이름, 사용자명) 트라이그램
+        self._postings: Dict[str, set] = {}
+        self._grams: Dict[int, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        # 초기 생성은 한 번에 모아서 정렬
+        for member in members:
+            display_key = self._add_keys(member)
+            self._suffixes.extend((display_key[start:], member.id) for start in range(len(display_key)))
+        self._suffixes.sort()
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, member_id: int):
+        return member_id in self._members
+
+    def add(self, member):
+        """멤버 추가 (이미 있으면 이름 변경 반영)"""
+        if member.id in self._members:
+            self.remove(member.id)
+
+        display_key = self._add_keys(member)
+        for start in range(len(display_key)):
+            bisect.insort(self._suffixes, (display_key[start:], member.id))
+
+    def _add_keys(self, member) -> str:
+        display_key = normalize_name(member.display_name)
+        name_key = normalize_name(member.name)
+        self._members[member.id] = member
+        self._keys[member.id] = (display_key, name_key)
+        self._display_exact.setdefault(display_key, []).append(member.id)
+        self._name_exact.setdefault(name_key, []).append(member.id)
+
+        grams = (trigrams(display_key), trigrams(name_key))
+        self._grams[member.id] = grams
+        for gram in grams[0] | grams[1]:
+            self._postings.setdefault(gram, set()).add(member.id)
+        return display_key
+
+    def remove(self, member_id: int):
+        """멤버 제거"""
+        member = self._members.pop(member_id, None)
+        if member is None:
+            return None
+
+        display_key, name_key = self._keys.pop(member_id)
+        self._discard(self._display_exact, display_key, member_id)
+        self._discard(self._name_exact, name_key, member_id)
+        display_grams, name_grams = self._grams.pop(member_id)
+        for gram in display_grams | name_grams:
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(member_id)
+                if not ids:
+                    del self._postings[gram]
+        for start in range(len(display_key)):
+            entry = (display_key[start:], member_id)
+            position = bisect.bisect_left(self._suffixes, entry)
+            if position < len(self._suffixes) and self._suffixes[position] == entry:
+                del self._suffixes[position]
+        return member
+
+    def refresh(self, member_id: int):
+        """보관 중인 멤버 객체의 현재 이름으로 다시 색인 (사용자명 변경 이벤트용)"""
+        member = self._members.get(member_id)
+        if member is not None and self._keys[member_id] != (normalize_name(member.display_name), normalize_name(member.name)):
+            self.add(member)
+
+    @staticmethod
+    def _discard(mapping: Dict[str, List[int]], key: str, member_id: int):
+        ids = mapping.get(key)
+        if ids and member_id in ids:
+            ids.remove(member_id)
+            if not ids:
+                del mapping[key]
+
+    def find_display(self, query: str):
+        """표시 이름 정확 일치 (O(1))"""
+        ids = self._display_exact.get(normalize_name(query))
+        return self._members[ids[0]] if ids else None
+
+    def find_name(self, query: str):
+        """사용자명 정확 일치 (O(1))"""
+        ids = self._name_exact.get(normalize_name(query))
+        return self._members[ids[0]] if ids else None
+
+    def find_partial(self, query: str, limit: int = 1) -> list:
+        """표시 이름에 query가 포함된 멤버 (O(log n + limit))"""
+        key = normalize_name(query)
+        if not key:
+            return []
+
+        found = []
+        seen = set()
+        position = bisect.bisect_left(self._suffixes, (key,))
+        end = bisect.bisect_left(self._suffixes, (key + _MAX_CHAR,))
+        while position < end and len(found) < limit:
+            member_id = self._suffixes[position][1]
+            if member_id not in seen:
+                seen.add(member_id)
+                found.append(self._members[member_id])
+            position += 1
+        return found
+
+    def find(self, query: str):
+        """기존 검색 순서(정확한 표시 이름 → 부분 표시 이름 → 사용자명)로 멤버 찾기. (멤버, 일치 종류) 반환"""
+        member = self.find_display(query)
+        if member is not None:
+            return member, MATCH_DISPLAY
+
+        partial = self.find_partial(query)
+        if partial:
+            return partial[0], MATCH_PARTIAL
+
+        member = self.find_name(query)
+        if member is not None:
+            return member, MATCH_NAME
+
+        return None, None
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[object, float]]:
+        """순위가 매겨진 유사 검색. [(멤버, 점수)] 점수 내림차순"""
+        key = normalize_name(query)
+        if not key:
+            return []
+
+        query_grams = trigrams(key)
+        # 후보: 부분 문자열 일치 멤버 + 사용자명 정확 일치 멤버
+        candidates = {member.id for member in self.find_partial(key, limit=FUZZY_CANDIDATES)}
+        candidates.update(self._name_exact.get(key, ()))
+
+        # 부분 일치만으로 결과가 채워지면 점수가 더 낮은 트라이그램 후보는 볼 필요 없음
+        if len(candidates) < limit:
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self._postings.get(gram, ()))
+            candidates.update(member_id for member_id, _ in shared.most_common(FUZZY_CANDIDATES))
+
+        results = []
+        for member_id in candidates:
+            display_key, name_key = self._keys[member_id]
+            display_grams, name_grams = self._grams[member_id]
+            score = max(
+                _field_score(key, query_grams, display_key, display_grams),
+                _field_score(key, query_grams, name_key, name_grams) - NAME_PENALTY
+            )
+            if score > 0:
+                results.append((score, len(display_key), display_key, member_id))
+
+        results.sort(key=lambda item: (-item[0], item[1], item[2]))
+        return [(self._members[member_id], score) for score, _, _, member_id in results[:limit]]
+
+class MemberIndexRegistry:
+    """서버 ID별 멤버 이름 인덱스 (멤버 이벤트로 갱신)"""
+
+    def __init__(self):
+        self._indexes: Dict[int, MemberNameIndex] = {}
+
+    def build(self, guild) -> MemberNameIndex:
+        """서버 멤버 목록으로 인덱스를 새로 생성 (준비 완료 시 한 번)"""
+        index = MemberNameIndex(guild.members)
+        self._indexes[guild.id] = index
+        return index
+
+    def get(self, guild) -> MemberNameIndex:
+        index = self._indexes.get(guild.id)
+        if index is None:
+            index = self.build(guild)
+        return index
+
+    def find(self, guild, query: str):
+        return self.get(guild).find(query)
+
+    def search(self, guild, query: str, limit: int = 5):
+        return self.get(guild).search(query, limit)
+
+    def drop(self, guild_id: int):
+        self._indexes.pop(guild_id, None)
+
+    def on_member_join(self, member):
+        index = self._indexes.get(member.guild.id)
+        if index is not None:
+            index.add(member)
+
+    def on_member_update(self, before, after):
+        index = self._indexes.get(after.guild.id)
+        if index is not None and (before.display_name != after.display_name or before.name != after.name):
+            index.add(after)
+
+    def on_member_remove(self, member):
+        index = self._indexes.get(member.guild.id)
+        if index is not None:
+            index.remove(member.id)
+
+    def on_user_update(self, before, after):
+        """전역 사용자명 변경: 해당 사용자가 있는 모든 서버 인덱스 갱신"""
+        if before.name == after.name and before.display_name == after.display_name:
+            return
+        for index in self._indexes.values():
+            if after.id in index:
+                index.refresh(after.id)
+
+    def stats_text(self) -> str:
+        return f"{len(self._indexes)}개 서버, {sum(len(index) for index in self._indexes.values())}명 색인"
+
+# ========================================
+# 성능 비교
+# ========================================
+
+def _linear_find(members, query):
+    """기존 방식: 전체 멤버를 최대 세 번 순회"""
+    for member in members:
+        if member.display_name.lower() == query.lower():
+            return member
+    for member in members:
+        if query.lower() in member.display_name.lower():
+            return member
+    for member in members:
+        if member.name.lower() == query.lower():
+            return member
+    return None
+
+if __name__ == "__main__":
+    import random
+    import string
+    import time
+    from types import SimpleNamespace
+
+    rng = random.Random(42)
+    syllables = ["김", "이", "박", "최", "정", "민", "서", "준", "지", "현", "우", "연", "수", "하", "윤"]
+
+    def random_name():
+        if rng.random() < 0.5:
+            return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        return "".join(rng.choice(string.ascii_letters) for _ in range(rng.randint(4, 12)))
+
+    member_count = 5000
+    members = [
+        SimpleNamespace(id=1000 + i, display_name=random_name(), name=random_name().lower())
+        for i in range(member_count)
+    ]
+    queries = [rng.choice(members).display_name for _ in range(300)]
+    queries += [rng.choice(members).display_name[1:3] for _ in range(300)]
+    queries += [rng.choice(members).name for _ in range(300)]
+    queries += ["존재하지않는사용자"] * 100
+
+    started = time.perf_counter()
+    index = MemberNameIndex(members)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    linear_results = [_linear_find(members, query) for query in queries]
+    linear_us = (time.perf_counter() - started) / len(queries) * 1e6
+
+    started = time.perf_counter()
+    index_results = [index.find(query)[0] for query in queries]
+    index_us = (time.perf_counter() - started) / len(queries) * 1e6
+
+    # 부분 일치는 여러 후보 중 다른 멤버를 고를 수 있으므로 일치 여부만 비교
+    agree = sum(1 for a, b in zip(linear_results, index_results) if (a is None) == (b is None))
+
+    # 오타가 섞인 검색어로 유사 검색
+    typo_queries = []
+    for _ in range(300):
+        name = rng.choice(members).display_name
+        position = rng.randrange(len(name))
+        typo_queries.append(name[:position] + rng.choice(syllables) + name[position + 1:])
+
+    started = time.perf_counter()
+    search_results = [index.search(query) for query in queries + typo_queries]
+    search_us = (time.perf_counter() - started) / len(search_results) * 1e6
+
+    print(f"📊 멤버 {member_count}명, 조회 {len(queries)}회")
+    print(f"   인덱스 생성: {build_ms:.1f}ms")
+    print(f"   선형 탐색: 조회당 {linear_us:.1f}µs")
+    print(f"   인덱스 조회: 조회당 {index_us:.1f}µs ({linear_us / max(index_us, 1e-9):.0f}배)")
+    print(f"   결과 유무 일치: {agree}/{len(queries)}")
+    print(f"   유사 검색(상위 5명): 조회당 {search_us:.1f}µs, 오타 포함 {len(typo_queries)}회")
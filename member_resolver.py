@@ -0,0 +1,111 @@
+"""
+멤버 조회 모듈
+사용자 ID로 서버 멤버/사용자 객체를 찾는 경로를 하나로 모으고
+사용자별 소속 서버(홈 서버)를 LRU + TTL 캐시에 기억해 모든 서버를 다시 뒤지지 않도록 처리
+캐시와 클라이언트 캐시에 모두 없을 때만 API(fetch_user)를 호출
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+class MemberResolver:
+    """사용자 ID → 멤버/사용자 조회 서비스 (적중/미스/API 호출 횟수 집계)"""
+
+    def __init__(self, client=None, max_entries: int = 512, ttl: float = 300.0):
+        self.client = client
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # user_id → (홈 서버 ID 또는 None, API로 가져온 사용자 객체 또는 None, 만료 시각)
+        self._cache: "OrderedDict[int, tuple]" = OrderedDict()
+
+        # hits/misses는 자체 캐시(홈 서버 기억) 기준, 지정 서버에서 바로 찾은 경우는 따로 집계
+        self.guild_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.api_calls = 0
+
+    def bind(self, client):
+        self.client = client
+
+    def _lookup(self, user_id: int) -> Optional[tuple]:
+        entry = self._cache.get(user_id)
+        if entry is None:
+            return None
+        if entry[2] < time.monotonic():
+            del self._cache[user_id]
+            return None
+        self._cache.move_to_end(user_id)
+        return entry
+
+    def _store(self, user_id: int, guild_id: Optional[int] = None, user=None):
+        self._cache[user_id] = (guild_id, user, time.monotonic() + self.ttl)
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def get_member(self, user_id: int, *preferred_guilds):
+        """멤버 찾기: 지정한 서버 → 기억해 둔 홈 서버 → 전체 서버 순 (API 호출 없음)"""
+        if isinstance(user_id, str):
+            user_id = int(user_id)
+
+        for guild in preferred_guilds:
+            if guild is None:
+                continue
+            member = guild.get_member(user_id)
+            if member is not None:
+                self.guild_hits += 1
+                self._store(user_id, guild.id)
+                return member
+
+        entry = self._lookup(user_id)
+        if entry is not None and entry[0] is not None and self.client is not None:
+            guild = self.client.get_guild(entry[0])
+            member = guild.get_member(user_id) if guild else None
+            if member is not None:
+                self.hits += 1
+                return member
+
+        self.misses += 1
+        if self.client is None:
+            return None
+        for guild in self.client.guilds:
+            member = guild.get_member(user_id)
+            if member is not None:
+                self._store(user_id, guild.id)
+                return member
+        return None
+
+    async def fetch_user(self, user_id: int, *preferred_guilds):
+        """DM 전송용 사용자 객체: 멤버 → 클라이언트 사용자 캐시 → 캐시된 API 결과 → API 순"""
+        if isinstance(user_id, str):
+            user_id = int(user_id)
+
+        member = self.get_member(user_id, *preferred_guilds)
+        if member is not None:
+            return member
+
+        entry = self._lookup(user_id)
+        if entry is not None and entry[1] is not None:
+            self.hits += 1
+            return entry[1]
+
+        if self.client is None:
+            return None
+        user = self.client.get_user(user_id)
+        if user is None:
+            self.api_calls += 1
+            user = await self.client.fetch_user(user_id)
+        if user is not None:
+            self._store(user_id, user=user)
+        return user
+
+    def forget(self, user_id: int, guild_id: Optional[int] = None):
+        """멤버 퇴장 시 해당 서버를 홈 서버로 기억하고 있으면 제거"""
+        entry = self._cache.get(user_id)
+        if entry is not None and (guild_id is None or entry[0] == guild_id):
+            del self._cache[user_id]
+
+    def stats_text(self) -> str:
+        return (f"캐시 {len(self._cache)}명, 지정 서버에서 찾음 {self.guild_hits}회, "
+                f"캐시 적중 {self.hits}회 / 미스 {self.misses}회, API 호출 {self.api_calls}회")
@@ -0,0 +1,129 @@
+"""
+사전 호출 알림 모듈
+대기열 앞쪽에 가까워진 번호표 보유자에게 "곧 차례" 알림을 묶어서 전송
+대기열 변경 시 알림 대상만 등록하고, 실제 전송은 별도 태스크에서 속도 제한을 지키며 처리
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+class GapStats:
+    """상담 사이 공백 시간 통계"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+class PreCallNotifier:
+    """대기 순서가 가까워진 사용자에게 알림 (일괄 처리 + 속도 제한)"""
+
+    def __init__(self,
+                 send_dm: Callable[[Dict, int], Awaitable[bool]],
+                 send_channel_batch: Callable[[List[Tuple[Dict, int]]], Awaitable[bool]],
+                 lead: int = 2,
+                 batch_window: float = 1.0,
+                 min_interval: float = 0.5):
+        self.send_dm = send_dm
+        self.send_channel_batch = send_channel_batch
+        # 앞에서 몇 번째까지 알림을 보낼지 (0이면 비활성화)
+        self.lead = lead
+        self.batch_window = batch_window
+        # DM 사이 최소 간격 (초)
+        self.min_interval = min_interval
+
+        self._pending: Dict[tuple, Tuple[Dict, int]] = {}
+        self._notified = set()
+        # 최근 대기열 기준 번호표별 순서
+        self._positions: Dict[tuple, int] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {"dm_sent": 0, "dm_failed": 0, "channel_mentions": 0, "batches": 0}
+        self.gap_notified = GapStats()
+        self.gap_not_notified = GapStats()
+
+    @staticmethod
+    def _key(ticket: Dict) -> tuple:
+        # 노쇼로 대기열 뒤로 이동한 번호표는 다시 알림
+        return (ticket['number'], ticket.get('no_show_count', 0))
+
+    def update(self, waiting: List[Dict]):
+        """대기열 변경 반영 (대기 중인 번호표만, 처리 순서대로). 즉시 반환"""
+        if self.lead <= 0:
+            return
+
+        self._positions = {self._key(ticket): position for position, ticket in enumerate(waiting, 1)}
+        self._notified &= self._positions.keys()
+        for key in list(self._pending):
+            if key not in self._positions:
+                del self._pending[key]
+
+        for position, ticket in enumerate(waiting[:self.lead], 1):
+            key = self._key(ticket)
+            if key not in self._notified and key not in self._pending:
+                self._pending[key] = (ticket, position)
+
+        if self._pending:
+            self._ensure_running()
+            self._wakeup.set()
+
+    def was_notified(self, ticket: Dict) -> bool:
+        return self._key(ticket) in self._notified
+
+    def record_gap(self, seconds: float, notified: bool):
+        """이전 상담 완료부터 다음 상담 시작까지의 공백 기록"""
+        (self.gap_notified if notified else self.gap_not_notified).add(seconds)
+
+    def _ensure_running(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            # 짧은 시간 동안 들어온 변경을 모아서 처리
+            await asyncio.sleep(self.batch_window)
+            batch = list(self._pending.items())
+            self._pending.clear()
+            if not batch:
+                continue
+
+            self.stats["batches"] += 1
+            fallback = []
+            for key, (ticket, position) in batch:
+                # 대기 중 상담이 시작되었거나 취소된 번호표는 건너뜀
+                if key not in self._positions:
+                    continue
+                position = self._positions[key]
+                self._notified.add(key)
+                try:
+                    sent = await self.send_dm(ticket, position)
+                except Exception as e:
+                    print(f"❌ 사전 호출 DM 오류: {e}")
+                    sent = False
+                if sent:
+                    self.stats["dm_sent"] += 1
+                else:
+                    self.stats["dm_failed"] += 1
+                    fallback.append((ticket, position))
+                await asyncio.sleep(self.min_interval)
+
+            # DM 실패 사용자는 채널 메시지 하나로 묶어서 멘션
+            if fallback:
+                try:
+                    if await self.send_channel_batch(fallback):
+                        self.stats["channel_mentions"] += len(fallback)
+                except Exception as e:
+                    print(f"❌ 사전 호출 채널 알림 오류: {e}")
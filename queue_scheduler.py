@@ -0,0 +1,248 @@
+"""
+상담 대기열 스케줄러 모듈
+힙 기반으로 다음 상담 번호표를 선택하는 정책들 (FIFO, 종류별 라운드로빈, 에이징 우선순위)
+python queue_scheduler.py 로 정책별 시뮬레이션 결과를 확인할 수 있음
+"""
+
+import heapq
+import itertools
+import random
+import time
+from typing import Dict, List, Optional
+
+POLICY_FIFO = "fifo"
+POLICY_ROUND_ROBIN = "round_robin"
+POLICY_AGING = "aging"
+
+POLICIES = {
+    POLICY_FIFO: "선착순",
+    POLICY_ROUND_ROBIN: "상담 종류별 순환",
+    POLICY_AGING: "에이징 우선순위"
+}
+
+# 관리자 우선순위 지정 번호표는 정책과 관계없이 먼저 처리
+TIER_BUMPED = 0
+TIER_NORMAL = 1
+
+class ConsultationScheduler:
+    """힙 기반 상담 대기열 스케줄러 (push/pop/remove O(log n))"""
+
+    def __init__(self, policy: str = POLICY_FIFO, aging_head_start: Optional[Dict[str, float]] = None):
+        if policy not in POLICIES:
+            print(f"⚠️ 알 수 없는 대기열 정책 '{policy}', 선착순으로 동작합니다.")
+            policy = POLICY_FIFO
+        self.policy = policy
+        # 에이징 정책: 상담 종류별 선행 가산 시간 (초). 모든 번호표가 같은 속도로 나이를 먹으므로
+        # 어떤 종류도 가산 시간 이상 밀려나지 않음 (기아 방지)
+        self.aging_head_start = aging_head_start or {}
+
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}
+        self._seq = itertools.count()
+
+        # 라운드로빈 상태
+        self._next_round: Dict[str, int] = {}
+        self._served_round = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _policy_key(self, ticket: Dict, arrival: float, seq: int):
+        if self.policy == POLICY_ROUND_ROBIN:
+            consultation_type = ticket['type']
+            round_index = max(self._next_round.get(consultation_type, 0), self._served_round)
+            self._next_round[consultation_type] = round_index + 1
+            return (round_index, seq)
+        if self.policy == POLICY_AGING:
+            return (arrival - self.aging_head_start.get(ticket['type'], 0), seq)
+        return (seq,)
+
+    def push(self, ticket: Dict, arrival: Optional[float] = None):
+        """번호표 추가"""
+        if arrival is None:
+            arrival = time.time()
+        seq = next(self._seq)
+        key = (TIER_NORMAL, self._policy_key(ticket, arrival, seq))
+        entry = [key, ticket['number'], ticket, True]
+        self._entries[ticket['number']] = entry
+        heapq.heappush(self._heap, entry)
+
+    def push_back(self, ticket: Dict):
+        """번호표를 현재 대기 중인 모든 일반 번호표 뒤로 추가 (노쇼 재등록용, 정책과 관계없이 맨 뒤)"""
+        last = max((entry[0][1] for entry in self._entries.values() if entry[0][0] == TIER_NORMAL), default=None)
+        if last is None or self.policy == POLICY_FIFO:
+            self.push(ticket)
+            return
+        seq = next(self._seq)
+        if self.policy == POLICY_ROUND_ROBIN:
+            round_index = max(last[0], self._served_round)
+            consultation_type = ticket['type']
+            self._next_round[consultation_type] = max(self._next_round.get(consultation_type, 0), round_index + 1)
+            policy_key = (round_index, seq)
+        else:
+            # 에이징: 가산 시간을 다시 받지 않도록 가장 늦은 키와 같은 값에 더 큰 순번을 붙임
+            policy_key = (last[0], seq)
+        entry = [(TIER_NORMAL, policy_key), ticket['number'], ticket, True]
+        self._entries[ticket['number']] = entry
+        heapq.heappush(self._heap, entry)
+
+    def remove(self, number: int) -> Optional[Dict]:
+        """번호표 제거 (지연 삭제)"""
+        entry = self._entries.pop(number, None)
+        if entry is None:
+            return None
+        entry[3] = False
+        return entry[2]
+
+    def bump(self, number: int) -> bool:
+        """관리자 우선순위 지정: 해당 번호표를 다른 일반 번호표보다 먼저 처리"""
+        entry = self._entries.get(number)
+        if entry is None or entry[0][0] == TIER_BUMPED:
+            return False
+        entry[3] = False
+        bumped = [(TIER_BUMPED, (next(self._seq),)), number, entry[2], True]
+        self._entries[number] = bumped
+        heapq.heappush(self._heap, bumped)
+        return True
+
+    def _discard_invalid(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+    def peek(self) -> Optional[Dict]:
+        """다음 번호표 확인"""
+        self._discard_invalid()
+        return self._heap[0][2] if self._heap else None
+
+    def pop(self) -> Optional[Dict]:
+        """다음 번호표 꺼내기"""
+        self._discard_invalid()
+        if not self._heap:
+            return None
+        entry = heapq.heappop(self._heap)
+        del self._entries[entry[1]]
+        if self.policy == POLICY_ROUND_ROBIN and entry[0][0] == TIER_NORMAL:
+            self._served_round = max(self._served_round, entry[0][1][0])
+        return entry[2]
+
+    def ordered(self) -> List[Dict]:
+        """처리 순서대로 정렬된 번호표 목록 (표시용)"""
+        return [entry[2] for entry in sorted(self._entries.values())]
+
+    def clear(self):
+        """전체 초기화"""
+        self._heap.clear()
+        self._entries.clear()
+        self._next_round.clear()
+        self._served_round = 0
+
+def parse_head_start(value: Optional[str]) -> Dict[str, float]:
+    """'career:600,study:300' 형식의 에이징 가산 시간 설정 파싱"""
+    head_start = {}
+    if not value:
+        return head_start
+    for part in value.split(','):
+        if ':' not in part:
+            continue
+        consultation_type, seconds = part.split(':', 1)
+        try:
+            head_start[consultation_type.strip()] = float(seconds)
+        except ValueError:
+            print(f"⚠️ 잘못된 에이징 설정 무시: {part}")
+    return head_start
+
+# ========================================
+# 시뮬레이션
+# ========================================
+
+def generate_synthetic_trace(count=500, seed=42, mean_interarrival=300.0, type_weights=None, mean_service=None):
+    """합성 도착 기록 생성: (도착 시각, 상담 종류, 상담 시간) 목록"""
+    rng = random.Random(seed)
+    type_weights = type_weights or {"career": 0.55, "study": 0.25, "project": 0.15, "other": 0.05}
+    mean_service = mean_service or {"career": 300.0, "study": 180.0, "project": 360.0, "other": 120.0}
+    types = list(type_weights.keys())
+    weights = list(type_weights.values())
+
+    trace = []
+    now = 0.0
+    for _ in range(count):
+        now += rng.expovariate(1 / mean_interarrival)
+        consultation_type = rng.choices(types, weights)[0]
+        service = rng.expovariate(1 / mean_service[consultation_type])
+        trace.append((now, consultation_type, service))
+    return trace
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p * (len(ordered) - 1)))))
+    return ordered[index]
+
+def simulate(policy, trace, aging_head_start=None):
+    """상담사 1명 기준으로 도착 기록을 재생하고 대기 시간 통계 반환"""
+    scheduler = ConsultationScheduler(policy, aging_head_start)
+    waits = []
+    waits_by_type: Dict[str, List[float]] = {}
+
+    now = 0.0
+    index = 0
+    while index < len(trace) or len(scheduler):
+        # 현재 시각까지 도착한 번호표 추가
+        while index < len(trace) and trace[index][0] <= now:
+            arrival, consultation_type, service = trace[index]
+            scheduler.push({'number': index, 'type': consultation_type, 'arrival': arrival, 'service': service}, arrival)
+            index += 1
+
+        ticket = scheduler.pop()
+        if ticket is None:
+            now = trace[index][0]
+            continue
+
+        wait = now - ticket['arrival']
+        waits.append(wait)
+        waits_by_type.setdefault(ticket['type'], []).append(wait)
+        now += ticket['service']
+
+    return {
+        "policy": policy,
+        "mean": sum(waits) / len(waits) if waits else 0.0,
+        "p95": _percentile(waits, 0.95),
+        "by_type": {
+            consultation_type: {
+                "mean": sum(values) / len(values),
+                "p95": _percentile(values, 0.95)
+            }
+            for consultation_type, values in waits_by_type.items()
+        }
+    }
+
+def simulate_policies(trace=None, aging_head_start=None):
+    """모든 정책에 대해 시뮬레이션 실행"""
+    trace = trace or generate_synthetic_trace()
+    return [simulate(policy, trace, aging_head_start) for policy in POLICIES]
+
+def check_push_back(aging_head_start=None):
+    """모든 정책에서 push_back한 번호표가 기존 대기자보다 뒤에 오는지 확인"""
+    aging_head_start = aging_head_start or {"career": 600.0}
+    for policy in POLICIES:
+        scheduler = ConsultationScheduler(policy, aging_head_start)
+        now = time.time()
+        scheduler.push({'number': 1, 'type': 'career'}, now - 10)
+        scheduler.push({'number': 2, 'type': 'study'}, now - 5)
+        requeued = scheduler.pop()
+        scheduler.push_back(requeued)
+        order = [ticket['number'] for ticket in scheduler.ordered()]
+        assert order == [2, requeued['number']], f"{policy}: push_back 후 순서 {order}"
+        assert scheduler.pop()['number'] == 2 and scheduler.pop() is requeued, f"{policy}: pop 순서 불일치"
+
+if __name__ == "__main__":
+    head_start = {"career": 600.0}
+    check_push_back(head_start)
+    print("✅ push_back 순서 확인 완료 (모든 정책)")
+    print(f"📊 대기열 정책 시뮬레이션 (에이징 가산 시간: {head_start})")
+    for result in simulate_policies(aging_head_start=head_start):
+        print(f"\n• {POLICIES[result['policy']]} ({result['policy']})")
+        print(f"   평균 대기: {result['mean'] / 60:.1f}분, p95 대기: {result['p95'] / 60:.1f}분")
+        for consultation_type, stats in sorted(result['by_type'].items()):
+            print(f"   - {consultation_type}: 평균 {stats['mean'] / 60:.1f}분, p95 {stats['p95'] / 60:.1f}분")
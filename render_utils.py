@@ -0,0 +1,254 @@
+"""
+화면 갱신 유틸리티 모듈
+여러 번의 갱신 요청을 하나로 합쳐 일정 간격 이상으로만 다시 그리도록 처리하고,
+화면에 보이는 내용이 바뀌지 않은 수정 요청은 건너뜀
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+class CoalescingRefresher:
+    """갱신 요청을 모아서 최소 간격마다 최대 한 번, 한 번에 하나씩만 렌더링"""
+
+    def __init__(self, render: Callable[..., Awaitable], min_interval: float = 2.0, name: str = "refresher"):
+        self.render = render
+        self.min_interval = min_interval
+        self.name = name
+
+        self._dirty = False
+        self._options: Dict[str, bool] = {}
+        self._last_render = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.requested = 0
+        self.performed = 0
+
+    def request(self, **options):
+        """갱신 요청 (즉시 반환). 옵션은 다음 렌더링에 합쳐서 전달"""
+        self.requested += 1
+        self._dirty = True
+        for key, value in options.items():
+            self._options[key] = self._options.get(key, False) or value
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._dirty:
+                delay = self._last_render + self.min_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # 렌더링 직전 상태를 사용하도록 플래그를 먼저 내림
+                self._dirty = False
+                options, self._options = self._options, {}
+                self._last_render = time.monotonic()
+                try:
+                    await self.render(**options)
+                    self.performed += 1
+                except Exception as e:
+                    print(f"❌ {self.name} 갱신 실패: {e}")
+
+    def stats_text(self) -> str:
+        return f"요청 {self.requested}회 / 실제 {self.performed}회"
+
+class FrameStats:
+    """여러 FrameRenderer가 함께 쓰는 전송 통계"""
+
+    def __init__(self):
+        self.sent = 0
+        self.superseded = 0
+        self.rate_limited = 0
+        self.latency = 0.0
+
+    def record_latency(self, latency: float):
+        self.latency = latency if not self.sent else self.latency * 0.8 + latency * 0.2
+
+    def stats_text(self) -> str:
+        return (f"전송 {self.sent}회 / 대체되어 생략 {self.superseded}회, "
+                f"속도 제한(추정) {self.rate_limited}회, 평균 수정 지연 {self.latency * 1000:.0f}ms")
+
+class FrameRenderer:
+    """게임 하나의 화면 전송기: 최신 프레임만 유지하고 수정 지연/속도 제한에 맞춰 간격 조절
+
+    request()는 즉시 반환하며, 전송 시점에 send()가 최신 상태로 화면을 만들기 때문에
+    전송 전에 들어온 이전 요청은 자연스럽게 버려짐.
+    discord.py는 429 응답을 HTTP 클라이언트 안에서 기다렸다가 재시도하므로 예외가 거의 올라오지 않음.
+    그래서 재시도 대기까지 포함한 수정 소요 시간이 slow_threshold 이상이면 속도 제한으로 보고 간격을 두 배로 늘림
+    (RateLimited 예외는 max_ratelimit_timeout을 설정한 경우에만 발생)
+    """
+
+    def __init__(self, send: Callable[[], Awaitable], min_interval: float = 1.0, max_interval: float = 5.0,
+                 stats: Optional[FrameStats] = None, name: str = "frame", slow_threshold: float = 1.0):
+        self.send = send
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.slow_threshold = slow_threshold
+        self.stats = stats or FrameStats()
+        self.name = name
+
+        self.interval = min_interval
+        self.latency = 0.0
+        self.in_flight = False
+        self._dirty = False
+        self._last_sent = 0.0
+        self._resume_at = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def busy(self) -> bool:
+        """전송 중이거나 보낼 프레임이 남아 있으면 True"""
+        return self.in_flight or self._dirty
+
+    def request(self):
+        """새 프레임 요청 (아직 보내지 않은 이전 프레임은 대체)"""
+        if self._closed:
+            return
+        if self._dirty:
+            self.stats.superseded += 1
+        self._dirty = True
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    def begin_external(self) -> bool:
+        """다른 경로(상호작용 응답)로 직접 보내기 시작. 전송 중이거나 남은 프레임이 있으면 False"""
+        if self.busy or self._closed:
+            return False
+        self.in_flight = True
+        return True
+
+    def end_external(self, sent: bool):
+        """직접 전송 종료. 전송 중에 들어온 요청은 버리지 않고 이어서 전송"""
+        self.in_flight = False
+        if sent:
+            self._last_sent = time.monotonic()
+            self.stats.sent += 1
+        if self._dirty and self._wakeup is not None:
+            self._wakeup.set()
+
+    def close(self):
+        """게임 종료: 남은 프레임 폐기 및 전송 태스크 중지"""
+        self._closed = True
+        self._dirty = False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    @staticmethod
+    def _is_rate_limited(error: Exception) -> bool:
+        return getattr(error, "status", None) == 429 or error.__class__.__name__ == "RateLimited"
+
+    async def _run(self):
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._dirty and not self._closed:
+                delay = max(self._last_sent + self.interval, self._resume_at) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # 직접 전송이 진행 중이면 끝난 뒤(end_external) 다시 깨어나 최신 프레임 전송
+                if self.in_flight:
+                    break
+
+                # 전송 직전 상태를 사용하도록 플래그를 먼저 내림
+                self._dirty = False
+                self.in_flight = True
+                started = time.monotonic()
+                try:
+                    await self.send()
+                except Exception as e:
+                    if not self._is_rate_limited(e):
+                        print(f"❌ {self.name} 화면 전송 실패: {e}")
+                        continue
+                    # 속도 제한: 간격을 늘리고 대기 후 최신 프레임으로 다시 시도
+                    self.stats.rate_limited += 1
+                    self.interval = min(self.max_interval, self.interval * 2)
+                    retry_after = getattr(e, "retry_after", None) or self.interval
+                    self._resume_at = time.monotonic() + retry_after
+                    self._dirty = True
+                    continue
+                finally:
+                    self.in_flight = False
+
+                # 수정 지연이 길어지면 간격을 늘리고, 빨라지면 천천히 줄임
+                latency = time.monotonic() - started
+                self.latency = latency if not self.latency else self.latency * 0.7 + latency * 0.3
+                if latency >= self.slow_threshold:
+                    # 라이브러리 내부의 429 재시도 대기가 포함된 것으로 보고 크게 물러남
+                    self.stats.rate_limited += 1
+                    self.interval = min(self.max_interval, max(self.interval * 2, latency))
+                else:
+                    self.interval = min(self.max_interval, max(self.min_interval, self.latency * 1.5, self.interval * 0.8))
+                self._last_sent = time.monotonic()
+                self.stats.record_latency(latency)
+                self.stats.sent += 1
+
+def embed_fingerprint(embed) -> str:
+    """임베드의 표시 내용 지문 (타임스탬프 제외)"""
+    if embed is None:
+        return "none"
+    data = embed.to_dict()
+    data.pop("timestamp", None)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+def view_fingerprint(view) -> str:
+    """뷰 컴포넌트의 표시 내용 지문 (자동 생성 custom_id 제외)"""
+    if view is None:
+        return "none"
+    components = []
+    for item in view.children:
+        data = item.to_component_dict()
+        data.pop("custom_id", None)
+        components.append((item.row, data))
+    return json.dumps(components, sort_keys=True, ensure_ascii=False, default=str)
+
+class RenderDiffer:
+    """메시지별 마지막 렌더링 지문을 기억하고 변경이 없으면 수정 요청을 건너뜀"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._fingerprints: "OrderedDict[Hashable, int]" = OrderedDict()
+        self.sent = 0
+        self.skipped = 0
+
+    def changed(self, key: Hashable, embed=None, view=None) -> bool:
+        """표시 내용이 바뀌었으면 True (지문 갱신), 같으면 False"""
+        fingerprint = hash((embed_fingerprint(embed), view_fingerprint(view)))
+        if self._fingerprints.get(key) == fingerprint:
+            self._fingerprints.move_to_end(key)
+            self.skipped += 1
+            return False
+
+        self._fingerprints[key] = fingerprint
+        self._fingerprints.move_to_end(key)
+        while len(self._fingerprints) > self.max_entries:
+            self._fingerprints.popitem(last=False)
+        self.sent += 1
+        return True
+
+    def forget(self, key: Hashable):
+        """메시지가 삭제되었거나 게임이 끝났을 때 지문 제거"""
+        self._fingerprints.pop(key, None)
+
+    def stats_text(self) -> str:
+        return f"수정 {self.sent}회 / 생략 {self.skipped}회 (API 호출 {self.skipped}회 절약)"
+
+# 모든 모듈이 함께 사용하는 렌더링 비교기
+render_differ = RenderDiffer()
@@ -10,6 +10,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, List
 
+from render_utils import render_differ
+
 class GameState(Enum):
     WAITING = "waiting"
     PLAYING = "playing" 
@@ -174,6 +176,7 @@ class RockPaperScissorsView(discord.ui.View):
         self.host_id = host_id
         self.message = None
         self.record_callback = record_callback  # 기록 저장 콜백 함수
+        self.render_key = ('rps', id(self))  # 화면 변경 비교용 키
         
         # 초기에는 참가 버튼만 표시
         self.setup_waiting_buttons()
@@ -345,13 +348,18 @@ class RockPaperScissorsView(discord.ui.View):
         return embed
     
     async def update_display(self):
-        """화면 업데이트"""
+        """화면 업데이트 (표시 내용이 바뀐 경우만)"""
         if self.message:
             embed = self.create_embed()
+            if not render_differ.changed(self.render_key, embed, self):
+                return
             try:
                 await self.message.edit(embed=embed, view=self)
             except (discord.NotFound, discord.HTTPException):
-                pass
+                render_differ.forget(self.render_key)
+            except BaseException:
+                render_differ.forget(self.render_key)
+                raise
     
     async def save_game_record(self, reason="completed"):
         """게임 기록 저장"""
@@ -396,6 +404,7 @@ class RockPaperScissorsView(discord.ui.View):
     
     async def on_timeout(self):
         """타임아웃 처리"""
+        render_differ.forget(self.render_key)
         # 게임이 진행 중이었다면 기록 저장
         if self.game.state == GameState.PLAYING and self.game.opponent_id:
             await self.save_game_record("timeout")
@@ -447,6 +456,7 @@ class JoinGameButton(discord.ui.Button):
             view.setup_playing_buttons()
             embed = view.create_embed()
             await interaction.response.edit_message(embed=embed, view=view)
+            render_differ.changed(view.render_key, embed, view)  # 수정 성공 후 지문 기록
             
             # 게임 시작 안내
             await interaction.followup.send(
@@ -495,6 +505,10 @@ class ChoiceButton(discord.ui.Button):
                     view.clear_items()
                 
                 await view.update_display()
+                
+                if view.game.state == GameState.FINISHED:
+                    # 종료 화면 이후로는 수정하지 않으므로 지문 정리
+                    render_differ.forget(view.render_key)
             else:
                 # 상대방 선택 대기
                 await view.update_display()
@@ -534,6 +548,7 @@ class QuitGameButton(discord.ui.Button):
         
         # 게임 기록 저장
         await view.save_game_record("quit")
+        render_differ.forget(view.render_key)
         
         view.clear_items()
         
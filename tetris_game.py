@@ -1,9 +1,11 @@
 import discord
-import asyncio
+import os
 import random
+import time
 from datetime import datetime
-from typing import List, Tuple, Optional
-from enum import Enum
+
+from game_clock import GameClock
+from render_utils import FrameRenderer, FrameStats, render_differ
 
 # 테트리스 조각 정의
 TETROMINOES = {
@@ -118,6 +120,58 @@ TETROMINOES = {
     ]
 }
 
+# 조각 종류 순서 (색상 번호 = 순서 + 1)
+PIECE_SHAPES = tuple(TETROMINOES.keys())
+SHAPE_IDS = {shape: index + 1 for index, shape in enumerate(PIECE_SHAPES)}
+
+# 색상 번호 → 표시 이모지
+CELL_EMOJIS = {
+    0: '⬛',  # 빈 공간
+    1: '🟦',  # I 조각 (파랑)
+    2: '🟨',  # O 조각 (노랑)
+    3: '🟪',  # T 조각 (보라)
+    4: '🟩',  # S 조각 (초록)
+    5: '🟥',  # Z 조각 (빨강)
+    6: '🟫',  # J 조각 (갈색)
+    7: '🟧',  # L 조각 (주황)
+    8: '🔳'   # 고스트 (착지 위치 미리보기)
+}
+GHOST_CELL = 8
+SHAPE_EMOJIS = {shape: CELL_EMOJIS[shape_id] for shape, shape_id in SHAPE_IDS.items()}
+
+def compile_piece_tables():
+    """문자열 템플릿을 조각/회전별 블록 오프셋 튜플, 경계 상자 (min_x, min_y, max_x, max_y),
+    바닥 윤곽 ((열 오프셋, 그 열의 가장 아래 블록 y), ...)으로 변환"""
+    cells = {}
+    bounds = {}
+    bottoms = {}
+    for shape, rotations in TETROMINOES.items():
+        shape_cells = []
+        shape_bounds = []
+        shape_bottoms = []
+        for template in rotations:
+            offsets = tuple(
+                (x, y)
+                for y, row in enumerate(template)
+                for x, cell in enumerate(row)
+                if cell == '#'
+            )
+            xs = [x for x, _ in offsets]
+            ys = [y for _, y in offsets]
+            lowest = {}
+            for x, y in offsets:
+                lowest[x] = max(lowest.get(x, y), y)
+            shape_cells.append(offsets)
+            shape_bounds.append((min(xs), min(ys), max(xs), max(ys)))
+            shape_bottoms.append(tuple(sorted(lowest.items())))
+        cells[shape] = tuple(shape_cells)
+        bounds[shape] = tuple(shape_bounds)
+        bottoms[shape] = tuple(shape_bottoms)
+    return cells, bounds, bottoms
+
+# 실행 중에는 문자열 파싱 없이 이 표만 사용
+PIECE_CELLS, PIECE_BOUNDS, PIECE_BOTTOMS = compile_piece_tables()
+
 class TetrisGame:
     """테트리스 게임 로직"""
     
@@ -125,6 +179,8 @@ class TetrisGame:
         self.width = width
         self.height = height
         self.board = [[0 for _ in range(width)] for _ in range(height)]
+        # 열별 가장 위 블록의 행 번호 (빈 열이면 height)
+        self.column_tops = [height] * width
         
         # 게임 상태
         self.score = 0
@@ -133,6 +189,7 @@ class TetrisGame:
         self.fall_time = 0
         self.fall_speed = 500  # 밀리초
         self.start_time = datetime.now()  # 게임 시작 시간
+        self.last_fall_at = time.monotonic()  # 마지막 자동 낙하 기준 시각 (monotonic)
         
         # 현재 조각
         self.current_piece = self.get_new_piece()
@@ -144,7 +201,7 @@ class TetrisGame:
     
     def get_new_piece(self):
         """새로운 테트리스 조각 생성"""
-        shape = random.choice(list(TETROMINOES.keys()))
+        shape = random.choice(PIECE_SHAPES)
         return {
             'shape': shape,
             'rotation': 0,
@@ -154,35 +211,29 @@ class TetrisGame:
     
     def get_piece_blocks(self, piece):
         """조각의 블록 위치 반환"""
-        shape = piece['shape']
-        rotation = piece['rotation']
-        template = TETROMINOES[shape][rotation % len(TETROMINOES[shape])]
-        
-        blocks = []
-        for y, row in enumerate(template):
-            for x, cell in enumerate(row):
-                if cell == '#':
-                    blocks.append((piece['x'] + x, piece['y'] + y))
-        return blocks
+        rotations = PIECE_CELLS[piece['shape']]
+        px = piece['x']
+        py = piece['y']
+        return [(px + x, py + y) for x, y in rotations[piece['rotation'] % len(rotations)]]
     
     def is_valid_position(self, piece, dx=0, dy=0, rotation=None):
         """조각이 유효한 위치에 있는지 확인"""
         if rotation is None:
             rotation = piece['rotation']
         
-        test_piece = {
-            'shape': piece['shape'],
-            'rotation': rotation,
-            'x': piece['x'] + dx,
-            'y': piece['y'] + dy
-        }
+        shape = piece['shape']
+        rotation %= len(PIECE_CELLS[shape])
+        px = piece['x'] + dx
+        py = piece['y'] + dy
         
-        blocks = self.get_piece_blocks(test_piece)
+        # 경계 상자로 벽/바닥 충돌을 먼저 확인
+        min_x, _, max_x, max_y = PIECE_BOUNDS[shape][rotation]
+        if px + min_x < 0 or px + max_x >= self.width or py + max_y >= self.height:
+            return False
         
-        for x, y in blocks:
-            if x < 0 or x >= self.width or y >= self.height:
-                return False
-            if y >= 0 and self.board[y][x] != 0:
+        board = self.board
+        for x, y in PIECE_CELLS[shape][rotation]:
+            if py + y >= 0 and board[py + y][px + x] != 0:
                 return False
         
         return True
@@ -190,11 +241,13 @@ class TetrisGame:
     def place_piece(self, piece):
         """조각을 보드에 고정"""
         blocks = self.get_piece_blocks(piece)
-        shape_num = list(TETROMINOES.keys()).index(piece['shape']) + 1
+        shape_num = SHAPE_IDS[piece['shape']]
         
         for x, y in blocks:
             if y >= 0:
                 self.board[y][x] = shape_num
+                if y < self.column_tops[x]:
+                    self.column_tops[x] = y
         
         # 라인 제거 체크
         self.clear_lines()
@@ -215,24 +268,41 @@ class TetrisGame:
             if all(self.board[y][x] != 0 for x in range(self.width)):
                 lines_to_clear.append(y)
         
-        # 라인 제거
-        for y in sorted(lines_to_clear, reverse=True):
-            del self.board[y]
-            self.board.insert(0, [0 for _ in range(self.width)])
+        # 라인 제거 (삭제 중 인덱스가 밀리지 않도록 남은 행으로 새 보드 구성)
+        if lines_to_clear:
+            kept = [row for y, row in enumerate(self.board) if y not in lines_to_clear]
+            self.board = [[0 for _ in range(self.width)] for _ in lines_to_clear] + kept
+            self.recompute_column_tops()
         
         # 점수 계산
-        if lines_to_clear:
-            self.lines_cleared += len(lines_to_clear)
-            
-            # 점수 계산 (테트리스 표준)
-            line_scores = {1: 100, 2: 300, 3: 500, 4: 800}
-            self.score += line_scores.get(len(lines_to_clear), 800) * self.level
-            
-            # 레벨 업 (10라인마다)
-            new_level = (self.lines_cleared // 10) + 1
-            if new_level > self.level:
-                self.level = new_level
-                self.fall_speed = max(50, 500 - (self.level - 1) * 50)
+        self.add_cleared_lines(len(lines_to_clear))
+    
+    def recompute_column_tops(self):
+        """라인 제거 후 열별 가장 위 블록 위치 다시 계산"""
+        tops = [self.height] * self.width
+        for y in range(self.height - 1, -1, -1):
+            row = self.board[y]
+            for x in range(self.width):
+                if row[x]:
+                    tops[x] = y
+        self.column_tops = tops
+    
+    def add_cleared_lines(self, count):
+        """제거한 라인 수만큼 점수/레벨 반영"""
+        if not count:
+            return
+        
+        self.lines_cleared += count
+        
+        # 점수 계산 (테트리스 표준)
+        line_scores = {1: 100, 2: 300, 3: 500, 4: 800}
+        self.score += line_scores.get(count, 800) * self.level
+        
+        # 레벨 업 (10라인마다)
+        new_level = (self.lines_cleared // 10) + 1
+        if new_level > self.level:
+            self.level = new_level
+            self.fall_speed = max(50, 500 - (self.level - 1) * 50)
     
     def move_piece(self, dx, dy):
         """조각 이동"""
@@ -254,7 +324,7 @@ class TetrisGame:
         if self.game_over or self.paused:
             return False
         
-        new_rotation = (self.current_piece['rotation'] + 1) % len(TETROMINOES[self.current_piece['shape']])
+        new_rotation = (self.current_piece['rotation'] + 1) % len(PIECE_CELLS[self.current_piece['shape']])
         
         if self.is_valid_position(self.current_piece, rotation=new_rotation):
             self.current_piece['rotation'] = new_rotation
@@ -267,13 +337,75 @@ class TetrisGame:
         if self.game_over or self.paused:
             return False
         
-        while self.is_valid_position(self.current_piece, 0, 1):
-            self.current_piece['y'] += 1
-            self.score += 2  # 하드 드롭 보너스
+        distance = self.get_drop_distance(self.current_piece)
+        self.current_piece['y'] += distance
+        self.score += 2 * distance  # 하드 드롭 보너스
         
         self.place_piece(self.current_piece)
         return True
     
+    def get_drop_distance(self, piece):
+        """조각이 바닥/블록에 닿을 때까지 내려갈 수 있는 행 수
+
+        조각 바닥 윤곽과 열별 가장 위 블록 위치만 비교 (최대 4열).
+        조각이 어떤 열의 가장 위 블록보다 아래에 있으면 (돌출부 밑으로 밀어 넣은 경우) 한 칸씩 검사
+        """
+        shape = piece['shape']
+        rotations = PIECE_BOTTOMS[shape]
+        px = piece['x']
+        py = piece['y']
+        tops = self.column_tops
+        
+        distance = self.height
+        for x, bottom in rotations[piece['rotation'] % len(rotations)]:
+            gap = tops[px + x] - 1 - (py + bottom)
+            if gap < 0:
+                return self.scan_drop_distance(piece)
+            if gap < distance:
+                distance = gap
+        return distance
+    
+    def scan_drop_distance(self, piece):
+        """충돌 검사를 한 칸씩 반복해 낙하 거리 계산"""
+        distance = 0
+        while self.is_valid_position(piece, 0, distance + 1):
+            distance += 1
+        return distance
+    
+    def apply_gravity(self, now=None):
+        """경과 시간만큼 자동 낙하 적용 (틱이 늦어져도 밀린 행을 한 번에 처리). 낙하한 행 수 반환"""
+        if now is None:
+            now = time.monotonic()
+        if self.game_over or self.paused:
+            self.last_fall_at = now
+            return 0
+        
+        # 오래 멈춰 있었다면 보드 높이만큼만 처리하고 남은 지연은 버림
+        interval = self.fall_speed / 1000.0
+        if now - self.last_fall_at >= interval * self.height:
+            self.last_fall_at = now - interval * self.height
+        
+        rows = 0
+        while not self.game_over:
+            # 레벨 업으로 낙하 속도가 바뀌면 다음 행부터 새 속도 적용
+            interval = self.fall_speed / 1000.0
+            if now - self.last_fall_at < interval:
+                break
+            self.last_fall_at += interval
+            self.move_piece(0, 1)
+            rows += 1
+        return rows
+    
+    def time_until_next_fall(self, now=None):
+        """다음 자동 낙하까지 남은 시간 (초)"""
+        if now is None:
+            now = time.monotonic()
+        return max(0.0, self.last_fall_at + self.fall_speed / 1000.0 - now)
+    
+    def reset_gravity(self, now=None):
+        """자동 낙하 기준 시각 초기화 (게임 시작/일시정지 해제 시)"""
+        self.last_fall_at = time.monotonic() if now is None else now
+    
     def get_play_time(self):
         """플레이 시간 계산 (초 단위)"""
         if hasattr(self, 'start_time'):
@@ -285,82 +417,203 @@ class TetrisGame:
         # 보드 복사
         display_board = [row[:] for row in self.board]
         
-        # 현재 조각 표시
+        # 현재 조각과 착지 위치(고스트) 표시
         if not self.game_over:
+            ghost = dict(self.current_piece)
+            ghost['y'] += self.get_drop_distance(self.current_piece)
+            for x, y in self.get_piece_blocks(ghost):
+                if 0 <= x < self.width and 0 <= y < self.height and display_board[y][x] == 0:
+                    display_board[y][x] = GHOST_CELL
+            
             blocks = self.get_piece_blocks(self.current_piece)
-            shape_num = list(TETROMINOES.keys()).index(self.current_piece['shape']) + 1
+            shape_num = SHAPE_IDS[self.current_piece['shape']]
             
             for x, y in blocks:
                 if 0 <= x < self.width and 0 <= y < self.height:
                     display_board[y][x] = shape_num
         
         # 이모지로 변환
-        emoji_map = {
-            0: '⬛',  # 빈 공간
-            1: '🟦',  # I 조각 (파랑)
-            2: '🟨',  # O 조각 (노랑)
-            3: '🟪',  # T 조각 (보라)
-            4: '🟩',  # S 조각 (초록)
-            5: '🟥',  # Z 조각 (빨강)
-            6: '🟫',  # J 조각 (갈색)
-            7: '🟧'   # L 조각 (주황)
-        }
-        
         lines = []
         for row in display_board:
-            line = ''.join(emoji_map.get(cell, '⬜') for cell in row)
+            line = ''.join(CELL_EMOJIS.get(cell, '⬜') for cell in row)
             lines.append(line)
         
         return '\n'.join(lines)
 
+# 비트보드 엔진: 행 하나를 정수 비트마스크로 표현 (x번째 칸 = BITBOARD_PAD + x번째 비트)
+# 좌우 여백 비트를 벽으로 채워 두면 경계 검사도 AND 한 번으로 처리됨
+BITBOARD_PAD = 4
+
+def compile_bitboard_shapes():
+    """조각/회전별 (템플릿 행 오프셋, 행 비트마스크) 목록을 블록 오프셋 표에서 계산"""
+    shapes = {}
+    for shape, rotations in PIECE_CELLS.items():
+        compiled = []
+        for offsets in rotations:
+            masks = {}
+            for x, y in offsets:
+                masks[y] = masks.get(y, 0) | 1 << (BITBOARD_PAD + x)
+            compiled.append(tuple(sorted(masks.items())))
+        shapes[shape] = tuple(compiled)
+    return shapes
+
+BITBOARD_SHAPES = compile_bitboard_shapes()
+
+class BitboardTetrisGame(TetrisGame):
+    """비트보드 테트리스 게임 로직 (TetrisGame과 같은 API)
+
+    충돌 검사는 시프트 + AND, 라인 완성 검사는 가득 찬 행 마스크와의 비교로 처리.
+    self.board(색상 정보)는 화면 표시용으로 함께 유지
+    """
+    
+    def __init__(self, width=10, height=20):
+        total_bits = width + BITBOARD_PAD * 2
+        self.wall_row = ((1 << total_bits) - 1) ^ (((1 << width) - 1) << BITBOARD_PAD)
+        self.full_row = (1 << total_bits) - 1
+        self.rows = [self.wall_row] * height
+        super().__init__(width, height)
+    
+    def is_valid_position(self, piece, dx=0, dy=0, rotation=None):
+        """조각이 유효한 위치에 있는지 확인 (행 비트마스크 AND)"""
+        if rotation is None:
+            rotation = piece['rotation']
+        
+        rotations = BITBOARD_SHAPES[piece['shape']]
+        x = piece['x'] + dx
+        y = piece['y'] + dy
+        rows = self.rows
+        
+        for row_offset, mask in rotations[rotation % len(rotations)]:
+            row = y + row_offset
+            if row >= self.height:
+                return False
+            board_row = rows[row] if row >= 0 else self.wall_row
+            if board_row & (mask << x if x >= 0 else mask >> -x):
+                return False
+        
+        return True
+    
+    def place_piece(self, piece):
+        """조각을 보드에 고정"""
+        rotations = BITBOARD_SHAPES[piece['shape']]
+        shape_num = SHAPE_IDS[piece['shape']]
+        x = piece['x']
+        
+        for row_offset, mask in rotations[piece['rotation'] % len(rotations)]:
+            row = piece['y'] + row_offset
+            if row < 0:
+                continue
+            shifted = mask << x if x >= 0 else mask >> -x
+            self.rows[row] |= shifted
+            
+            # 표시용 색상 / 열 높이 기록
+            bits = shifted >> BITBOARD_PAD
+            board_row = self.board[row]
+            tops = self.column_tops
+            while bits:
+                low = bits & -bits
+                column = low.bit_length() - 1
+                board_row[column] = shape_num
+                if row < tops[column]:
+                    tops[column] = row
+                bits ^= low
+        
+        self.clear_lines()
+        
+        self.current_piece = self.next_piece
+        self.next_piece = self.get_new_piece()
+        
+        if not self.is_valid_position(self.current_piece):
+            self.game_over = True
+    
+    def clear_lines(self):
+        """완성된 라인 제거 (가득 찬 행 마스크와 비교)"""
+        full_row = self.full_row
+        kept = [y for y, row in enumerate(self.rows) if row != full_row]
+        cleared = self.height - len(kept)
+        if not cleared:
+            return
+        
+        self.rows = [self.wall_row] * cleared + [self.rows[y] for y in kept]
+        self.board = [[0] * self.width for _ in range(cleared)] + [self.board[y] for y in kept]
+        self.recompute_column_tops()
+        self.add_cleared_lines(cleared)
+
+# 게임 엔진 선택 (bitboard: 비트보드, list: 기존 2차원 리스트)
+TETRIS_ENGINES = {
+    'bitboard': BitboardTetrisGame,
+    'list': TetrisGame,
+}
+TETRIS_ENGINE = os.getenv('TETRIS_ENGINE', 'bitboard').strip().lower()
+if TETRIS_ENGINE not in TETRIS_ENGINES:
+    print(f"⚠️ 알 수 없는 TETRIS_ENGINE 값 '{TETRIS_ENGINE}' → bitboard 사용")
+    TETRIS_ENGINE = 'bitboard'
+
+def create_tetris_game():
+    """설정된 엔진으로 새 게임 생성"""
+    return TETRIS_ENGINES[TETRIS_ENGINE]()
+
+# 모든 테트리스 게임의 자동 낙하를 처리하는 공유 시계
+tetris_clock = GameClock("테트리스")
+
+# 게임별 화면 수정 간격 (초). 수정 지연/속도 제한에 따라 최소~최대 사이에서 자동 조절
+TETRIS_FRAME_INTERVAL = float(os.getenv('TETRIS_FRAME_INTERVAL', '1.0'))
+TETRIS_FRAME_MAX_INTERVAL = float(os.getenv('TETRIS_FRAME_MAX_INTERVAL', '5.0'))
+tetris_frame_stats = FrameStats()
+
 class TetrisView(discord.ui.View):
     """테트리스 게임 UI"""
     
     def __init__(self, user_id: int, record_callback=None):
         super().__init__(timeout=300)  # 5분 타임아웃
-        self.game = TetrisGame()
+        self.game = create_tetris_game()
         self.user_id = user_id
         self.message = None
-        self.auto_fall_task = None
         self.record_callback = record_callback  # 기록 저장 콜백 함수
+        self.render_key = ('tetris', id(self))  # 화면 변경 비교용 키
+        self.frames = FrameRenderer(
+            self.update_display,
+            min_interval=TETRIS_FRAME_INTERVAL,
+            max_interval=max(TETRIS_FRAME_INTERVAL, TETRIS_FRAME_MAX_INTERVAL),
+            stats=tetris_frame_stats,
+            name="테트리스 화면"
+        )
         
         # 자동 낙하 시작
         self.start_auto_fall()
     
     def start_auto_fall(self):
-        """자동 낙하 시작"""
-        if self.auto_fall_task is None or self.auto_fall_task.done():
-            self.auto_fall_task = asyncio.create_task(self.auto_fall_loop())
+        """자동 낙하 시작 (공유 시계에 등록)"""
+        self.game.reset_gravity()
+        tetris_clock.add(self.render_key, self.fall_step, self.render_fall, self.game.time_until_next_fall())
     
-    async def auto_fall_loop(self):
-        """자동 낙하 루프"""
-        while not self.game.game_over and not self.game.paused:
-            try:
-                await asyncio.sleep(self.game.fall_speed / 1000.0)
-                
-                if not self.game.paused and not self.game.game_over:
-                    moved = self.game.move_piece(0, 1)  # 아래로 이동
-                    
-                    if moved and self.message and not self.game.game_over:
-                        try:
-                            embed = self.create_embed()
-                            await self.message.edit(embed=embed, view=self)
-                        except (discord.NotFound, discord.HTTPException):
-                            break
-                    elif self.game.game_over:
-                        await self.handle_game_over()
-                        break
-                        
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"❌ 자동 낙하 오류: {e}")
-                break
+    def stop_auto_fall(self):
+        """자동 낙하/화면 전송 중지 (공유 시계에서 제거)"""
+        tetris_clock.remove(self.render_key)
+        self.frames.close()
+    
+    def fall_step(self, now):
+        """시계 틱 (논리 진행만, 화면 전송과 분리): 경과 시간만큼 낙하.
+        (다음 낙하까지 남은 초 또는 None, 화면 변경 여부) 반환"""
+        if self.game.game_over or self.game.paused:
+            return None, False
+        
+        rows = self.game.apply_gravity(now)
+        if self.game.game_over:
+            return None, True
+        return self.game.time_until_next_fall(now), rows > 0
+    
+    async def render_fall(self):
+        """시계 틱 이후 화면 갱신 요청 (게임 오버면 종료 처리)"""
+        if self.game.game_over:
+            await self.handle_game_over()
+            return
+        self.frames.request()
     
     async def handle_game_over(self):
         """게임 오버 처리"""
-        if self.auto_fall_task:
-            self.auto_fall_task.cancel()
+        self.stop_auto_fall()
+        render_differ.forget(self.render_key)
         
         # 게임 기록 저장
         try:
@@ -474,10 +727,7 @@ class TetrisView(discord.ui.View):
         
         # 다음 조각 정보
         next_shape = self.game.next_piece['shape']
-        next_emoji = {
-            'I': '🟦', 'O': '🟨', 'T': '🟪', 'S': '🟩',
-            'Z': '🟥', 'J': '🟫', 'L': '🟧'
-        }.get(next_shape, '⬜')
+        next_emoji = SHAPE_EMOJIS.get(next_shape, '⬜')
         
         embed.add_field(
             name="다음 조각",
@@ -505,13 +755,48 @@ class TetrisView(discord.ui.View):
         return embed
     
     async def update_display(self):
-        """화면 업데이트"""
+        """화면 업데이트 (표시 내용이 바뀐 경우만). 화면 전송기가 전송 시점의 최신 상태로 호출"""
         if self.message and not self.game.game_over:
             embed = self.create_embed()
+            if not render_differ.changed(self.render_key, embed, self):
+                return
             try:
                 await self.message.edit(embed=embed, view=self)
-            except (discord.NotFound, discord.HTTPException):
-                pass
+            except discord.NotFound:
+                render_differ.forget(self.render_key)
+                self.stop_auto_fall()
+            except discord.HTTPException as e:
+                render_differ.forget(self.render_key)
+                if e.status == 429:
+                    raise  # 라이브러리가 재시도를 포기한 경우에만 도달. 화면 전송기가 간격을 늘리고 다시 시도
+            except BaseException:
+                # RateLimited, 취소 등: 지문을 지워 다음 프레임이 생략되지 않도록 처리
+                render_differ.forget(self.render_key)
+                raise
+    
+    async def respond_with_frame(self, interaction: discord.Interaction):
+        """버튼 응답: 전송 중인 화면이 없으면 응답으로 바로 수정, 있으면 최신 프레임을 전송기에 맡김"""
+        if not self.frames.begin_external():
+            # 진행 중인 메시지 수정보다 먼저 도착해 이전 화면으로 덮이지 않도록 전송기 순서를 따름
+            await interaction.response.defer()
+            self.frames.request()
+            return
+        
+        sent = False
+        try:
+            embed = self.create_embed()
+            if render_differ.changed(self.render_key, embed, self):
+                try:
+                    await interaction.response.edit_message(embed=embed, view=self)
+                except Exception:
+                    # 지문을 지워 다음 프레임이 같은 내용이라도 다시 전송되도록 처리
+                    render_differ.forget(self.render_key)
+                    raise
+                sent = True
+            else:
+                await interaction.response.defer()
+        finally:
+            self.frames.end_external(sent)
     
     # 컨트롤 버튼들
     @discord.ui.button(label='⬅️', style=discord.ButtonStyle.secondary, row=0)
@@ -521,8 +806,7 @@ class TetrisView(discord.ui.View):
             return
         
         self.game.move_piece(-1, 0)
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.respond_with_frame(interaction)
     
     @discord.ui.button(label='🔄', style=discord.ButtonStyle.secondary, row=0)
     async def rotate(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -531,8 +815,7 @@ class TetrisView(discord.ui.View):
             return
         
         self.game.rotate_piece()
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.respond_with_frame(interaction)
     
     @discord.ui.button(label='➡️', style=discord.ButtonStyle.secondary, row=0)
     async def move_right(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -541,8 +824,7 @@ class TetrisView(discord.ui.View):
             return
         
         self.game.move_piece(1, 0)
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.respond_with_frame(interaction)
     
     @discord.ui.button(label='⬇️', style=discord.ButtonStyle.secondary, row=1)
     async def soft_drop(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -554,8 +836,7 @@ class TetrisView(discord.ui.View):
         if moved:
             self.game.score += 1  # 소프트 드롭 보너스
         
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.respond_with_frame(interaction)
         
         if self.game.game_over:
             await self.handle_game_over()
@@ -567,8 +848,7 @@ class TetrisView(discord.ui.View):
             return
         
         self.game.hard_drop()
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.respond_with_frame(interaction)
         
         if self.game.game_over:
             await self.handle_game_over()
@@ -584,8 +864,7 @@ class TetrisView(discord.ui.View):
         if not self.game.paused:
             self.start_auto_fall()  # 일시정지 해제 시 자동 낙하 재시작
         
-        embed = self.create_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.respond_with_frame(interaction)
     
     @discord.ui.button(label='❌', style=discord.ButtonStyle.danger, row=2)
     async def quit_game(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -593,8 +872,8 @@ class TetrisView(discord.ui.View):
             await interaction.response.send_message("❌ 다른 사람의 게임입니다!", ephemeral=True)
             return
             
-        if self.auto_fall_task:
-            self.auto_fall_task.cancel()
+        self.stop_auto_fall()
+        render_differ.forget(self.render_key)
         
         # 게임 기록 저장
         try:
@@ -630,8 +909,8 @@ class TetrisView(discord.ui.View):
     
     async def on_timeout(self):
         """타임아웃 시 게임 종료"""
-        if self.auto_fall_task:
-            self.auto_fall_task.cancel()
+        self.stop_auto_fall()
+        render_differ.forget(self.render_key)
         
         # 게임 기록 저장 (타임아웃)
         try:
@@ -685,4 +964,106 @@ async def start_tetris_game(interaction: discord.Interaction, record_callback=No
 # 게임 현황 확인 함수 (단순화됨)
 def get_game_status():
     """현재 테트리스 게임 진행 상황 (단순 메시지)"""
-    return "🎯 테트리스 게임은 /테트리스 명령어로 시작할 수 있습니다!"
\ No newline at end of file
+    return "🎯 테트리스 게임은 /테트리스 명령어로 시작할 수 있습니다!"
+
+if __name__ == "__main__":
+    # 조작 번호: 0 왼쪽, 1 오른쪽, 2 회전, 3 한 칸 아래, 4 하드 드롭
+    def bind_actions(game):
+        return [
+            lambda: game.move_piece(-1, 0),
+            lambda: game.move_piece(1, 0),
+            game.rotate_piece,
+            lambda: game.move_piece(0, 1),
+            game.hard_drop,
+        ]
+    
+    def evaluate_board(board, width):
+        """착지 후 보드 평가 (높이 합·구멍·울퉁불퉁함은 낮을수록, 제거 라인은 많을수록 좋음)"""
+        full = [y for y, row in enumerate(board) if all(row)]
+        rows = [row for y, row in enumerate(board) if y not in full]
+        heights = []
+        holes = 0
+        for x in range(width):
+            top = next((y for y, row in enumerate(rows) if row[x]), len(rows))
+            heights.append(len(rows) - top)
+            holes += sum(1 for row in rows[top:] if not row[x])
+        bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+        return 0.76 * len(full) - 0.51 * sum(heights) - 0.36 * holes - 0.18 * bumpiness
+    
+    def plan_piece(game):
+        """현재 조각을 가장 좋은 위치에 놓는 조작 순서 (회전 → 좌우 이동 → 아래 이동 → 하드 드롭)"""
+        piece = game.current_piece
+        best_score, best_actions = None, [4]
+        rotated = dict(piece)
+        for turns in range(len(PIECE_CELLS[piece['shape']])):
+            if turns:
+                rotation = (rotated['rotation'] + 1) % len(PIECE_CELLS[piece['shape']])
+                if not game.is_valid_position(rotated, rotation=rotation):
+                    break
+                rotated['rotation'] = rotation
+            for direction, action in ((-1, 0), (1, 1)):
+                target = dict(rotated)
+                steps = 0
+                while True:
+                    if direction < 0 or steps > 0:
+                        landed = dict(target)
+                        distance = game.scan_drop_distance(landed)
+                        landed['y'] += distance
+                        board = [row[:] for row in game.board]
+                        for x, y in game.get_piece_blocks(landed):
+                            if y >= 0:
+                                board[y][x] = 1
+                        score = evaluate_board(board, game.width)
+                        if best_score is None or score > best_score:
+                            best_score = score
+                            best_actions = [2] * turns + [action] * steps + [3] * min(distance, 2) + [4]
+                    if not game.is_valid_position(target, direction, 0):
+                        break
+                    target['x'] += direction
+                    steps += 1
+        return best_actions
+    
+    def record_plan(seed, move_count):
+        """기존 엔진으로 탐욕 플레이를 한 판 진행하며 조작 순서 기록 (측정 시간에 포함하지 않음)"""
+        random.seed(seed)
+        game = TetrisGame()
+        actions = bind_actions(game)
+        plan = []
+        while len(plan) < move_count and not game.game_over:
+            for action_index in plan_piece(game):
+                actions[action_index]()
+                plan.append(action_index)
+        return plan, game
+    
+    def replay(engine, seed, plan, repeats):
+        """기록한 조작을 repeats판 반복 실행 (게임 생성은 측정 밖에서, 판마다 같은 조각 순서)"""
+        games = []
+        for _ in range(repeats):
+            random.seed(seed)
+            game = engine()
+            games.append((game, bind_actions(game), random.getstate()))
+        
+        started = time.perf_counter()
+        for game, actions, state in games:
+            random.setstate(state)
+            for action_index in plan:
+                actions[action_index]()
+        return [game for game, _, _ in games], time.perf_counter() - started
+    
+    seed = 7
+    repeats = 20
+    plan, reference = record_plan(seed, 100000)
+    results = {name: replay(engine, seed, plan, repeats) for name, engine in TETRIS_ENGINES.items()}
+    
+    move_count = len(plan) * repeats
+    print(f"📊 테트리스 엔진 비교: 탐욕 플레이 조작 {len(plan):,}회 × {repeats}판 "
+          f"(판당 라인 {reference.lines_cleared}개, 점수 {reference.score:,})")
+    for name, (games, elapsed) in results.items():
+        same = all(
+            game.board == reference.board and game.score == reference.score and game.lines_cleared == reference.lines_cleared
+            for game in games
+        )
+        print(f"   {name}: 초당 {move_count / elapsed:,.0f}회 ({elapsed * 1000:.0f}ms), 기록과 보드/점수 일치: {'✅' if same else '❌'}")
+    list_elapsed = results['list'][1]
+    bit_elapsed = results['bitboard'][1]
+    print(f"   속도 향상: {list_elapsed / max(bit_elapsed, 1e-9):.1f}배")
@@ -0,0 +1,91 @@
+"""
+타이머 스케줄러 모듈
+번호표별 태스크를 만들지 않고 하나의 태스크와 힙으로 모든 마감 타이머를 처리
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, List, Optional
+
+class TimerHandle:
+    """예약된 타이머 핸들 (cancel()로 취소)"""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+class TimerScheduler:
+    """단일 asyncio 태스크로 동작하는 마감 시각 힙 타이머"""
+
+    def __init__(self, name: str = "timer"):
+        self.name = name
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self):
+        return sum(1 for _, _, handle in self._heap if not handle.cancelled)
+
+    def call_later(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        """delay초 후 callback 실행 예약 (코루틴 함수도 가능)"""
+        return self.call_at(time.monotonic() + delay, callback, *args)
+
+    def call_at(self, deadline: float, callback: Callable, *args) -> TimerHandle:
+        """monotonic 기준 deadline 시각에 callback 실행 예약"""
+        handle = TimerHandle(deadline, callback, args)
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (deadline, next(self._seq), handle))
+        self._ensure_running()
+        if earliest is None or deadline < earliest:
+            self._wakeup.set()
+        return handle
+
+    def _ensure_running(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._heap:
+            deadline, _, handle = self._heap[0]
+            if handle.cancelled:
+                heapq.heappop(self._heap)
+                continue
+
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            try:
+                result = handle.callback(*handle.args)
+                # 코루틴 콜백은 다른 타이머를 막지 않도록 분리 실행
+                if asyncio.iscoroutine(result):
+                    asyncio.create_task(self._guard(result))
+            except Exception as e:
+                print(f"❌ {self.name} 타이머 콜백 오류: {e}")
+
+    async def _guard(self, coroutine):
+        try:
+            await coroutine
+        except Exception as e:
+            print(f"❌ {self.name} 타이머 콜백 오류: {e}")
@@ -0,0 +1,60 @@
+"""
+음성 채널 일괄 작업 모듈
+여러 사용자의 음성 연결 끊기/이동을 동시 실행 수를 제한해 병렬로 처리
+속도 제한(429)은 discord.py HTTP 클라이언트가 같은 버킷의 요청을 함께 대기시킨 뒤 재시도하므로 따로 처리하지 않음
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+class BulkOutcome:
+    """사용자 한 명의 작업 결과"""
+
+    __slots__ = ("key", "label", "ok", "detail")
+
+    def __init__(self, key, label: str, ok: bool, detail: str):
+        self.key = key
+        self.label = label
+        self.ok = ok
+        self.detail = detail
+
+class BulkReport:
+    """일괄 작업 결과 요약"""
+
+    def __init__(self, outcomes: List[BulkOutcome], wall_seconds: float):
+        self.outcomes = outcomes
+        self.wall_seconds = wall_seconds
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.outcomes) - self.succeeded
+
+class BulkVoiceRunner:
+    """동시 실행 수를 제한하는 일괄 작업 실행기"""
+
+    def __init__(self, concurrency: int = 5):
+        self.concurrency = max(1, concurrency)
+
+    async def run(self,
+                  targets: List[Tuple[object, str, object]],
+                  operation: Callable[[object], Awaitable[Optional[str]]],
+                  describe_error: Callable[[Exception], str] = str) -> BulkReport:
+        """targets: [(키, 표시 이름, 작업 대상)]. operation이 예외 없이 끝나면 성공 (반환 문자열은 상세 내용)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def worker(key, label, target):
+            async with semaphore:
+                try:
+                    detail = await operation(target)
+                    return BulkOutcome(key, label, True, detail or "완료")
+                except Exception as e:
+                    return BulkOutcome(key, label, False, describe_error(e))
+
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(*(worker(key, label, target) for key, label, target in targets))
+        return BulkReport(list(outcomes), time.perf_counter() - started)
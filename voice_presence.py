@@ -0,0 +1,75 @@
+"""
+음성 채널 접속 현황 모듈
+on_voice_state_update 이벤트로 사용자별 접속 음성 채널을 메모리에 유지해
+번호표 보유자의 음성 채널 접속 여부를 API 호출 없이 O(1)로 확인
+"""
+
+from typing import Dict, Optional
+
+class VoicePresenceTracker:
+    """사용자 ID → {서버 ID: 음성 채널 ID} 접속 현황"""
+
+    def __init__(self):
+        self._presence: Dict[int, Dict[int, int]] = {}
+        self.events = 0
+
+    def __len__(self):
+        return len(self._presence)
+
+    def seed(self, guild) -> int:
+        """서버의 현재 음성 채널 접속자로 초기화 (준비 완료 시 한 번). 접속자 수 반환"""
+        self.forget_guild(guild.id)
+        count = 0
+        for channel in list(guild.voice_channels) + list(guild.stage_channels):
+            for user_id in channel.voice_states:
+                self._presence.setdefault(user_id, {})[guild.id] = channel.id
+                count += 1
+        return count
+
+    def forget_guild(self, guild_id: int):
+        """서버 퇴장 시 해당 서버의 접속 기록 제거"""
+        for guilds in self._presence.values():
+            guilds.pop(guild_id, None)
+        self._presence = {user_id: guilds for user_id, guilds in self._presence.items() if guilds}
+
+    def update(self, user_id: int, guild_id: int, channel_id: Optional[int]) -> Optional[int]:
+        """접속 채널 변경 반영 (channel_id가 None이면 퇴장). 이전 채널 ID 반환"""
+        self.events += 1
+        guilds = self._presence.get(user_id)
+        previous = guilds.get(guild_id) if guilds else None
+
+        if channel_id is None:
+            if guilds:
+                guilds.pop(guild_id, None)
+                if not guilds:
+                    del self._presence[user_id]
+        else:
+            self._presence.setdefault(user_id, {})[guild_id] = channel_id
+        return previous
+
+    def on_voice_state_update(self, member, before, after) -> bool:
+        """음성 상태 이벤트 반영. 접속 채널이 바뀌었으면 True (음소거 등은 False)"""
+        before_id = before.channel.id if before.channel else None
+        after_id = after.channel.id if after.channel else None
+        if before_id == after_id:
+            return False
+        self.update(member.id, member.guild.id, after_id)
+        return True
+
+    def is_in_voice(self, user_id: int, guild_id: Optional[int] = None) -> bool:
+        guilds = self._presence.get(user_id)
+        if not guilds:
+            return False
+        return guild_id is None or guild_id in guilds
+
+    def channel_id(self, user_id: int, guild_id: Optional[int] = None) -> Optional[int]:
+        """접속 중인 음성 채널 ID (서버 미지정 시 아무 서버나)"""
+        guilds = self._presence.get(user_id)
+        if not guilds:
+            return None
+        if guild_id is not None:
+            return guilds.get(guild_id)
+        return next(iter(guilds.values()))
+
+    def stats_text(self) -> str:
+        return f"접속 {len(self._presence)}명 (이벤트 {self.events}회)"